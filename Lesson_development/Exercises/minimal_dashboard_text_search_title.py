@@ -152,9 +152,14 @@ if selected_institution != "All":
     filtered_df = filtered_df[filtered_df["institution"] == selected_institution]
 
 if selected_start_date and selected_end_date:
+    # Compare datetime values directly: .dt.date would build a Python date per row.
+    # The bounds take the column's time zone ("...Z" dates parse as UTC).
+    tz = filtered_df["published_date"].dt.tz
+    start_ts = pd.Timestamp(selected_start_date, tz=tz)
+    end_ts = pd.Timestamp(selected_end_date, tz=tz) + pd.Timedelta(days=1)
     filtered_df = filtered_df[
-        (filtered_df["published_date"].dt.date >= selected_start_date)
-        & (filtered_df["published_date"].dt.date <= selected_end_date)
+        (filtered_df["published_date"] >= start_ts)
+        & (filtered_df["published_date"] < end_ts)
     ]
 
 # ============================================================
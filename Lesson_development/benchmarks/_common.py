@@ -0,0 +1,52 @@
+"""Shared helpers for the benchmark scripts (synthetic corpus, timing)."""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+# Benchmarks run as plain scripts; make the uc01 package importable.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+GROUP_IDS = list(range(28585, 28605))
+
+
+def synthetic_groups() -> List[Dict[str, Any]]:
+    return [{"id": gid, "name": f"Institution {gid - GROUP_IDS[0]}"} for gid in GROUP_IDS]
+
+
+def synthetic_articles(n: int, seed: int = 0, start: str = "2020-01-01", days: int = 2200) -> List[Dict[str, Any]]:
+    """n listing records shaped like /v2/articles, spread over `days` days."""
+    rng = np.random.default_rng(seed)
+    offsets = rng.integers(0, days, n)
+    seconds = rng.integers(0, 86400, n)
+    dates = np.datetime64(start, "s") + offsets.astype("timedelta64[D]") + seconds.astype("timedelta64[s]")
+    groups = rng.choice(GROUP_IDS, n)
+    words = np.array(["hydrology", "wind", "soil", "traffic", "delta", "climate", "bridge", "sensor"])
+    picks = rng.integers(0, len(words), (n, 2))
+    return [
+        {
+            "id": i,
+            "uuid": f"00000000-0000-4000-8000-{i:012d}",
+            "title": f"{words[picks[i, 0]].title()} {words[picks[i, 1]]} measurements {i}",
+            "doi": f"10.4121/{i}",
+            "url": f"https://data.4tu.nl/v2/articles/{i}",
+            "group_id": int(groups[i]),
+            "published_date": str(dates[i]),
+        }
+        for i in range(n)
+    ]
+
+
+def timeit(fn: Callable[[], Any], repeat: int = 5) -> float:
+    """Best wall time of `repeat` runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
@@ -0,0 +1,51 @@
+"""Publication-date chart: bars and payload per selected range, per day vs adaptive.
+
+    python benchmarks/bench_chart.py [rows]
+
+"per day" is what the chart drew before (one bar per distinct day); "auto" is
+the resolution pick_resolution chooses for the range with the default point
+budget. Payload is the Arrow IPC size of the frame handed to st.bar_chart.
+"""
+
+from __future__ import annotations
+
+import sys
+
+import pandas as pd
+import pyarrow as pa
+from _common import synthetic_articles, synthetic_groups, timeit
+
+from uc01.config import CHART_POINTS
+from uc01.transform import bucket_counts, build_group_map, counts_per_day, pick_resolution, to_dataframe
+
+RANGES_DAYS = [30, 180, 365, 3 * 365, 6 * 365]
+
+
+def payload_kib(counts: pd.Series) -> float:
+    table = pa.Table.from_pandas(counts.reset_index())
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size / 1024
+
+
+def main(n: int) -> None:
+    df = to_dataframe(synthetic_articles(n, days=6 * 365), build_group_map(synthetic_groups()))
+    dates = df["published_date"]
+    first = dates.min().normalize()
+    print(f"{n} rows, point budget {CHART_POINTS}")
+    print(f"{'range':>7} {'day bars':>9} {'day KiB':>8}  {'auto':<8} {'bars':>5} {'KiB':>6} {'bucket':>8}")
+    for span in RANGES_DAYS:
+        window = dates[(dates >= first) & (dates < first + pd.Timedelta(days=span))]
+        day_counts = counts_per_day(window)
+        resolution = pick_resolution(first.date(), (first + pd.Timedelta(days=span - 1)).date(), CHART_POINTS)
+        bucketed = bucket_counts(day_counts, resolution)
+        print(
+            f"{span:>6}d {len(day_counts):>9} {payload_kib(day_counts):>8.1f}  "
+            f"{resolution:<8} {len(bucketed):>5} {payload_kib(bucketed):>6.1f} "
+            f"{timeit(lambda: bucket_counts(day_counts, resolution)):>6.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
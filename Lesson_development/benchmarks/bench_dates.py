@@ -0,0 +1,45 @@
+"""Date filter and daily bucketing: per-row .dt.date vs datetime64 arrays.
+
+    python benchmarks/bench_dates.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+
+from _common import synthetic_articles, synthetic_groups, timeit
+
+from uc01.transform import build_group_map, counts_per_day, published_between, to_dataframe
+
+START, END = date(2021, 3, 1), date(2023, 9, 30)
+
+
+def old_filter(df):
+    return df[(df["published_date"].dt.date >= START) & (df["published_date"].dt.date <= END)]
+
+
+def old_daily(df):
+    days = df.dropna(subset=["published_date"]).copy()
+    days["published_day"] = days["published_date"].dt.date
+    return days["published_day"].value_counts().sort_index()
+
+
+def main(sizes):
+    group_map = build_group_map(synthetic_groups())
+    print(f"{'rows':>9} {'filter .dt.date':>16} {'searchsorted':>13} {'daily .dt.date':>15} {'bincount':>9}")
+    for n in sizes:
+        df = to_dataframe(synthetic_articles(n), group_map)
+        assert len(old_filter(df)) == len(published_between(df, START, END))
+        assert old_daily(df).sum() == counts_per_day(df["published_date"]).sum()
+        print(
+            f"{n:>9} "
+            f"{timeit(lambda: old_filter(df)):>14.1f}ms "
+            f"{timeit(lambda: published_between(df, START, END)):>11.2f}ms "
+            f"{timeit(lambda: old_daily(df)):>13.1f}ms "
+            f"{timeit(lambda: counts_per_day(df['published_date'])):>7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
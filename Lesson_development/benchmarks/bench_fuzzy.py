@@ -0,0 +1,42 @@
+"""Typo-tolerant title search: trigram index build time and query latency.
+
+    python benchmarks/bench_fuzzy.py [rows ...]
+
+Queries are misspelled on purpose; the substring column is the existing exact
+keyword filter for comparison (it finds nothing for a typo).
+"""
+
+from __future__ import annotations
+
+import sys
+
+from _common import synthetic_articles, synthetic_groups, timeit
+
+from uc01.fuzzy import TrigramIndex
+from uc01.transform import build_group_map, to_dataframe
+
+QUERIES = ["hydrolgy", "wind mesurements", "climat bridge sensr", "traffic 4242"]
+
+
+def main(sizes):
+    group_map = build_group_map(synthetic_groups())
+    print(f"{'rows':>9} {'build':>9} {'index MiB':>10}  {'query':<22} {'substring':>10} {'trigram':>8} {'hits':>7}")
+    for n in sizes:
+        titles = to_dataframe(synthetic_articles(n), group_map)["title"]
+        build_ms = timeit(lambda: TrigramIndex(titles), repeat=1)
+        index = TrigramIndex(titles)
+        for i, q in enumerate(QUERIES):
+            rows, _ = index.search(q)
+            print(
+                f"{n if i == 0 else '':>9} "
+                f"{f'{build_ms:.0f}ms' if i == 0 else '':>9} "
+                f"{f'{index.nbytes / 2**20:.1f}' if i == 0 else '':>10}  "
+                f"{q:<22} "
+                f"{timeit(lambda: titles.str.contains(q, case=False, na=False)):>8.1f}ms "
+                f"{timeit(lambda: index.search(q)):>6.1f}ms "
+                f"{len(rows):>7}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,211 @@
+"""HTTP/1.1 vs HTTP/2 (FOURTU_HTTP2=1) for the async client, against local servers.
+
+    python benchmarks/bench_http2.py [--articles 20000] [--page-size 1000] [--latency 0.02] [--details 400]
+
+Both servers answer from the same synthetic corpus with the same added
+per-request latency and gzip-compressed bodies: mock_api.MockAPI for
+HTTP/1.1, and a small cleartext HTTP/2 server (h2c, prior knowledge) around
+its respond() for HTTP/2. uc01 reads FOURTU_BASE_URL and FOURTU_HTTP2 at
+import, so every mode runs the existing fetch functions in a fresh process:
+
+    load     load_item_types_frame for item types 3 and 9 (groups + all pages)
+    details  fetch_details_async for N articles (the "Add article details" path)
+
+and reports their wall time and the TCP connections the server accepted.
+The two servers are built differently (a thread per connection vs one event
+loop), so part of the wall-time gap is server overhead; the connection count
+is the transport's own effect.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from mock_api import MockAPI
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+except ImportError:  # HTTP/2 is optional (pip install "httpx[http2]")
+    h2 = None
+
+
+class H2Server:
+    """MockAPI's responses over h2c on a background event loop; use as a context manager."""
+
+    def __init__(self, api: MockAPI, latency: float) -> None:
+        self.api = api
+        self.latency = latency
+        self.counts: Counter = Counter()
+        self.port = 0
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        server = self._loop.run_until_complete(self._loop.create_server(lambda: _H2Protocol(self), "127.0.0.1", 0))
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    def __enter__(self) -> "H2Server":
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+
+class _H2Protocol(asyncio.Protocol):
+    def __init__(self, server: H2Server) -> None:
+        self.server = server
+        self.conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.pending: Dict[int, bytes] = {}
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self.server.counts["connections"] += 1
+        self.transport = transport
+        self.conn.initiate_connection()
+        self.transport.write(self.conn.data_to_send())
+
+    def data_received(self, data: bytes) -> None:
+        for event in self.conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                asyncio.ensure_future(self.respond(event.stream_id, dict(event.headers)))
+            elif isinstance(event, h2.events.StreamReset):
+                self.pending.pop(event.stream_id, None)
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self.transport.close()
+        self.flush()
+
+    async def respond(self, stream_id: int, headers: Dict[str, str]) -> None:
+        if self.server.latency:
+            await asyncio.sleep(self.server.latency)
+        url = urlparse(headers[":path"])
+        endpoint, body = self.server.api.respond(url.path, {k: v[0] for k, v in parse_qs(url.query).items()})
+        self.server.counts[endpoint] += 1
+        if body is None:
+            self.conn.send_headers(stream_id, [(":status", "404")], end_stream=True)
+            self.flush()
+            return
+        payload = json.dumps(body).encode()
+        response = [(":status", "200"), ("content-type", "application/json")]
+        if "gzip" in headers.get("accept-encoding", ""):
+            payload = gzip.compress(payload, compresslevel=5)
+            response.append(("content-encoding", "gzip"))
+        self.conn.send_headers(stream_id, response + [("content-length", str(len(payload)))])
+        self.pending[stream_id] = payload
+        self.flush()
+
+    def flush(self) -> None:
+        """Send as much pending body data as the flow-control windows allow."""
+        for stream_id in list(self.pending):
+            data = self.pending[stream_id]
+            while data:
+                size = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size, len(data))
+                if size <= 0:
+                    break
+                self.conn.send_data(stream_id, data[:size])
+                data = data[size:]
+            if data:
+                self.pending[stream_id] = data
+            else:
+                self.conn.end_stream(stream_id)
+                del self.pending[stream_id]
+        self.transport.write(self.conn.data_to_send())
+
+
+def child(page_size: int, max_pages: int, details: int) -> None:
+    """Runs in a fresh process configured by the environment; prints timings as JSON."""
+    from uc01 import async_client
+    from uc01.enrich import DetailCache, fetch_details_async
+    from uc01.pipeline import load_item_types_frame
+
+    started = time.perf_counter()
+    df = load_item_types_frame(item_types=(3, 9), published_since="2000-01-01", page_size=page_size, max_pages=max_pages)
+    load_s = time.perf_counter() - started
+
+    keys = [(int(i), "") for i in df["id"].head(details)]
+    started = time.perf_counter()
+    asyncio.run(fetch_details_async(keys, max_parallel=int(os.environ["FOURTU_MAX_CONCURRENCY"]), cache=DetailCache()))
+    details_s = time.perf_counter() - started
+    http2 = async_client.HTTP2 and async_client.h2 is not None
+    print(json.dumps({"rows": len(df), "load_s": load_s, "details_s": details_s, "http2": http2}))
+
+
+def run_mode(url: str, http2: bool, args: argparse.Namespace) -> Dict[str, Any]:
+    env = dict(
+        os.environ,
+        FOURTU_BASE_URL=url,
+        FOURTU_HTTP2="1" if http2 else "",
+        FOURTU_RATE="100000",
+        FOURTU_BURST="100000",
+        FOURTU_MAX_CONCURRENCY=str(args.concurrency),
+    )
+    out = subprocess.run(
+        [sys.executable, __file__, "--child", "--page-size", str(args.page_size), "--details", str(args.details),
+         "--max-pages", str(args.max_pages)],
+        env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=20_000, help="records per item type")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--max-pages", type=int, default=20, help="the async client requests all of them")
+    parser.add_argument("--details", type=int, default=400, help="article detail lookups")
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added per request by the servers")
+    parser.add_argument("--concurrency", type=int, default=16, help="FOURTU_MAX_CONCURRENCY")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.page_size, args.max_pages, args.details)
+        return
+    if h2 is None:
+        print('skipped: the h2 package is not installed (pip install "httpx[http2]")')
+        return
+
+    print(f"{args.articles} articles per item type, {args.latency * 1000:.0f} ms latency, concurrency {args.concurrency}")
+    print(f"{'transport':<10} {'rows':>7} {'load':>8} {'details':>8} {'connections':>12}  requests")
+    with MockAPI(articles=args.articles, latency=args.latency) as api, H2Server(api, args.latency) as h2_server:
+        modes: List[Tuple[str, str, bool, Any]] = [
+            ("HTTP/1.1", api.url, False, api.requests),
+            ("HTTP/2", h2_server.url, True, lambda: dict(h2_server.counts)),
+        ]
+        for name, url, http2, counts in modes:
+            api.reset()
+            h2_server.counts.clear()
+            result = run_mode(url, http2, args)
+            if result["http2"] != http2:
+                raise SystemExit("h2 is not installed; HTTP/2 mode fell back to HTTP/1.1")
+            served = counts()
+            connections = served.pop("connections", 0)
+            print(
+                f"{name:<10} {result['rows']:>7} {result['load_s'] * 1000:>6.0f}ms {result['details_s'] * 1000:>6.0f}ms "
+                f"{connections:>12}  {' '.join(f'{k}={v}' for k, v in sorted(served.items()))}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
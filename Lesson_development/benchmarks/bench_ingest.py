@@ -0,0 +1,65 @@
+"""Peak Python memory: list + to_dataframe vs page-by-page Parquet ingestion.
+
+Pages are generated on the fly, so only the ingestion path itself is measured.
+tracemalloc sees Python objects only; Arrow's own buffers (one page at a time
+in the streamed path) are not included.
+
+    python benchmarks/bench_ingest.py [rows] [page_size]
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import pyarrow.parquet as pq
+from _common import synthetic_articles, synthetic_groups
+
+from uc01.ingest import ARTICLE_SCHEMA, page_to_batch
+from uc01.transform import build_group_map, to_dataframe
+
+
+def pages(n, page_size):
+    for offset in range(0, n, page_size):
+        yield synthetic_articles(min(page_size, n - offset), seed=offset)
+
+
+def in_memory(n, page_size, group_map):
+    articles = []
+    for page in pages(n, page_size):
+        articles.extend(page)
+    return len(to_dataframe(articles, group_map))
+
+
+def streamed(n, page_size, group_map, path):
+    rows = 0
+    with pq.ParquetWriter(path, ARTICLE_SCHEMA, compression="zstd") as writer:
+        for page in pages(n, page_size):
+            writer.write_batch(page_to_batch(page, group_map, 3))
+            rows += len(page)
+    return rows
+
+
+def peak_mib(fn, *args):
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(n, page_size):
+    group_map = build_group_map(synthetic_groups())
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "articles.parquet"
+        print(f"rows={n} page_size={page_size}")
+        print(f"  list + to_dataframe : {peak_mib(in_memory, n, page_size, group_map):8.1f} MiB peak")
+        print(f"  streamed to Parquet : {peak_mib(streamed, n, page_size, group_map, path):8.1f} MiB peak")
+        print(f"  on disk             : {path.stat().st_size / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(args[0] if args else 200_000, args[1] if len(args) > 1 else 1000)
@@ -0,0 +1,81 @@
+"""Output cost of a rerun that leaves data and filters unchanged.
+
+    python benchmarks/bench_payloads.py [rows]
+
+Replays what the output section hands to Streamlit for a result set of
+`rows` rows, with Streamlit's own serialization functions, and reports the
+CPU time per rerun (time.process_time):
+
+    before  st.dataframe(pandas frame): pandas -> Arrow -> IPC bytes;
+            download_button(csv): st.cache_data hit (unpickle the CSV),
+            then the media file manager hashes it
+    eager   st.dataframe(cached pyarrow.Table, lazy=False): IPC bytes only;
+            download_button(callable): nothing until clicked
+    lazy    st.dataframe(cached pyarrow.Table, lazy=True), as the dashboard
+            calls it: only the first page of rows is written to IPC
+
+"first" is the rerun that builds the payloads, "repeat" every rerun after.
+Above 150,000 rows Streamlit already delivered a pandas frame lazily, but
+still converted all of it to Arrow on every rerun, which is most of "before".
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import sys
+import time
+from typing import Any, Callable
+
+from _common import synthetic_articles, synthetic_groups
+
+from streamlit import dataframe_util
+from streamlit.dataframe import lazy_df_source
+from uc01.cache_budget import CacheManager
+from uc01.payloads import PayloadCache, csv_bytes, display_frame
+from uc01.transform import build_group_map, to_dataframe
+
+
+def cpu_ms(fn: Callable[[], Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.process_time()
+        fn()
+        best = min(best, time.process_time() - started)
+    return best * 1000
+
+
+def main(n: int) -> None:
+    df = to_dataframe(synthetic_articles(n), build_group_map(synthetic_groups()))
+    key = ("version", "state")
+    pickled_csv = pickle.dumps(display_frame(df).to_csv(index=False))
+
+    def before_first() -> None:
+        dataframe_util.convert_pandas_df_to_arrow_bytes(display_frame(df))
+        csv = display_frame(df).to_csv(index=False)
+        hashlib.md5(csv.encode()).hexdigest()
+
+    def before_repeat() -> None:
+        dataframe_util.convert_pandas_df_to_arrow_bytes(display_frame(df))
+        hashlib.md5(pickle.loads(pickled_csv).encode()).hexdigest()
+
+    def eager(payloads: PayloadCache) -> None:
+        dataframe_util.convert_arrow_table_to_arrow_bytes(payloads.table(key, df))
+
+    def lazy(payloads: PayloadCache) -> None:
+        source = lazy_df_source.resolve_lazy_source(payloads.table(key, df), True, is_selection_activated=False)
+        page = source.load_rows(0, lazy_df_source.DEFAULT_PAGE_SIZE)
+        dataframe_util.convert_arrow_table_to_arrow_bytes(page)
+
+    print(f"{n} rows, CSV {len(csv_bytes(df)) / 2**20:.1f} MiB")
+    print(f"{'':<8} {'first':>9} {'repeat':>9}")
+    print(f"{'before':<8} {cpu_ms(before_first, 1):>7.1f}ms {cpu_ms(before_repeat):>7.1f}ms")
+    for name, render in [("eager", eager), ("lazy", lazy)]:
+        warm = PayloadCache(CacheManager(max_bytes=2**31))
+        first = cpu_ms(lambda: render(warm), 1)
+        print(f"{name:<8} {first:>7.1f}ms {cpu_ms(lambda: render(warm)):>7.1f}ms")
+    print(f"CSV on first click {cpu_ms(lambda: PayloadCache(CacheManager(max_bytes=2**31)).csv(key, df), 1):.1f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,76 @@
+"""Time-to-first-render: `streamlit run` vs the `python -m uc01.warmup` entry point.
+
+Both start the dashboard against benchmarks/mock_api.py. "server up" is the time
+from process start until Streamlit answers its health check; "first render" is
+the first visitor's wait, from opening the websocket to the script finishing.
+
+    python benchmarks/bench_startup.py [articles per item type]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+from load_test import APP, Session, free_port
+from mock_api import MockAPI
+
+STREAMLIT_ARGS = ["--server.headless", "true", "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false"]
+
+MODES = {
+    "streamlit run": lambda port: [sys.executable, "-m", "streamlit", "run", str(APP), *STREAMLIT_ARGS, "--server.port", str(port)],
+    "uc01.warmup": lambda port: [sys.executable, "-m", "uc01.warmup", "--", *STREAMLIT_ARGS, "--server.port", str(port)],
+}
+
+
+def wait_until_up(port: int, timeout: float = 120) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError("streamlit server did not start")
+
+
+async def first_render(port: int) -> float:
+    session = Session(f"ws://127.0.0.1:{port}/_stcore/stream")
+    started = time.perf_counter()
+    await session.connect()
+    await session.rerun()
+    elapsed = time.perf_counter() - started
+    await session.close()
+    return elapsed
+
+
+def main(articles: int) -> None:
+    print(f"{'mode':<15} {'server up':>10} {'first render':>13} {'upstream':>9}")
+    with MockAPI(articles=articles) as api:
+        for mode, command in MODES.items():
+            api.reset()
+            port = free_port()
+            started = time.perf_counter()
+            server = subprocess.Popen(
+                command(port),
+                cwd=APP.parent,
+                env=dict(os.environ, FOURTU_BASE_URL=api.url),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                wait_until_up(port)
+                up = time.perf_counter() - started
+                render = asyncio.run(first_render(port))
+                print(f"{mode:<15} {up:>9.2f}s {render * 1000:>11.0f}ms {sum(api.requests().values()):>9}", flush=True)
+            finally:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
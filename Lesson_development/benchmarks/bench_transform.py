@@ -0,0 +1,67 @@
+"""Transform stage: one core vs a pool of 1..N worker processes.
+
+    python benchmarks/bench_transform.py [records] [--page-size 10000] [--workers 1 2 4 8]
+
+The synthetic corpus is served as /v2/articles response bodies (JSON bytes)
+of page-size records, i.e. what the loader holds once the network phase is
+done. "serial" is the current path: json.loads every page, then
+to_dataframe over all records. "pool N" is UC01_TRANSFORM_WORKERS=N: the
+pages go through uc01.parallel.page_batch in N spawned workers and come
+back as Arrow IPC, then frame_from_batches assembles the frame; "assemble"
+is that last, single-core part. Worker start-up is excluded (the pool lives
+as long as the process). Scaling stops at the machine's core count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from _common import synthetic_articles, synthetic_groups
+
+from uc01.parallel import PageBatch, frame_from_batches, page_batch
+from uc01.transform import build_group_map, to_dataframe
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("records", nargs="?", type=int, default=1_000_000)
+    parser.add_argument("--page-size", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, nargs="+", help="pool sizes (default 1, 2, 4, ... up to the cores)")
+    args = parser.parse_args()
+    cores = os.cpu_count() or 1
+    sizes = args.workers or sorted({1, *(2**k for k in range(1, cores.bit_length()) if 2**k <= cores), cores})
+
+    group_map = build_group_map(synthetic_groups())
+    records = synthetic_articles(args.records)
+    bodies = [json.dumps(records[i : i + args.page_size]).encode() for i in range(0, len(records), args.page_size)]
+    del records
+    print(f"{args.records} records in {len(bodies)} pages ({sum(map(len, bodies)) / 2**20:.0f} MiB JSON), {cores} core(s)")
+
+    started = time.perf_counter()
+    expected = to_dataframe([a for body in bodies for a in json.loads(body)], group_map)
+    serial = time.perf_counter() - started
+    print(f"{'serial':<8} {serial:7.2f}s")
+
+    for n in sizes:
+        with ProcessPoolExecutor(n, mp_context=multiprocessing.get_context("spawn")) as pool:
+            list(pool.map(page_batch, [b"[]"] * n, [group_map] * n))  # start the workers
+            started = time.perf_counter()
+            batches = [PageBatch(rows, ipc, b"") for rows, ipc in pool.map(page_batch, bodies, [group_map] * len(bodies))]
+            transformed = time.perf_counter()
+            df = frame_from_batches(batches, group_map)
+            done = time.perf_counter()
+        pd.testing.assert_frame_equal(df, expected)
+        print(
+            f"pool {n:<3} {done - started:7.2f}s  (pages {transformed - started:.2f}s, assemble {done - transformed:.2f}s)"
+            f"  x{serial / (done - started):.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
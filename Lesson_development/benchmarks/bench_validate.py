@@ -0,0 +1,62 @@
+"""Overhead of the data-quality checks in to_dataframe.
+
+Reports to_dataframe without the checks (validate_frame stubbed out) and the
+checks alone on the same columns; whole-function timings are too noisy to
+subtract. The dirty corpus corrupts a share of the records (overlapping
+pages, bad dates, unknown and string group ids, missing DOIs) so every check
+has work to do.
+
+    python benchmarks/bench_validate.py [rows ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import warnings
+
+import pandas as pd
+from _common import synthetic_articles, synthetic_groups, timeit
+
+import uc01.transform
+from uc01.transform import build_group_map, to_dataframe
+from uc01.validate import ValidationReport, frame_report, validate_frame
+
+
+def dirty_articles(n):
+    articles = synthetic_articles(n)
+    for i, a in enumerate(articles):
+        if i % 97 == 0:
+            a["published_date"] = "not a date"
+        if i % 89 == 0:
+            a["doi"] = None
+        if i % 83 == 0:
+            a["group_id"] = 99999
+        if i % 211 == 0:
+            a["group_id"] = "28585"
+    return articles + articles[: n // 100]  # one overlapping page
+
+
+def without_checks(articles, group_map):
+    uc01.transform.validate_frame = lambda df, **kwargs: ValidationReport(rows=len(df), counts={})
+    try:
+        return to_dataframe(articles, group_map)
+    finally:
+        uc01.transform.validate_frame = validate_frame
+
+
+def main(sizes):
+    warnings.simplefilter("ignore", UserWarning)  # dateutil fallback for the bad dates
+    group_map = build_group_map(synthetic_groups())
+    print(f"{'rows':>9} {'corpus':>6} {'to_dataframe':>13} {'checks':>8} {'overhead':>9}")
+    for n in sizes:
+        for corpus, articles in (("clean", synthetic_articles(n)), ("dirty", dirty_articles(n))):
+            df = to_dataframe(articles, group_map)
+            raw = pd.DataFrame({"published_date": [a.get("published_date") for a in articles]})["published_date"]
+            unchecked = timeit(lambda: without_checks(articles, group_map), repeat=7)
+            checks = timeit(lambda: validate_frame(df, raw_dates=raw, known_group_ids=group_map.keys()), repeat=7)
+            print(f"{len(articles):>9} {corpus:>6} {unchecked:>11.1f}ms {checks:>6.1f}ms {checks / unchecked:>9.1%}")
+    print(frame_report(df).as_frame().to_string(index=False))
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000, 1_000_000])
@@ -0,0 +1,49 @@
+"""Version index and diff between two refreshes of one query.
+
+    python benchmarks/bench_versions.py [rows]
+
+The second load drops the oldest 0.05% of rows, edits a few titles and DOIs,
+blanks one group id (its column turns float64, which must not count as a
+change) and adds 0.1% new articles. "full compare" is what finding the same
+rows took without an index: an outer merge of the two frames on id.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from _common import synthetic_articles, synthetic_groups, timeit
+
+from uc01.transform import build_group_map, to_dataframe
+from uc01.versions import VersionIndex, delta_frame, diff
+
+
+def main(n: int) -> None:
+    groups = build_group_map(synthetic_groups())
+    records = synthetic_articles(n)
+    removed, added = n // 2000, n // 1000
+    edited = [dict(r) for r in records[removed:]]
+    for i in range(0, 50 * 97, 97):
+        edited[i]["title"] += " (v2)"
+        edited[i + 1]["doi"] = f"10.0000/edited.{i}"
+    edited[7]["group_id"] = None
+    edited += [dict(r, id=r["id"] + 10 * n) for r in records[:added]]
+    old, new = to_dataframe(records, groups), to_dataframe(edited, groups)
+
+    started = time.perf_counter()
+    old_index, new_index = VersionIndex.from_frame(old), VersionIndex.from_frame(new)
+    index_s = (time.perf_counter() - started) / 2
+    changes = diff(old_index, new_index)
+    print(f"{n} rows: {changes.summary()}")
+    print(f"index (hash every row, once per version)  {index_s * 1000:8.1f}ms")
+    print(f"diff                                      {timeit(lambda: diff(old_index, new_index)):8.1f}ms")
+    print(f"delta frame                               {timeit(lambda: delta_frame(new, changes)):8.1f}ms")
+    print(f"full compare (outer merge on id)          {timeit(lambda: old.merge(new, on='id', how='outer'), 1):8.1f}ms")
+    full = len(new.drop(columns=["group_id"]).to_csv(index=False))
+    delta = len(delta_frame(new, changes).to_csv(index=False))
+    print(f"export: full CSV {full / 2**20:.1f} MiB, delta CSV {delta / 2**10:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
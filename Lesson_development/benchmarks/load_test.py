@@ -0,0 +1,262 @@
+"""Load test: N concurrent dashboard sessions against a local mock API.
+
+For each session count a fresh `streamlit run lesson_complex_code.py` server
+is started against benchmarks/mock_api.py. Every simulated session opens its
+own websocket to the server, exactly like a browser tab, renders the page and
+then performs a random sequence of widget changes (item type, date range,
+keyword, fuzzy search, plot type), timing each rerun from the widget change
+to the server's "script finished" message. Plot changes are sent as fragment
+reruns, as the browser does.
+
+    python benchmarks/load_test.py --sessions 1 4 16 --steps 20 --articles 5000
+
+A warm-up session renders the page once before the timed sessions connect,
+so imports and the first data load are not attributed to them. Reported per
+session count: rerun latency p50/p95/p99, first-render p50 of a new session
+on the warm server, server RSS growth per connected session, the
+filtered-view cache hit rate and the upstream rate-limiter counters (both
+read from the app's own Diagnostics expander), and the requests the mock API
+answered per endpoint.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import websockets
+from mock_api import MockAPI
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+APP = Path(__file__).resolve().parents[1] / "lesson_complex_code.py"
+
+ITEM_TYPE_LABELS = ["Dataset (3)", "Software (9)", "Dataset + Software (3, 9)"]
+PLOTS = [
+    "Items per group",
+    "Items per publication date",
+    "Items per group over time (history)",
+    "Cumulative growth (history)",
+]
+KEYWORDS = ["", "", "wind", "soil", "hydrology", "traffic sensor", "bridg"]
+WIDGETS = ("selectbox", "checkbox", "text_input", "date_input", "slider", "number_input")
+
+
+class Session:
+    """One browser tab: a websocket, the widgets it has seen and their values."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.ws: Any = None
+        self.widgets: Dict[str, Any] = {}  # label -> (kind, element proto, fragment id)
+        self.states: Dict[str, WidgetState] = {}  # widget id -> value we sent
+        self.cached: Dict[str, ForwardMsg] = {}  # hash -> message, for ref_hash replies
+        self.diagnostics: Dict[str, Any] = {}
+
+    async def connect(self) -> None:
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def rerun(self, fragment_id: str = "") -> float:
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        msg.rerun_script.fragment_id = fragment_id
+        msg.rerun_script.cached_message_hashes.extend(self.cached)
+        started = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        label = None
+        while True:
+            fwd = ForwardMsg()
+            fwd.ParseFromString(await self.ws.recv())
+            if fwd.WhichOneof("type") == "ref_hash":
+                fwd = self.cached[fwd.ref_hash]
+            elif fwd.hash:
+                self.cached[fwd.hash] = fwd
+            kind = fwd.WhichOneof("type")
+            if kind == "script_finished":
+                if fwd.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return time.perf_counter() - started
+            elif kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                element = fwd.delta.new_element
+                etype = element.WhichOneof("type")
+                if etype in WIDGETS:
+                    proto = getattr(element, etype)
+                    self.widgets[proto.label] = (etype, proto, fwd.delta.fragment_id)
+                elif etype == "markdown":
+                    label = element.markdown.body
+                elif etype == "json" and label:
+                    self.diagnostics[label.rstrip(":")] = json.loads(element.json.body)
+
+    async def set(self, label: str, value: Any) -> float:
+        kind, proto, fragment_id = self.widgets[label]
+        state = WidgetState(id=proto.id)
+        if kind == "checkbox":
+            state.bool_value = value
+        elif kind == "date_input":
+            state.string_array_value.data[:] = [d.isoformat() for d in value]
+        elif kind == "slider":
+            state.double_array_value.data[:] = [value]
+        else:
+            state.string_value = value
+        self.states[proto.id] = state
+        return await self.rerun(fragment_id)
+
+    def value(self, label: str) -> Any:
+        kind, proto, _ = self.widgets[label]
+        state = self.states.get(proto.id)
+        if kind == "checkbox":
+            return state.bool_value if state else proto.default
+        if kind == "date_input":
+            values = list(state.string_array_value.data) if state else list(proto.default)
+            return [date.fromisoformat(v.replace("/", "-")) for v in values]
+        raise ValueError(f"unknown widget kind for {label!r}: {kind}")
+
+    async def close(self) -> None:
+        await self.ws.close()
+
+
+async def random_change(session: Session, rng: random.Random) -> float:
+    action = rng.choice(["item_type"] + ["dates"] * 2 + ["keyword"] * 3 + ["fuzzy"] + ["plot"] * 3)
+    if action == "item_type":
+        return await session.set("Item type", rng.choice(ITEM_TYPE_LABELS))
+    if action == "dates":
+        lo, hi = session.value("Publication date range")
+        start = lo + timedelta(days=rng.randrange(max((hi - lo).days, 1)))
+        end = min(hi, start + timedelta(days=rng.choice([30, 90, 365, 3650])))
+        return await session.set("Publication date range", [start, end])
+    if action == "fuzzy":
+        return await session.set("Typo-tolerant title search", not session.value("Typo-tolerant title search"))
+    if action == "plot":
+        return await session.set("Choose a plot", rng.choice(PLOTS))
+    return await session.set("Keyword in title", rng.choice(KEYWORDS))
+
+
+async def drive(url: str, server_pid: int, sessions: int, steps: int, seed: int) -> Dict[str, Any]:
+    out: Dict[str, Any] = {"first": [], "rerun": [], "errors": []}
+    warmup = Session(url)
+    await warmup.connect()
+    await warmup.rerun()
+    await warmup.close()
+    out["rss_before"] = rss_mib(server_pid)
+
+    clients = [Session(url) for _ in range(sessions)]
+
+    async def one(i: int, session: Session) -> None:
+        rng = random.Random(seed + i)
+        await session.connect()
+        out["first"].append(await session.rerun())
+        for _ in range(steps):
+            try:
+                out["rerun"].append(await random_change(session, rng))
+            except KeyError as exc:  # widget not rendered (e.g. no results)
+                out["errors"].append(f"missing widget {exc}")
+
+    await asyncio.gather(*(one(i, s) for i, s in enumerate(clients)))
+    # One more full rerun so the Diagnostics expander shows the final counters.
+    await clients[0].rerun()
+    out["diagnostics"] = clients[0].diagnostics
+    out["rss"] = rss_mib(server_pid)  # while every session is still connected
+    await asyncio.gather(*(s.close() for s in clients))
+    return out
+
+
+def rss_mib(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(api_url: str, port: int) -> subprocess.Popen:
+    env = dict(os.environ, FOURTU_BASE_URL=api_url)
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", str(APP),
+            "--server.headless", "true",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=APP.parent,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("streamlit server did not start")
+
+
+def report(n: int, out: Dict[str, Any], upstream: Dict[str, int]) -> None:
+    rerun_ms = np.array(out["rerun"]) * 1000
+    views: Optional[Dict[str, int]] = out["diagnostics"].get("Filtered-view cache (this process)")
+    limiter: Dict[str, Any] = out["diagnostics"].get("Upstream requests (this process)", {})
+    lookups = (views["hits"] + views["misses"]) if views else 0
+    print(
+        f"{n:>8} "
+        f"{np.percentile(rerun_ms, 50):>6.0f}ms {np.percentile(rerun_ms, 95):>6.0f}ms "
+        f"{np.percentile(rerun_ms, 99):>6.0f}ms {np.median(out['first']) * 1000:>8.0f}ms "
+        f"{(out['rss'] - out['rss_before']) / n:>12.1f} "
+        f"{(views['hits'] / lookups if lookups else float('nan')):>10.0%} "
+        f"{limiter.get('requests', 0):>8} "
+        f"{' '.join(f'{k}={v}' for k, v in sorted(upstream.items())):<24} "
+        f"{len(out['errors']):>6}",
+        flush=True,
+    )
+    for error in out["errors"][:3]:
+        print("  error:", error)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--steps", type=int, default=20, help="widget changes per session")
+    parser.add_argument("--articles", type=int, default=5000, help="records per item type in the mock API")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'sessions':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'first p50':>10} "
+        f"{'MiB/session':>12} {'view hits':>10} {'limiter':>8} {'mock API requests':<24} {'errors':>6}"
+    )
+    with MockAPI(articles=args.articles) as api:
+        for n in args.sessions:
+            api.reset()
+            port = free_port()
+            server = start_server(api.url, port)
+            try:
+                out = asyncio.run(drive(f"ws://127.0.0.1:{port}/_stcore/stream", server.pid, n, args.steps, args.seed))
+                report(n, out, api.requests())
+            finally:
+                server.terminate()
+                server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Local stand-in for the 4TU API, serving a synthetic corpus.
+
+Serves /v3/groups, /v2/articles (item_type, published_since, limit, offset)
+and /v2/articles/<id> over HTTP/1.1 keep-alive, gzip-compressed when the
+client accepts it, and counts the requests and connections it answers, so
+benchmarks can report how much upstream traffic the dashboard generated.
+`latency` adds a fixed delay per request to stand in for the network.
+
+    python benchmarks/mock_api.py --port 8765 --articles 5000
+    FOURTU_BASE_URL=http://127.0.0.1:8765 streamlit run lesson_complex_code.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from _common import synthetic_articles, synthetic_groups
+
+ITEM_TYPES = (3, 9)
+
+
+class MockAPI:
+    """Mock server on a background thread; use as a context manager."""
+
+    def __init__(self, articles: int = 5000, port: int = 0, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.groups = synthetic_groups()
+        self.articles: Dict[int, List[Dict[str, Any]]] = {}
+        self.by_id: Dict[int, Dict[str, Any]] = {}
+        for item_type in ITEM_TYPES:
+            records = synthetic_articles(articles, seed=item_type)
+            for r in records:
+                r["id"] += item_type * 10_000_000
+            records.sort(key=lambda r: r["published_date"])
+            self.articles[item_type] = records
+            self.by_id.update((r["id"], r) for r in records)
+
+        self._lock = threading.Lock()
+        self._requests: Counter = Counter()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def requests(self) -> Dict[str, int]:
+        """Requests answered per endpoint (and "connections" accepted) since start or the last reset."""
+        with self._lock:
+            return dict(self._requests)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests.clear()
+
+    def __enter__(self) -> "MockAPI":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def respond(self, path: str, query: Dict[str, str]) -> Tuple[str, Any]:
+        """(endpoint name, JSON body or None for 404)."""
+        if path == "/v3/groups":
+            return "groups", self.groups
+        if path == "/v2/articles":
+            since = query.get("published_since", "")
+            records = [r for r in self.articles.get(int(query.get("item_type", 3)), []) if r["published_date"] >= since]
+            offset, limit = int(query.get("offset", 0)), int(query.get("limit", 10))
+            return "articles", records[offset : offset + limit]
+        if path.startswith("/v2/articles/"):
+            record = self.by_id.get(int(path.rsplit("/", 1)[1]))
+            if record is None:
+                return "article", None
+            details = {
+                "authors": [{"full_name": "A. Researcher"}],
+                "license": {"name": "CC BY 4.0"},
+                "size": 1024,
+                "categories": [{"title": "Earth sciences"}],
+                "files": [{"name": "data.csv", "size": 1024}],
+            }
+            return "article", dict(record, **details)
+        return "other", None
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def setup(self) -> None:
+                super().setup()
+                with api._lock:
+                    api._requests["connections"] += 1
+
+            def do_GET(self) -> None:
+                if api.latency:
+                    time.sleep(api.latency)
+                url = urlparse(self.path)
+                endpoint, body = api.respond(url.path, {k: v[0] for k, v in parse_qs(url.query).items()})
+                with api._lock:
+                    api._requests[endpoint] += 1
+                if body is None:
+                    self.send_error(404)
+                    return
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    payload = gzip.compress(payload, compresslevel=5)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a synthetic 4TU API locally.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--articles", type=int, default=5000, help="records per item type")
+    args = parser.parse_args()
+    api = MockAPI(articles=args.articles, port=args.port)
+    print(f"serving {args.articles} articles per item type on {api.url}", flush=True)
+    api.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,129 +1,48 @@
 from __future__ import annotations
 
-import os
-from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
 
 import pandas as pd
-import requests
 import streamlit as st
-from dotenv import load_dotenv
-
-# ------------------------------------------------------------
-# 0) Configuration
-# ------------------------------------------------------------
-load_dotenv()  # reads .env if present
-
-BASE_URL = os.getenv("FOURTU_BASE_URL", "https://data.4tu.nl").rstrip("/")
-TIMEOUT = int(os.getenv("FOURTU_TIMEOUT", "30"))
-TOKEN = os.getenv("FOURTU_TOKEN", "").strip()  # optional for public monitoring
-
-DEFAULT_PUBLISHED_SINCE = os.getenv("UC01_PUBLISHED_SINCE", "2025-01-01")
-DEFAULT_PAGE_SIZE = int(os.getenv("UC01_PAGE_SIZE", "11754"))
-DEFAULT_MAX_PAGES = int(os.getenv("UC01_MAX_PAGES", "3"))
-
-
-def headers() -> Dict[str, str]:
-    h = {"Accept": "application/json"}
-    if TOKEN:
-        h["Authorization"] = f"token {TOKEN}"
-    return h
-
-
-# ------------------------------------------------------------
-# 1) "Client" functions (keep them tiny and readable)
-# ------------------------------------------------------------
-def get_groups() -> List[Dict[str, Any]]:
-    """GET /v3/groups"""
-    url = f"{BASE_URL}/v3/groups"
-    r = requests.get(url, headers=headers(), timeout=TIMEOUT)
-    r.raise_for_status()
-    data = r.json()
-    return data if isinstance(data, list) else []
-
-
-def get_articles_page(
-    *,
-    item_type: int,
-    published_since: str,
-    limit: int,
-    offset: int,
-) -> List[Dict[str, Any]]:
-    """GET /v2/articles (paged)"""
-    url = f"{BASE_URL}/v2/articles"
-    params = {
-        "item_type": item_type,
-        "published_since": published_since,
-        "limit": limit,
-        "offset": offset,
-    }
-    r = requests.get(url, headers=headers(), params=params, timeout=TIMEOUT)
-    r.raise_for_status()
-    data = r.json()
-    return data if isinstance(data, list) else []
-
-
-def get_recent_articles(
-    *,
-    item_type: int,
-    published_since: str,
-    page_size: int,
-    max_pages: int,
-) -> List[Dict[str, Any]]:
-    """Fetch up to max_pages of articles using limit/offset."""
-    all_items: List[Dict[str, Any]] = []
-    for page in range(max_pages):
-        offset = page * page_size
-        batch = get_articles_page(
-            item_type=item_type,
-            published_since=published_since,
-            limit=page_size,
-            offset=offset,
-        )
-        all_items.extend(batch)
-        if len(batch) < page_size:
-            break
-    return all_items
-
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from uc01.cache_budget import CACHE
+from uc01.client import get_groups
+from uc01.config import (
+    BASE_URL,
+    CHART_POINTS,
+    DATASET_DIR,
+    DEFAULT_MAX_PAGES,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PUBLISHED_SINCE,
+    ENRICH_MAX_ROWS,
+    GROUPS_TTL,
+    SNAPSHOT_DIR,
+)
+from uc01.enrich import enrich_frame
+from uc01.fuzzy import DEFAULT_THRESHOLD, rank_names
+from uc01.ingest import dataset_summary, has_dataset, query_dataset
+from uc01.history import load_history, record_sync, trend_frame
+from uc01.pipeline import combine_frames, concat_sorted, load_articles_frame, load_item_types_frame
+from uc01.query_cache import LISTINGS, canonical_since
+from uc01.payloads import PAYLOADS
+from uc01.ratelimit import LIMITER
+from uc01.raw_store import STORE
+from uc01.refresh import start as start_refresh, status as refresh_status
+from uc01.snapshot import open_snapshot, snapshot_path
+from uc01.transform import RESOLUTIONS, bucket_counts, build_group_map, dataset_version, pick_resolution
+from uc01.validate import frame_report
+from uc01.versions import VERSIONS, delta_frame
+from uc01.view_cache import VIEWS, FilterState, View, compute_view, frame_summary
+from uc01.warmup import status as warmup_status, take_preloaded
 
 # ------------------------------------------------------------
-# 2) Transformations
+# 0) Configuration, 1) "Client" functions and 2) Transformations
+#    live in the uc01 package (uc01/config.py, uc01/client.py,
+#    uc01/transform.py) so the snapshot loader can reuse them.
 # ------------------------------------------------------------
-def build_group_map(groups: List[Dict[str, Any]]) -> Dict[int, str]:
-    """Map group id -> name."""
-    out: Dict[int, str] = {}
-    for g in groups:
-        gid = g.get("id")
-        name = g.get("name")
-        if isinstance(gid, int) and isinstance(name, str):
-            out[gid] = name
-    return out
-
-
-def to_dataframe(
-    articles: List[Dict[str, Any]],
-    group_map: Dict[int, str],
-) -> pd.DataFrame:
-    """Extract minimal columns needed for dashboard."""
-    rows = []
-    for a in articles:
-        gid = a.get("group_id")
-        rows.append(
-            {
-                "id": a.get("id"),
-                "title": a.get("title"),
-                "published_date": a.get("published_date"),
-                "group_id": gid,
-                "group_name": group_map.get(gid, "Unknown"),
-                "doi": a.get("doi"),
-                "uuid": a.get("uuid"),
-                "url": a.get("url"),
-            }
-        )
-    df = pd.DataFrame(rows)
-    if "published_date" in df.columns:
-        df["published_date"] = pd.to_datetime(df["published_date"], errors="coerce")
-    return df
 
 
 # ------------------------------------------------------------
@@ -135,101 +54,274 @@ st.caption(f"Source: {BASE_URL}")
 
 with st.sidebar:
     st.header("Data source")
-    use_cache = st.checkbox("Use Streamlit cache", value=True)
+    use_cache = st.checkbox(
+        "Cache loaded data",
+        value=True,
+        help="Keep loaded frames in this process's cache, shared by all sessions; off downloads on every rerun.",
+    )
+    concurrent_fetch = st.checkbox(
+        "Concurrent fetch (async client)",
+        value=False,
+        help="Fetch all article pages at the same time.",
+    )
+    enrich_details = st.checkbox(
+        "Add article details",
+        value=False,
+        help=(
+            f"Authors, license, size, categories and files for the first {ENRICH_MAX_ROWS} results "
+            "(one cached API call per article)."
+        ),
+    )
 
     refresh = st.button("Refresh now")
 
     st.header("Query")
-    item_type_label = st.selectbox("Item type", ["Dataset (3)", "Software (9)"], index=0)
-    item_type = 3 if item_type_label.startswith("Dataset") else 9
+    item_type_label = st.selectbox(
+        "Item type",
+        ["Dataset (3)", "Software (9)", "Dataset + Software (3, 9)"],
+        index=0,
+    )
+    if item_type_label.startswith("Dataset +"):
+        item_types = (3, 9)
+    else:
+        item_types = (3,) if item_type_label.startswith("Dataset") else (9,)
+    item_type = "_".join(str(t) for t in item_types)
 
     published_since = st.text_input("published_since (YYYY-MM-DD)", value=DEFAULT_PUBLISHED_SINCE)
     page_size = st.number_input("page_size", min_value=10, max_value=11754, value=DEFAULT_PAGE_SIZE, step=10)
     max_pages = st.number_input("max_pages", min_value=1, max_value=50, value=DEFAULT_MAX_PAGES, step=1)
-
-    st.caption(f"Effective item_type = {item_type}")
+    try:
+        published_since = canonical_since(published_since)
+    except ValueError as exc:
+        st.error(str(exc))
+        st.stop()
+
+    st.caption(f"Effective item_type = {', '.join(str(t) for t in item_types)}")
+
+
+# Each item type is cached and refreshed on its own and all of them share one
+# cached group map, so "Dataset + Software" reuses the single-type entries and
+# switching between the three views is a cache hit, not a new download.
+@st.cache_data(show_spinner=False, ttl=GROUPS_TTL)
+def load_group_map_cached() -> Dict[int, str]:
+    return build_group_map(get_groups())
+
+
+# Caching: one shared frame per canonical query (item_type, published_since
+# as YYYY-MM-DD, limit = page_size * max_pages), held in the process-wide
+# cache budget (uc01/cache_budget.py) that sizes every frame and evicts across
+# frames, indexes and listings beyond UC01_CACHE_MB. On a miss the records
+# come from the listing cache, which slices or extends listings it already
+# holds instead of downloading them again.
+def load_item_type_cached(
+    *,
+    item_type: int,
+    published_since: str,
+    limit: int,
+    page_size: int,
+    concurrent: bool = False,
+) -> pd.DataFrame:
+    def load() -> pd.DataFrame:
+        # Started via `python -m uc01.warmup`, the default frame is already loaded.
+        df = take_preloaded(item_type=item_type, published_since=published_since, limit=limit)
+        if df is None:
+            df = load_articles_frame(
+                item_type=item_type,
+                published_since=published_since,
+                page_size=page_size,
+                max_pages=-(-limit // page_size),
+                group_map=load_group_map_cached(),
+                concurrent=concurrent,
+                cache=None if concurrent else LISTINGS,
+            )
+        # Every fresh, complete load is a sync: append its daily counts to the trend history.
+        record_sync(df, item_type=item_type, published_since=published_since, limit=limit)
+        return df
+
+    return CACHE.get_or_load("frames", (item_type, published_since, limit), load)
 
 
-# Caching: keyed by function args (item_type, published_since, etc.)
-@st.cache_data(show_spinner=True)
 def load_data_cached(
     *,
-    item_type: int,
+    item_types: Tuple[int, ...],
     published_since: str,
     page_size: int,
     max_pages: int,
+    concurrent: bool,
 ) -> pd.DataFrame:
-    groups = get_groups()
-    group_map = build_group_map(groups)
-    articles = get_recent_articles(
-        item_type=item_type,
-        published_since=published_since,
-        page_size=page_size,
-        max_pages=max_pages,
-    )
-    return to_dataframe(articles, group_map)
+    """Per-type cached frames combined; types not cached yet load in parallel."""
+    ctx = get_script_run_ctx()
+
+    def load_one(item_type: int) -> pd.DataFrame:
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return load_item_type_cached(
+            item_type=item_type,
+            published_since=published_since,
+            limit=page_size * max_pages,
+            page_size=page_size,
+            concurrent=concurrent,
+        )
+
+    if len(item_types) == 1:
+        return combine_frames([load_one(item_types[0])])
+    with ThreadPoolExecutor(max_workers=len(item_types)) as pool:
+        return combine_frames(list(pool.map(load_one, item_types)))
 
 
+# With UC01_REFRESH_INTERVAL set, every frame cached above is also reloaded
+# in the background (uc01/refresh.py), behind visitors' own requests.
+start_refresh()
+
 if refresh:
-    load_data_cached.clear()
-
-if use_cache:
-    df = load_data_cached(
-        item_type=item_type,
-        published_since=published_since,
-        page_size=int(page_size),
-        max_pages=int(max_pages),
-    )
+    # Only the selected item types are re-downloaded, with a fresh group list
+    # (a renamed or new group would otherwise stay stale until GROUPS_TTL).
+    load_group_map_cached.clear()
+    for t in item_types:
+        LISTINGS.invalidate(t)
+        CACHE.discard("frames", (t, published_since, int(page_size) * int(max_pages)))
+
+# Multi-process serving: a loader process (python -m uc01.snapshot) publishes
+# a memory-mapped Arrow file per item type, and one for the item types it
+# loads together, that all workers share instead of each caching its own
+# copy. The query inputs above are the loader's choice.
+snapshot = open_snapshot(snapshot_path(item_types)) if SNAPSHOT_DIR else None
+
+# Bounded-memory mode: python -m uc01.ingest streamed the articles page by page
+# into Parquet files. Nothing is loaded up front; the filters further down are
+# pushed into the Parquet scan and only matching rows are read.
+summary = dataset_summary(item_types) if DATASET_DIR and has_dataset(item_types) else None
+df = None
+
+if summary is not None:
+    st.sidebar.caption(f"Querying Parquet dataset in {DATASET_DIR}")
+elif snapshot is not None:
+    df = snapshot.frame
+    st.sidebar.caption(f"Serving shared snapshot from {snapshot.version}")
+elif use_cache:
+    with st.spinner("Loading data..."):
+        df = load_data_cached(
+            item_types=item_types,
+            published_since=published_since,
+            page_size=int(page_size),
+            max_pages=int(max_pages),
+            concurrent=concurrent_fetch,
+        )
+elif concurrent_fetch:
+    # No cache path: call the same logic directly, all item types at once
+    with st.spinner("Loading data..."):
+        df = load_item_types_frame(
+            item_types=item_types,
+            published_since=published_since,
+            page_size=int(page_size),
+            max_pages=int(max_pages),
+        )
 else:
-    # No cache path: call the same logic directly
-    groups = get_groups()
-    group_map = build_group_map(groups)
-    articles = get_recent_articles(
-        item_type=item_type,
-        published_since=published_since,
-        page_size=int(page_size),
-        max_pages=int(max_pages),
-    )
-    df = to_dataframe(articles, group_map)
-
-if df.empty:
+    # No cache path with the sync client, one item type after the other
+    with st.spinner("Loading data..."):
+        group_map = build_group_map(get_groups())
+        frames = [
+            load_articles_frame(
+                item_type=t,
+                published_since=published_since,
+                page_size=int(page_size),
+                max_pages=int(max_pages),
+                group_map=group_map,
+            )
+            for t in item_types
+        ]
+        df = frames[0] if len(frames) == 1 else concat_sorted(frames)
+
+loaded_rows = summary.rows if summary is not None else len(df)
+if loaded_rows == 0:
     st.warning("No results returned. Try a different published_since or increase max_pages.")
     st.stop()
 
+# Every distinct version of this query is recorded (uc01/versions.py), so a
+# refresh can say what it brought in. Parquet-dataset mode never holds the
+# whole frame and is not versioned.
+changes = None
+if df is not None:
+    lineage = (
+        f"snapshot:{item_type}"
+        if snapshot is not None
+        else f"api:{item_type}:{published_since}:{int(page_size) * int(max_pages)}"
+    )
+    VERSIONS.record(lineage, df)
+    changes = VERSIONS.since_previous(lineage)
+
 
 # ------------------------------------------------------------
 # 4) Filters
 # ------------------------------------------------------------
 with st.sidebar:
     st.header("Filters")
-    group_options = sorted([g for g in df["group_name"].dropna().unique().tolist() if isinstance(g, str)])
+    # Options and bounds depend only on the data, so they are computed once per
+    # dataset version rather than on every widget change.
+    facets = summary if summary is not None else frame_summary(df)
+    group_options = facets.group_names
+    min_d, max_d = facets.min_date, facets.max_date
+    # Typo-tolerant lookup: "delf univ" finds "Delft University of Technology", best match first.
+    group_query = st.text_input("Find affiliation", value="", help="Approximate match on group names.").strip()
+    if group_query:
+        group_options = rank_names(group_options, group_query, threshold=DEFAULT_THRESHOLD)
+        if not group_options:
+            st.caption("No affiliation matches that search.")
     group_choice = st.selectbox("Affiliation (group)", ["All"] + group_options)
 
-    date_series = df["published_date"].dropna()
-    if not date_series.empty:
-        min_d = date_series.min().date()
-        max_d = date_series.max().date()
+    if min_d and max_d:
         start_d, end_d = st.date_input("Publication date range", value=(min_d, max_d))
     else:
         start_d = end_d = None
         st.info("No published_date found to filter on.")
 
     keyword = st.text_input("Keyword in title", value="").strip()
+    fuzzy_search = st.checkbox(
+        "Typo-tolerant title search",
+        value=False,
+        disabled=summary is not None,
+        help="Rank titles by trigram similarity to the keyword instead of requiring an exact substring.",
+    )
+    fuzzy_threshold = (
+        st.slider("Minimum similarity", min_value=0.1, max_value=1.0, value=DEFAULT_THRESHOLD, step=0.05)
+        if fuzzy_search
+        else 0.0
+    )
 
-filtered = df.copy()
-
-if group_choice != "All":
-    filtered = filtered[filtered["group_name"] == group_choice]
-
-if start_d and end_d and filtered["published_date"].notna().any():
-    filtered = filtered[
-        (filtered["published_date"].dt.date >= start_d)
-        & (filtered["published_date"].dt.date <= end_d)
-    ]
-
-if keyword:
-    filtered = filtered[filtered["title"].fillna("").str.contains(keyword, case=False, na=False)]
+state = FilterState.normalize(group_choice, start_d, end_d, keyword, fuzzy_threshold)
 
+if summary is not None:
+    filtered = query_dataset(item_types, group=state.group, start=state.start, end=state.end, keyword=state.keyword)
+    view = compute_view(filtered, FilterState.normalize("All", None, None, ""))
+else:
+    # The filter chain and its aggregates are shared across sessions: the same
+    # dataset + filter state is computed once per process (uc01/view_cache.py).
+    view = VIEWS.get(df, state)
+    filtered = df.iloc[view.positions]
+    if view.scores is not None:
+        filtered = filtered.assign(match=view.scores.round(2))
+
+# Identifies this result set, so its table and CSV are serialized once (uc01/payloads.py).
+payload_key = (dataset_version(df if df is not None else filtered), state, enrich_details)
+
+if enrich_details:
+    # One request per row: only the first ENRICH_MAX_ROWS rows are looked up,
+    # and only when this result set was not enriched completely before.
+    enriched = PAYLOADS.frame(payload_key)
+    if enriched is None:
+        with st.spinner(f"Fetching details for {min(len(filtered), ENRICH_MAX_ROWS)} items..."):
+            enriched = enrich_frame(filtered, max_rows=ENRICH_MAX_ROWS)
+        if enriched.attrs["details_missing"]:
+            # Partial details are shown but not cached; the next rerun retries the failed lookups.
+            st.caption(f"Details could not be fetched for {enriched.attrs['details_missing']} items.")
+            payload_key = None
+        else:
+            PAYLOADS.put_frame(payload_key, enriched)
+    filtered = enriched
+    if len(filtered) > ENRICH_MAX_ROWS:
+        st.caption(
+            f"Details are shown for the first {ENRICH_MAX_ROWS} of {len(filtered)} results; "
+            "narrow the filters to see details for the rest."
+        )
 
 # ------------------------------------------------------------
 # 5) Output
@@ -240,62 +332,106 @@ with col1:
     st.metric("Results", int(len(filtered)))
     st.download_button(
         "Download CSV",
-        data=filtered.drop(columns=["group_id"], errors="ignore").to_csv(index=False),
+        # Built on the first click and kept: reruns that leave data and filters
+        # alone (plot type, cache toggles) neither rebuild nor re-hash it.
+        data=lambda: PAYLOADS.csv(payload_key, filtered),
         file_name=f"4tu_monitoring_item_type_{item_type}.csv",
         mime="text/csv",
     )
+    if changes is not None:
+        # Only added/changed rows and removed ids; built when clicked, not on every rerun.
+        changes_key = ("changes", changes.old.version, changes.new.version)
+        st.download_button(
+            "Download changes since last refresh",
+            data=lambda: PAYLOADS.csv(changes_key, delta_frame(df, changes)),
+            file_name=f"4tu_monitoring_item_type_{item_type}_changes.csv",
+            mime="text/csv",
+        )
 
 with col2:
+    # A cached Arrow table, sent a page of rows at a time: an unchanged view
+    # costs a rerun almost nothing (benchmarks/bench_payloads.py).
     st.dataframe(
-        filtered.drop(columns=["group_id"], errors="ignore"),
+        PAYLOADS.table(payload_key, filtered),
         width="stretch",
         hide_index=True,
+        lazy=True,
     )
 
 with st.expander("Diagnostics"):
-    st.write("Loaded rows:", len(df))
-    st.write("Columns:", list(df.columns))
+    st.write("Loaded rows:", loaded_rows)
+    st.write("Columns:", list(filtered.columns))
+    if df is not None:
+        # Counted at load time (uc01/validate.py); the rows themselves are kept.
+        report = frame_report(df)
+        st.write(f"Data quality: {report.issues} issue(s) in {report.rows} rows")
+        st.dataframe(report.as_frame(), hide_index=True)
+    if changes is not None:
+        st.write(
+            f"{len(changes.added)} new since last refresh "
+            f"({len(changes.changed)} changed, {len(changes.removed)} removed; previous version {changes.old.created_at})"
+        )
+    st.write("Filtered-view cache (this process):", VIEWS.stats())
+    st.write("Article listing cache (this process):", LISTINGS.stats())
+    st.write("Cache budget (this process):", CACHE.stats())
+    st.write("Upstream requests (this process):", LIMITER.metrics())
+    if STORE is not None:
+        st.write("Raw response store:", STORE.stats())
+    if refresh_status() is not None:
+        st.write("Background refresh (UC01_REFRESH_INTERVAL):", refresh_status())
+    if warmup_status() is not None:
+        st.write("Warm-up (python -m uc01.warmup):", warmup_status())
 
 # ------------------------------------------------------------
 # 6) Plotting
 # ------------------------------------------------------------
-st.subheader("Quick plot")
-
-plot_choice = st.selectbox(
-    "Choose a plot",
-    [
-        "Items per group",
-        "Items per publication date",
-    ],
-)
-
-if plot_choice == "Items per group":
-    plot_df = (
-        filtered["group_name"]
-        .fillna("Unknown")
-        .value_counts()
-        .rename_axis("group_name")
-        .reset_index(name="count")
+# A fragment: picking another plot reruns only this function, not the load,
+# filter chain, table and CSV above. It reads the view computed by the last
+# full run.
+@st.fragment
+def quick_plot(view: View, item_types: Tuple[int, ...], group_choice: str) -> None:
+    st.subheader("Quick plot")
+
+    plot_choice = st.selectbox(
+        "Choose a plot",
+        [
+            "Items per group",
+            "Items per publication date",
+            "Items per group over time (history)",
+            "Cumulative growth (history)",
+        ],
     )
 
-    st.write("Number of items per affiliation/group")
-    st.bar_chart(plot_df.set_index("group_name"))
+    if plot_choice == "Items per group":
+        st.write("Number of items per affiliation/group")
+        st.bar_chart(view.group_counts)
+
+    elif plot_choice == "Items per publication date":
+        if view.day_counts.empty:
+            st.info("No publication dates available for plotting.")
+        else:
+            resolution = st.selectbox("Resolution", ["Auto", *(r.capitalize() for r in RESOLUTIONS)]).lower()
+            if resolution == "auto":
+                # The filtered days lie inside the selected range, so their span bounds the bar count.
+                days = view.day_counts.index
+                resolution = pick_resolution(days.min().date(), days.max().date(), CHART_POINTS)
+            st.write(f"Number of items per publication {resolution}")
+            st.bar_chart(bucket_counts(view.day_counts, resolution))
+
+    elif plot_choice in ("Items per group over time (history)", "Cumulative growth (history)"):
+        # Trend charts read only the small aggregate history, never the raw articles.
+        trend = trend_frame(
+            load_history(),
+            item_types=item_types,
+            group=None if group_choice == "All" else group_choice,
+            cumulative=plot_choice.startswith("Cumulative"),
+        )
 
-elif plot_choice == "Items per publication date":
-    date_plot_df = filtered.dropna(subset=["published_date"]).copy()
+        if trend.empty:
+            st.info("No history recorded yet. Set UC01_HISTORY_DIR to record counts after each load.")
+        else:
+            st.write("Items per month and group, from the sync history")
+            st.line_chart(trend)
 
-    if date_plot_df.empty:
-        st.info("No publication dates available for plotting.")
-    else:
-        date_plot_df["published_day"] = date_plot_df["published_date"].dt.date
-
-        counts_by_day = (
-            date_plot_df["published_day"]
-            .value_counts()
-            .sort_index()
-            .rename_axis("published_day")
-            .reset_index(name="count")
-        )
 
-        st.write("Number of items per publication date")
-        st.bar_chart(counts_by_day.set_index("published_day"))
\ No newline at end of file
+quick_plot(view, item_types, group_choice)
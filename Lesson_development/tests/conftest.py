@@ -0,0 +1,38 @@
+"""Shared fixtures: a local mock of the 4TU API for every test session.
+
+uc01 reads FOURTU_BASE_URL and the request budget at import, so the mock is
+bound (on a free port) and the environment set here, before any test module
+imports uc01.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT), str(ROOT / "benchmarks")]
+
+from mock_api import MockAPI  # noqa: E402
+
+ARTICLES = 1000
+
+_api = MockAPI(articles=ARTICLES)
+os.environ.update(FOURTU_BASE_URL=_api.url, FOURTU_RATE="0", UC01_HISTORY_DIR="", UC01_VERSIONS_DIR="")
+for name in ("FOURTU_HTTP2", "FOURTU_RAW_STORE", "FOURTU_REPLAY", "UC01_DETAIL_CACHE", "UC01_SNAPSHOT_DIR", "UC01_DATASET_DIR"):
+    os.environ.pop(name, None)
+
+
+@pytest.fixture(scope="session")
+def api() -> MockAPI:
+    """The mock API, serving ARTICLES records per item type; request counts reset per test."""
+    with _api:
+        yield _api
+
+
+@pytest.fixture(autouse=True)
+def _reset_requests() -> None:
+    _api.reset()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from uc01.cache_budget import CacheManager, deep_size
+
+
+def keys(cache: CacheManager) -> list:
+    return sorted(key for ns in ("frames", "listings") for key, _ in cache.items(ns))
+
+
+def test_lru_evicts_least_recently_used_across_namespaces() -> None:
+    cache = CacheManager(max_bytes=300)
+    cache.put("frames", "a", "a", nbytes=100)
+    cache.put("listings", "b", "b", nbytes=100)
+    cache.put("frames", "c", "c", nbytes=100)
+    cache.get("frames", "a")  # a is now the most recent
+
+    cache.put("listings", "d", "d", nbytes=100)
+    assert keys(cache) == ["a", "c", "d"]
+    assert cache.stats()["listings"]["evictions"] == 1
+
+
+def test_lfu_evicts_fewest_hits_then_least_recent() -> None:
+    cache = CacheManager(max_bytes=300, policy="lfu")
+    for key in "abc":
+        cache.put("frames", key, key, nbytes=100)
+    for _ in range(3):
+        cache.get("frames", "a")
+    cache.get("frames", "c")
+
+    cache.put("frames", "d", "d", nbytes=100)  # b has no hits
+    assert keys(cache) == ["a", "c", "d"]
+    cache.put("frames", "e", "e", nbytes=100)  # d has no hits yet
+    assert keys(cache) == ["a", "c", "e"]
+
+
+def test_evicts_until_under_budget_but_keeps_newest() -> None:
+    cache = CacheManager(max_bytes=250)
+    cache.put("frames", "a", "a", nbytes=100)
+    cache.put("frames", "b", "b", nbytes=100)
+    cache.put("frames", "big", "big", nbytes=1000)
+    assert keys(cache) == ["big"]
+    assert cache.get("frames", "big") == "big"
+    assert cache.stats()["frames"]["evictions"] == 2
+
+
+def test_replacing_an_entry_keeps_its_hits_and_resizes() -> None:
+    cache = CacheManager(max_bytes=1000, policy="lfu")
+    cache.put("frames", "a", 1, nbytes=600)
+    cache.get("frames", "a")
+    cache.put("frames", "a", 2, nbytes=100)
+    cache.put("frames", "b", 3, nbytes=800)
+    assert cache.get("frames", "a") == 2
+    assert cache.get("frames", "b") == 3
+
+
+def test_get_or_load_loads_once_for_concurrent_callers() -> None:
+    cache = CacheManager(max_bytes=2**20)
+    calls = []
+    started = threading.Barrier(4)
+
+    def load() -> str:
+        calls.append(1)
+        return "value"
+
+    def caller() -> None:
+        started.wait()
+        assert cache.get_or_load("frames", "k", load) == "value"
+
+    threads = [threading.Thread(target=caller) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+
+
+def test_deep_size_counts_string_columns() -> None:
+    df = pd.DataFrame({"n": np.arange(1000), "s": [f"title {i}" for i in range(1000)]})
+    assert deep_size(df) > deep_size(df[["n"]]) + 1000
+
+
+def test_unknown_policy() -> None:
+    with pytest.raises(ValueError):
+        CacheManager(max_bytes=1, policy="fifo")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pandas as pd
+
+from uc01 import raw_store
+from uc01.cache_budget import CacheManager
+from uc01.enrich import DETAIL_COLUMNS, DetailCache, enrich_frame, fetch_details_async
+
+
+def frame(api, n: int = 5) -> pd.DataFrame:
+    records = api.articles[3][:n]
+    return pd.DataFrame({"id": [r["id"] for r in records], "modified_date": [r["published_date"] for r in records]})
+
+
+def test_only_changed_articles_are_fetched_again(api) -> None:
+    cache = DetailCache(cache=CacheManager(max_bytes=2**30))
+    df = frame(api)
+    enriched = enrich_frame(df, cache=cache)
+    assert enriched["license"].tolist() == ["CC BY 4.0"] * 5
+    assert enriched.attrs["details_missing"] == 0
+    assert api.requests()["article"] == 5
+
+    api.reset()
+    changed = df.assign(modified_date=df["modified_date"].where(df.index != 2, "2099-01-01"))
+    enrich_frame(changed, cache=cache)
+    assert api.requests()["article"] == 1
+    assert cache.cache.stats()["details"]["entries"] == 5
+
+
+def test_entries_share_the_byte_budget_and_reload_from_disk(api, tmp_path) -> None:
+    budget = CacheManager(max_bytes=1)
+    cache = DetailCache(str(tmp_path), cache=budget)
+    df = frame(api, 3)
+    enrich_frame(df, cache=cache)
+    assert budget.stats()["details"]["entries"] == 1  # the budget evicted the others
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(f"{i}.json" for i in df["id"])
+
+    api.reset()
+    assert enrich_frame(df, cache=cache)["files"].tolist() == [1, 1, 1]
+    assert "article" not in api.requests()
+    stored = json.loads((tmp_path / f"{df['id'][0]}.json").read_text())
+    assert stored["modified"] == df["modified_date"][0]
+
+
+def test_unrecorded_article_in_replay_mode_gets_empty_details(api, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(raw_store, "STORE", raw_store.RawStore(str(tmp_path)))
+    monkeypatch.setattr(raw_store, "REPLAY", True)
+    cache = DetailCache(cache=CacheManager(max_bytes=2**30))
+    keys = [(int(i), "") for i in frame(api, 2)["id"]]
+
+    assert asyncio.run(fetch_details_async(keys, max_parallel=2, cache=cache)) == {}
+    assert "article" not in api.requests()
+    enriched = enrich_frame(frame(api, 2), cache=cache)
+    assert enriched[DETAIL_COLUMNS].isna().all().all()
+    assert enriched.attrs["details_missing"] == 2
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import numpy as np
+
+from uc01.fuzzy import TrigramIndex, query_trigrams, rank_names
+
+TITLES = [
+    "Wind tunnel measurements",
+    "Offshore wind turbine wake measurements in the North Sea",
+    "Soil moisture in the Dutch delta",
+    "Windmill restoration survey",
+    "",
+    None,
+]
+
+
+def test_search_ranks_best_match_first_and_shorter_text_on_ties() -> None:
+    rows, _ = TrigramIndex(TITLES).search("wind turbine", threshold=0.3)
+    assert rows.tolist()[:2] == [1, 0]  # row 0 only has the "wind" trigrams
+    rows, scores = TrigramIndex(TITLES).search("measurements", threshold=0.5)
+    assert rows.tolist() == [0, 1]  # both contain every trigram; row 0 is shorter
+    assert scores.tolist() == [1.0, 1.0]
+    rows, scores = TrigramIndex(TITLES).search("wind", threshold=0.2)
+    assert np.all(np.diff(scores) <= 0)
+    assert 2 not in rows.tolist()
+
+
+def test_misspelled_query_still_matches() -> None:
+    rows, scores = TrigramIndex(TITLES).search("soil moistrue", threshold=0.5)
+    assert rows.tolist() == [2]
+    assert 0.5 <= scores[0] < 1
+
+
+def test_query_shorter_than_a_trigram() -> None:
+    # " a " is one padded trigram; an empty query has none and matches nothing.
+    assert query_trigrams("a").size == 1
+    assert query_trigrams("").size == 0
+    assert TrigramIndex(TITLES).search("", threshold=0.1)[0].size == 0
+    assert TrigramIndex(TITLES).search("  ", threshold=0.1)[0].size == 0
+    rows, _ = TrigramIndex(["a b", "ab", "x"]).search("a", threshold=0.5)
+    assert rows.tolist() == [0]  # only a standalone "a" has the trigram " a "
+
+
+def test_no_match_and_empty_index() -> None:
+    assert TrigramIndex(TITLES).search("zzzqqq", threshold=0.3)[0].size == 0
+    rows, scores = TrigramIndex([]).search("wind")
+    assert rows.size == 0 and scores.size == 0
+
+
+def test_rank_names() -> None:
+    names = ["TU Delft", "University of Twente", "Eindhoven University of Technology", "Wageningen"]
+    assert rank_names(names, "univ twnete", threshold=0.4)[0] == "University of Twente"
+    assert rank_names(names, "delft")[0] == "TU Delft"
+    assert rank_names(names, "xyz") == []
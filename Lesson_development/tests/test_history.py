@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from uc01.history import compact, load_history, record_sync
+from uc01.transform import to_dataframe
+
+T1 = datetime(2025, 3, 1, tzinfo=timezone.utc)
+T2 = datetime(2025, 3, 2, tzinfo=timezone.utc)
+
+
+def frame(rows: list) -> pd.DataFrame:
+    """rows of (group_id, published day); group 1 is Delft, 2 Twente, 3 Twente's new name."""
+    articles = [
+        {"id": i, "title": "t", "published_date": f"{day}T12:00:00", "group_id": g} for i, (g, day) in enumerate(rows)
+    ]
+    return to_dataframe(articles, {1: "Delft", 2: "Twente", 3: "University of Twente"}).assign(item_type=3)
+
+
+def counts(history: pd.DataFrame) -> dict:
+    rows = history[["group_name", "day", "count"]].itertuples(index=False)
+    return {(group, day.strftime("%Y-%m-%d")): count for group, day, count in rows}
+
+
+def test_later_sync_replaces_every_count_of_the_days_it_covers(tmp_path) -> None:
+    directory = str(tmp_path)
+    first = frame([(1, "2025-01-10"), (2, "2025-01-10"), (2, "2025-02-10")])
+    record_sync(first, published_since="2025-01-01", directory=directory, synced_at=T1)
+    # Twente was renamed; the second sync only looks back to February.
+    second = frame([(1, "2025-02-10"), (3, "2025-02-10")])
+    record_sync(second, published_since="2025-02-01", directory=directory, synced_at=T2)
+
+    assert counts(load_history(directory)) == {
+        ("Delft", "2025-01-10"): 1,
+        ("Twente", "2025-01-10"): 1,  # outside the second sync's window: kept
+        ("Delft", "2025-02-10"): 1,
+        ("University of Twente", "2025-02-10"): 1,
+    }
+
+
+def test_compaction_keeps_the_coverage(tmp_path) -> None:
+    directory = str(tmp_path)
+    record_sync(frame([(2, "2025-02-10")]), published_since="2025-01-01", directory=directory, synced_at=T1)
+    record_sync(frame([(3, "2025-02-10")]), published_since="2025-01-01", directory=directory, synced_at=T2)
+    before = counts(load_history(directory))
+    assert before == {("University of Twente", "2025-02-10"): 1}
+
+    compact(directory)
+    later = datetime(2025, 3, 3, tzinfo=timezone.utc)
+    record_sync(frame([(1, "2025-02-11")]), published_since="2025-02-11", directory=directory, synced_at=later)
+    assert counts(load_history(directory)) == {**before, ("Delft", "2025-02-11"): 1}
+    assert len(list(tmp_path.glob("part-*"))) == 2
+
+
+def test_truncated_load_is_not_recorded(tmp_path) -> None:
+    df = frame([(1, "2025-01-10"), (2, "2025-01-11")])
+    assert record_sync(df, limit=2, directory=str(tmp_path)) is None
+    assert load_history(str(tmp_path)).empty
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from uc01 import ingest
+from uc01.cache_budget import CacheManager
+from uc01.ingest import dataset_path, dataset_summary, ingest_item_type, query_dataset
+
+
+@pytest.fixture
+def directory(api, tmp_path) -> str:
+    ingest_item_type(item_type=3, published_since="2000-01-01", page_size=200, max_pages=10, directory=str(tmp_path))
+    return str(tmp_path)
+
+
+def test_rerun_with_the_same_filters_does_not_scan_again(directory, monkeypatch) -> None:
+    cache = CacheManager(max_bytes=2**30)
+    summary = dataset_summary([3], directory)
+    scans = []
+    real_scan = ingest._scan
+
+    def scan(*args):
+        scans.append(args)
+        return real_scan(*args)
+
+    monkeypatch.setattr(ingest, "_scan", scan)
+
+    def query(**filters):
+        return query_dataset([3], start=summary.min_date, end=summary.max_date, directory=directory, cache=cache, **filters)
+
+    everything = query()
+    assert len(everything) == summary.rows
+    assert query() is everything
+    assert len(scans) == 1
+
+    one_group = query(group=summary.group_names[0])
+    assert set(one_group["group_name"]) == {summary.group_names[0]}
+    assert len(scans) == 2 and cache.stats()["queries"]["entries"] == 2
+
+
+def test_re_ingested_files_are_scanned_again(api, directory) -> None:
+    cache = CacheManager(max_bytes=2**30)
+    first = query_dataset([3], directory=directory, cache=cache)
+    summary = dataset_summary([3], directory)
+
+    ingest_item_type(item_type=3, published_since="2024-01-01", page_size=200, max_pages=10, directory=directory)
+    path = dataset_path(3, directory)
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1))  # coarse filesystem clocks
+    again = query_dataset([3], directory=directory, cache=cache)
+    assert again is not first and len(again) < len(first)
+    assert dataset_summary([3], directory).rows == len(again) < summary.rows
+
+
+def test_summaries_are_bounded(directory, monkeypatch) -> None:
+    monkeypatch.setattr(ingest, "_summaries", type(ingest._summaries)())
+    path = dataset_path(3, directory)
+    for i in range(10):
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1))
+        dataset_summary([3], directory)
+    assert len(ingest._summaries) == 8
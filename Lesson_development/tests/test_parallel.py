@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+import pandas as pd
+import pytest
+from _common import synthetic_articles, synthetic_groups
+
+from uc01.parallel import PageBatch, frame_from_batches, page_batch
+from uc01.transform import build_group_map, to_dataframe
+
+GROUPS = build_group_map(synthetic_groups())
+
+
+def batches(records: list, pages: int = 5) -> list:
+    """records as /v2/articles response bodies, each transformed as a pool worker does."""
+    size = max(1, -(-len(records) // pages))
+    out = []
+    for i in range(0, max(len(records), 1), size):
+        body = json.dumps(records[i : i + size]).encode()
+        rows, ipc = page_batch(body, GROUPS)
+        out.append(PageBatch(rows, ipc, body if ipc is None else b""))
+    return out
+
+
+def with_gaps() -> list:
+    records = [dict(r) for r in synthetic_articles(2000)]
+    records[3]["group_id"] = None
+    records[50]["published_date"] = "not a date"
+    records[60]["published_date"] = None
+    records[70]["doi"] = None
+    records[100]["id"] = records[99]["id"]
+    return records
+
+
+def untypable() -> list:
+    records = with_gaps()
+    records[5]["title"] = 123  # Arrow cannot type this page's titles
+    records[7]["group_id"] = "28585"
+    return records
+
+
+def mixed_time_zones() -> list:
+    records = with_gaps()
+    for r in records[:500]:
+        if isinstance(r["published_date"], str) and r["published_date"][:4].isdigit():
+            r["published_date"] = r["published_date"][:10] + "T10:00:00Z"
+    records[900]["published_date"] = records[900]["published_date"][:19] + "+02:00"
+    return records
+
+
+def null_column_page() -> list:
+    records = [dict(r) for r in synthetic_articles(2000)]
+    for r in records[:500]:
+        r["doi"] = None  # the first page's doi column is all null
+    return records
+
+
+@pytest.mark.parametrize(
+    "records",
+    [synthetic_articles(2000), with_gaps(), untypable(), mixed_time_zones(), null_column_page(), []],
+    ids=["plain", "gaps", "untypable", "time zones", "null column", "empty"],
+)
+def test_frame_from_batches_equals_to_dataframe(records) -> None:
+    expected = to_dataframe(records, GROUPS)
+    df = frame_from_batches(batches(records), GROUPS)
+    pd.testing.assert_frame_equal(df, expected)
+    assert df.attrs == expected.attrs
+
+
+def test_untypable_page_is_shipped_as_body() -> None:
+    shipped = batches(untypable())
+    assert [b.ipc is None for b in shipped] == [True, False, False, False, False]
+    assert shipped[0].body and not shipped[1].body
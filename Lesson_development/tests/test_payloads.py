@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import io
+
+import pandas as pd
+import pyarrow as pa
+from _common import synthetic_articles, synthetic_groups
+
+from uc01.cache_budget import CacheManager
+from uc01.payloads import PayloadCache, csv_bytes, display_table
+from uc01.transform import build_group_map, to_dataframe
+
+
+def frame(n: int = 300) -> pd.DataFrame:
+    return to_dataframe(synthetic_articles(n), build_group_map(synthetic_groups()))
+
+
+def test_display_table_and_csv_hide_internal_columns() -> None:
+    df = frame()
+    table = display_table(df)
+    assert isinstance(table, pa.Table) and table.num_rows == len(df)
+    assert "group_id" not in table.column_names
+    exported = pd.read_csv(io.BytesIO(csv_bytes(df)))
+    assert list(exported.columns) == table.column_names
+    assert exported["id"].tolist() == df["id"].tolist()
+
+
+def test_csv_is_built_on_first_request_only() -> None:
+    df = frame()
+    payloads = PayloadCache(CacheManager(max_bytes=2**30))
+    payloads.table("v1", df)  # a rerun renders the table; the CSV stays deferred
+    assert payloads.stats()["entries"] == 1
+
+    download = lambda: payloads.csv("v1", df)  # noqa: E731  (what the download button is given)
+    first = download()
+    assert payloads.stats()["entries"] == 2
+    assert download() is first
+    assert payloads.stats()["hits"] == 1
+
+
+def test_rerun_of_an_unchanged_view_hits() -> None:
+    df = frame()
+    payloads = PayloadCache(CacheManager(max_bytes=2**30))
+    table = payloads.table(("v1", "All"), df)
+    for _ in range(3):
+        assert payloads.table(("v1", "All"), df) is table
+    assert payloads.stats()["hits"] == 3 and payloads.stats()["misses"] == 1
+
+    other = payloads.table(("v1", "Delft"), df.iloc[:10])
+    assert other.num_rows == 10 and payloads.stats()["misses"] == 2
+
+
+def test_payloads_share_the_byte_budget() -> None:
+    df = frame(2000)
+    cache = CacheManager(max_bytes=1)
+    payloads = PayloadCache(cache)
+    payloads.table("v1", df)
+    payloads.table("v2", df)
+    assert payloads.stats()["entries"] == 1 and payloads.stats()["evictions"] == 1
+
+
+def test_key_none_is_never_cached() -> None:
+    df = frame()
+    payloads = PayloadCache(CacheManager(max_bytes=2**30))
+    assert payloads.table(None, df) is not payloads.table(None, df)
+    assert payloads.csv(None, df) == csv_bytes(df)
+    assert payloads.stats()["entries"] == 0
+
+
+def test_frame_is_kept_under_its_key() -> None:
+    df = frame()
+    payloads = PayloadCache(CacheManager(max_bytes=2**30))
+    assert payloads.frame(("v1", True)) is None
+    payloads.put_frame(("v1", True), df)
+    assert payloads.frame(("v1", True)) is df
+    assert payloads.frame(("v1", False)) is None
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from uc01.cache_budget import CacheManager
+from uc01.client import get_articles_page
+from uc01.query_cache import ListingCache, canonical_since
+
+
+def fresh(item_type: int, published_since: str, limit: int) -> list:
+    """The first `limit` records of the listing, straight from the API."""
+    return get_articles_page(item_type=item_type, published_since=published_since, limit=limit, offset=0)
+
+
+@pytest.fixture
+def listings() -> ListingCache:
+    return ListingCache(CacheManager(max_bytes=2**30))
+
+
+def test_canonical_since() -> None:
+    assert canonical_since(" 2025-1-1 ") == "2025-01-01"
+    with pytest.raises(ValueError):
+        canonical_since("last week")
+
+
+def test_shorter_limit_is_sliced_from_cached_head(api, listings) -> None:
+    first = listings.get(item_type=3, published_since="2020-01-01", limit=300, page_size=100)
+    assert api.requests()["articles"] == 3
+
+    api.reset()
+    again = listings.get(item_type=3, published_since="2020-1-1", limit=200, page_size=50)
+    assert again == first[:200]
+    assert "articles" not in api.requests()
+    assert listings.counters["hits"] == 1
+
+
+def test_longer_limit_fetches_only_missing_offsets(api, listings) -> None:
+    listings.get(item_type=3, published_since="2020-01-01", limit=300, page_size=100)
+    api.reset()
+
+    records = listings.get(item_type=3, published_since="2020-01-01", limit=500, page_size=100)
+    assert api.requests()["articles"] == 2
+    assert records == fresh(3, "2020-01-01", 500)
+    assert listings.counters["extended"] == 1
+
+
+def test_later_since_is_derived_from_complete_listing(api, listings) -> None:
+    everything = listings.get(item_type=9, published_since="2020-01-01", limit=5000, page_size=400)
+    assert len(everything) == len(api.articles[9])
+    api.reset()
+
+    records = listings.get(item_type=9, published_since="2024-06-01", limit=5000, page_size=400)
+    assert "articles" not in api.requests()
+    assert listings.counters["derived"] == 1
+    assert records == fresh(9, "2024-06-01", 5000)
+
+
+def test_derived_head_is_extended_from_the_later_listing(api, listings) -> None:
+    listings.get(item_type=3, published_since="2020-01-01", limit=600, page_size=200)
+    api.reset()
+
+    # The cached head is not the whole list, so its tail after 2021-06-01 is
+    # only a head of that listing; the rest comes from the API.
+    records = listings.get(item_type=3, published_since="2021-06-01", limit=600, page_size=200)
+    assert api.requests()["articles"] >= 1
+    assert listings.counters["extended"] == 1
+    assert records == fresh(3, "2021-06-01", 600)
+
+
+def test_invalidate_forgets_the_item_type(api, listings) -> None:
+    listings.get(item_type=3, published_since="2020-01-01", limit=100, page_size=100)
+    listings.get(item_type=9, published_since="2020-01-01", limit=100, page_size=100)
+    listings.invalidate(3)
+    api.reset()
+
+    listings.get(item_type=3, published_since="2020-01-01", limit=100, page_size=100)
+    listings.get(item_type=9, published_since="2020-01-01", limit=100, page_size=100)
+    assert api.requests()["articles"] == 1
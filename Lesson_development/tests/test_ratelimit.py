@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from uc01.cache_budget import CacheManager
+from uc01.pipeline import load_articles_frame
+from uc01.query_cache import ListingCache
+from uc01.ratelimit import BACKGROUND, INTERACTIVE, RateLimiter, priority
+from uc01.refresh import refresh_frames
+
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.005)
+
+
+def test_waiting_callers_are_served_by_priority() -> None:
+    limiter = RateLimiter(rate=0, burst=1, max_inflight=1)
+    limiter.acquire()
+    served = []
+
+    def caller(name: str, level: int) -> None:
+        with priority(level):
+            with limiter.slot():
+                served.append(name)
+
+    threads = []
+    for name, level in [("background 1", BACKGROUND), ("background 2", BACKGROUND), ("interactive", INTERACTIVE)]:
+        threads.append(threading.Thread(target=caller, args=(name, level)))
+        threads[-1].start()
+        wait_until(lambda: limiter.metrics()["queued"] == len(threads))
+    limiter.release()
+    for t in threads:
+        t.join()
+    assert served == ["interactive", "background 1", "background 2"]
+
+
+def test_rate_limits_requests_per_second() -> None:
+    limiter = RateLimiter(rate=50, burst=1, max_inflight=4)
+    started = time.monotonic()
+    for _ in range(6):
+        with limiter.slot():
+            pass
+    assert time.monotonic() - started >= 5 / 50 * 0.9
+
+
+def test_cancelled_async_waiter_hands_its_slot_back() -> None:
+    limiter = RateLimiter(rate=0, burst=1, max_inflight=1)
+
+    async def main() -> None:
+        limiter.acquire()  # hold the only slot
+
+        async def request() -> None:
+            async with limiter.aslot():
+                pytest.fail("a cancelled request must not run")
+
+        task = asyncio.ensure_future(request())
+        await asyncio.to_thread(wait_until, lambda: limiter.metrics()["queued"] == 1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        limiter.release()
+
+        # The waiting thread still gets the slot once it is free and returns it.
+        await asyncio.to_thread(wait_until, lambda: limiter.metrics()["requests"] == 2)
+        await asyncio.to_thread(wait_until, lambda: limiter.metrics()["inflight"] == 0)
+        async with limiter.aslot():
+            assert limiter.metrics()["inflight"] == 1
+
+    asyncio.run(main())
+    assert limiter.metrics()["inflight"] == 0
+
+
+def test_interrupted_waiter_leaves_the_queue(monkeypatch) -> None:
+    limiter = RateLimiter(rate=0, burst=1, max_inflight=1)
+    limiter.acquire()
+
+    def interrupted(timeout=None) -> bool:
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(limiter._cond, "wait", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        limiter.acquire()
+    monkeypatch.undo()
+    assert limiter.metrics()["queued"] == 0
+
+    limiter.release()
+    waiter = threading.Thread(target=limiter.acquire)
+    waiter.start()
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()  # not stuck behind the interrupted caller's ticket
+    assert limiter.metrics()["interactive_requests"] == 2
+
+
+def test_background_refresh_reloads_cached_frames_at_background_priority(api, monkeypatch) -> None:
+    cache, listings = CacheManager(max_bytes=2**30), ListingCache(CacheManager(max_bytes=2**30))
+    key = (3, "2020-01-01", 300)
+    old = load_articles_frame(item_type=3, published_since=key[1], page_size=100, max_pages=3, cache=listings)
+    cache.put("frames", key, old)
+    limiter = RateLimiter(rate=0, burst=1, max_inflight=4)
+    monkeypatch.setattr("uc01.client.LIMITER", limiter)
+    api.reset()
+
+    assert refresh_frames(cache, listings) == 1
+    new = cache.get("frames", key)
+    assert new is not old
+    assert new["id"].tolist() == old["id"].tolist()
+    assert api.requests()["articles"] == 1  # one page of the default page size
+    assert limiter.metrics()["requests"] == api.requests()["articles"] + api.requests()["groups"]
+    assert limiter.metrics()["background_requests"] == limiter.metrics()["requests"]
+    assert limiter.metrics()["interactive_requests"] == 0
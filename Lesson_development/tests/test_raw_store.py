@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import gzip
+
+import pytest
+
+from uc01 import raw_store
+from uc01.raw_store import RawStore, request_key
+
+URL = "https://data.4tu.nl/v2/articles"
+BODY = b'[{"id": 1, "title": "Wind"}]'
+
+
+def test_request_key_ignores_param_order() -> None:
+    assert request_key(URL, {"limit": 10, "offset": 0}) == request_key(URL, {"offset": "0", "limit": "10"})
+    assert request_key(URL, {"offset": 0}) != request_key(URL, {"offset": 10})
+
+
+def test_identical_bodies_share_one_object(tmp_path) -> None:
+    store = RawStore(str(tmp_path))
+    first = store.record(URL, {"offset": 0}, BODY)
+    second = store.record(URL, {"offset": 10}, BODY)
+    store.record(URL, {"offset": 20}, b"[]")
+
+    assert first == second
+    assert len(list((tmp_path / "objects").rglob("*.json.*"))) == 2
+    assert len(list((tmp_path / "requests").glob("*.json"))) == 3
+    assert store.counters["new_objects"] == 2 and store.counters["deduplicated"] == 1
+    assert store.load(URL, {"offset": 10}) == BODY
+
+
+def test_gzip_round_trip(tmp_path) -> None:
+    store = RawStore(str(tmp_path))
+    store.codec = "gz"
+    digest = store.record(URL, None, BODY)
+    stored = (tmp_path / "objects" / digest[:2] / f"{digest}.json.gz").read_bytes()
+    assert gzip.decompress(stored) == BODY
+    assert RawStore(str(tmp_path)).load(URL) == BODY
+
+
+def test_zstd_round_trip(tmp_path) -> None:
+    pytest.importorskip("zstandard")
+    store = RawStore(str(tmp_path))
+    assert store.codec == "zst"
+    digest = store.record(URL, None, BODY)
+    assert (tmp_path / "objects" / digest[:2] / f"{digest}.json.zst").exists()
+    assert RawStore(str(tmp_path)).load(URL) == BODY
+
+
+def test_replay_serves_recorded_bodies_and_raises_on_a_miss(tmp_path, monkeypatch) -> None:
+    store = RawStore(str(tmp_path))
+    store.record(URL, {"offset": 0}, BODY)
+    monkeypatch.setattr(raw_store, "STORE", store)
+    monkeypatch.setattr(raw_store, "REPLAY", True)
+
+    assert raw_store.replay(URL, {"offset": 0}) == BODY
+    with pytest.raises(LookupError):
+        raw_store.replay(URL, {"offset": 10})
+    raw_store.record(URL, {"offset": 10}, b"[]")  # replay mode never records
+    assert store.load(URL, {"offset": 10}) is None
+
+
+def test_replay_is_off_by_default(monkeypatch) -> None:
+    monkeypatch.setattr(raw_store, "REPLAY", False)
+    assert raw_store.replay(URL) is None
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from uc01 import report
+from uc01.report import publish, write_reports
+from uc01.transform import to_dataframe
+
+GROUPS = {1: "Delft & <Twente>", 2: "Eindhoven"}
+
+
+def frame() -> pd.DataFrame:
+    articles = [
+        {"id": 1, "title": "<script>alert(1)</script>", "published_date": "2025-01-01T10:00:00", "group_id": 1},
+        {"id": 2, "title": 'Wind "loads" & waves', "published_date": "2025-02-01T10:00:00", "group_id": 2},
+    ]
+    return to_dataframe(articles, GROUPS)
+
+
+def test_html_escapes_titles_and_group_names(tmp_path) -> None:
+    views = write_reports(frame(), tmp_path, [3], generated_at="2025-03-01T00:00:00+00:00")
+    pages = [tmp_path / "index.html"] + [tmp_path / v.slug / "index.html" for v in views]
+    html = "".join(p.read_text() for p in pages)
+
+    assert "<script>" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in html
+    assert "Delft &amp; &lt;Twente&gt;" in html
+    assert "<Twente>" not in html
+
+
+def test_artifacts_and_manifest(tmp_path) -> None:
+    views = write_reports(frame(), tmp_path, [3], generated_at="2025-03-01T00:00:00+00:00")
+    assert [v.slug for v in views] == ["all", "delft-twente", "eindhoven"]
+
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert manifest["views"]["all"]["rows"] == 2 and manifest["rows"] == 2
+    data = json.loads((tmp_path / "eindhoven" / "data.json").read_text())
+    assert data["rows"] == 1 and data["group_counts"] == {"Eindhoven": 1}
+    items = pd.read_csv(tmp_path / "delft-twente" / "items.csv")
+    assert items["id"].tolist() == [1] and "group_id" not in items.columns
+    assert not [p for p in tmp_path.rglob(".*")]  # no temporary files left behind
+
+
+def test_every_artifact_is_replaced_into_place(tmp_path, monkeypatch) -> None:
+    replaced = []
+    real_replace = os.replace
+
+    def replace(src, dst) -> None:
+        assert os.path.dirname(src) == os.path.dirname(dst)
+        assert os.path.basename(src).startswith(f".{os.path.basename(dst)}.")
+        replaced.append(os.path.relpath(dst, tmp_path))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(report.os, "replace", replace)
+    write_reports(frame(), tmp_path, [3])
+    written = sorted(os.path.relpath(p, tmp_path) for p in tmp_path.rglob("*") if p.is_file())
+    assert sorted(replaced) == written
+    assert {"index.html", "manifest.json", "all/index.html", "all/data.json", "all/items.csv"} <= set(written)
+    assert all(oct(os.stat(tmp_path / p).st_mode & 0o777) == "0o644" for p in written)
+
+
+def test_failed_publish_keeps_the_old_file(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "index.html"
+    publish(path, b"old")
+
+    def fail(src, dst) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(report.os, "replace", fail)
+    with pytest.raises(OSError):
+        publish(path, b"new")
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["index.html"]
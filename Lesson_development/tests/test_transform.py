@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from uc01.transform import (
+    bucket_counts,
+    counts_per_day,
+    dataset_version,
+    day_ordinals,
+    parse_dates,
+    pick_resolution,
+    published_between,
+    to_dataframe,
+)
+
+GROUPS = {1: "Delft", 2: "Twente"}
+
+
+def frame(dates: list) -> pd.DataFrame:
+    return to_dataframe(
+        [{"id": i, "title": f"t{i}", "published_date": d, "group_id": 1} for i, d in enumerate(dates)], GROUPS
+    )
+
+
+def test_rows_are_sorted_by_date_with_missing_dates_last() -> None:
+    df = frame(["2025-01-03T10:00:00", None, "2025-01-01T23:59:59", "bad", "2025-01-02T00:00:00"])
+    assert df["id"].tolist() == [2, 4, 0, 1, 3]
+    assert df["published_date"].dtype.kind == "M"
+
+
+def test_published_between_includes_both_end_days() -> None:
+    df = frame(["2025-01-01T23:59:59", "2025-01-02T00:00:00", "2025-01-03T12:00:00", "2025-01-04T00:00:00", None])
+    assert published_between(df, date(2025, 1, 2), date(2025, 1, 3))["id"].tolist() == [1, 2]
+    assert published_between(df, date(2024, 1, 1), date(2024, 12, 31)).empty
+
+
+def test_day_counts_skip_missing_dates() -> None:
+    df = frame(["2025-01-01T01:00:00", "2025-01-01T23:00:00", "2025-01-03T12:00:00", None])
+    assert np.array_equal(day_ordinals(df["published_date"]), [20089, 20089, 20091])
+    assert counts_per_day(df["published_date"]).to_dict() == {
+        pd.Timestamp("2025-01-01"): 2,
+        pd.Timestamp("2025-01-03"): 1,
+    }
+    assert counts_per_day(frame([None])["published_date"]).empty
+
+
+def day_counts(days: dict) -> pd.Series:
+    return pd.Series(list(days.values()), index=pd.DatetimeIndex(list(days), name="published_day"), name="count")
+
+
+def stamps(*days: str) -> list:
+    return [pd.Timestamp(d) for d in days]
+
+
+def test_weeks_start_on_monday_and_empty_weeks_are_zero() -> None:
+    # 2025-01-05 is a Sunday, 2025-01-06 a Monday.
+    counts = bucket_counts(day_counts({"2025-01-05": 1, "2025-01-06": 2, "2025-01-12": 3, "2025-01-27": 4}), "week")
+    assert counts.index.tolist() == stamps("2024-12-30", "2025-01-06", "2025-01-13", "2025-01-20", "2025-01-27")
+    assert counts.tolist() == [1, 5, 0, 0, 4]
+    assert counts.index.name == "published_week"
+
+
+def test_quarters_start_in_january_april_july_october() -> None:
+    counts = bucket_counts(day_counts({"2024-12-31": 1, "2025-01-01": 2, "2025-03-31": 3, "2025-07-15": 4}), "quarter")
+    assert counts.index.tolist() == stamps("2024-10-01", "2025-01-01", "2025-04-01", "2025-07-01")
+    assert counts.tolist() == [1, 5, 0, 4]
+
+
+def test_month_and_day_buckets() -> None:
+    days = day_counts({"2025-01-31": 1, "2025-02-01": 2, "2025-02-03": 3})
+    assert bucket_counts(days, "month").tolist() == [1, 5]
+    assert bucket_counts(days, "day").tolist() == [1, 2, 0, 3]
+    assert bucket_counts(day_counts({}), "week").empty
+
+
+def test_pick_resolution_thresholds() -> None:
+    start = date(2025, 1, 1)
+    assert pick_resolution(start, start + timedelta(days=179), 180) == "day"
+    assert pick_resolution(start, start + timedelta(days=180), 180) == "week"
+    assert pick_resolution(start, start + timedelta(days=7 * 180 - 1), 180) == "week"
+    assert pick_resolution(start, start + timedelta(days=7 * 180), 180) == "month"
+    assert pick_resolution(start, date(2045, 1, 1), 180) == "quarter"
+    assert pick_resolution(start, date(2300, 1, 1), 180) == "quarter"  # coarsest, even beyond max_points
+
+
+def test_utc_dates_filter_and_count_by_day() -> None:
+    df = frame(["2025-01-01T10:00:00Z", "2025-01-03T23:30:00Z", "2025-01-05T00:10:00+01:00"])
+    assert df["published_date"].dt.tz is None
+    assert published_between(df, date(2025, 1, 2), date(2025, 1, 4))["id"].tolist() == [1, 2]
+    assert counts_per_day(df["published_date"]).to_dict() == {
+        pd.Timestamp("2025-01-01"): 1,
+        pd.Timestamp("2025-01-03"): 1,
+        pd.Timestamp("2025-01-04"): 1,
+    }
+
+
+def test_parse_dates_mixed_iso_forms_as_naive_utc() -> None:
+    raw = pd.Series(
+        ["2025-01-01T10:00:00Z", "2025-01-02T11:22:33", "2025-01-02T01:00:00+02:00", "2025-01-03", "bad", None],
+        dtype=object,
+    )
+    parsed = parse_dates(raw)
+    assert parsed.dt.tz is None
+    assert parsed.tolist()[:4] == [
+        pd.Timestamp("2025-01-01 10:00:00"),
+        pd.Timestamp("2025-01-02 11:22:33"),
+        pd.Timestamp("2025-01-01 23:00:00"),
+        pd.Timestamp("2025-01-03"),
+    ]
+    assert parsed[4:].isna().all()
+
+
+def test_dataset_version_memo_is_not_reused_by_derived_frames() -> None:
+    df = frame(["2025-01-01T10:00:00", "2025-01-02T10:00:00", "2025-01-03T10:00:00"])
+    version = dataset_version(df)
+    assert dataset_version(df) == version
+
+    reordered = df.iloc[[2, 1, 0]].reset_index(drop=True)  # attrs are copied along
+    assert reordered.attrs["version"] == version
+    assert dataset_version(reordered) != version
+    assert dataset_version(df.assign(match=0.5)) != version
+    assert dataset_version(df.iloc[:2]) != version
+    assert dataset_version(df.copy()) == version
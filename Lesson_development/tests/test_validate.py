@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from uc01.transform import to_dataframe
+from uc01.validate import CHECKS, frame_report, merge_reports, validate_frame
+
+GROUPS = {1: "Delft", 2: "Twente"}
+
+
+def article(i: int, **fields) -> dict:
+    base = {
+        "id": i,
+        "uuid": f"u{i}",
+        "title": f"t{i}",
+        "doi": f"10.4121/{i}",
+        "published_date": "2025-01-01T10:00:00",
+        "group_id": 1,
+    }
+    return {**base, **fields}
+
+
+def test_counts_what_to_dataframe_coerced_without_dropping_rows() -> None:
+    articles = [
+        article(1),
+        article(2, published_date="not a date"),
+        article(3, published_date=None),
+        article(4, group_id=99),
+        article(5, group_id="2"),
+        article(6, doi=""),
+        article(6, uuid="u1"),  # id 6 again (overlapping pages) with the uuid of id 1
+    ]
+    df = to_dataframe(articles, GROUPS)
+    report = frame_report(df)
+
+    assert len(df) == len(articles)  # nothing is dropped
+    assert report.counts == {
+        "duplicate_ids": 1,
+        "duplicate_uuids": 1,
+        "missing_dates": 1,
+        "unparseable_dates": 1,
+        "unknown_groups": 1,
+        "non_int_group_ids": 1,
+        "missing_dois": 1,
+    }
+    assert report.examples["unparseable_dates"] == [2]
+    assert report.examples["unknown_groups"] == [4]
+    assert report.issues == 7
+    assert df.loc[df["id"] == 4, "group_name"].item() == "Unknown"
+
+
+def test_without_raw_dates_unparseable_cannot_be_told_from_missing() -> None:
+    df = to_dataframe([article(1), article(2, published_date="bad"), article(3, published_date=None)], GROUPS)
+    report = validate_frame(df, known_group_ids=GROUPS)
+    assert report.counts["missing_dates"] == 2
+    assert report.counts["unparseable_dates"] is None
+
+
+def test_clean_and_empty_frames() -> None:
+    assert validate_frame(to_dataframe([article(1), article(2)], GROUPS)).issues == 0
+    assert validate_frame(to_dataframe([], GROUPS)).counts == {name: 0 for name in CHECKS}
+
+
+def test_merge_reports_adds_counts() -> None:
+    a = frame_report(to_dataframe([article(1, doi=None)], GROUPS))
+    b = frame_report(to_dataframe([article(2, doi=None), article(3, published_date="bad")], GROUPS))
+    merged = merge_reports([a, b])
+    assert merged.rows == 3
+    assert merged.counts["missing_dois"] == 2 and merged.counts["unparseable_dates"] == 1
+    assert merged.examples["missing_dois"] == [1, 2]
+    assert isinstance(merged.as_frame(), pd.DataFrame)
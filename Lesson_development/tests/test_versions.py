@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+from _common import synthetic_articles, synthetic_groups
+
+from uc01.transform import build_group_map, to_dataframe
+from uc01.versions import VersionIndex, VersionStore, delta_frame, diff
+
+GROUPS = build_group_map(synthetic_groups())
+
+
+def refreshed(records: list) -> list:
+    """records as a later load returns them: 0-4 removed, 10 and 11 edited, 900-902 new."""
+    out = [dict(r) for r in records[5:]]
+    out[5]["title"] += " (v2)"
+    out[6]["doi"] = "10.0000/edited"
+    return out + [dict(r, id=r["id"] + 900) for r in records[:3]]
+
+
+def test_diff_added_removed_changed() -> None:
+    records = synthetic_articles(200)
+    old = VersionIndex.from_frame(to_dataframe(records, GROUPS))
+    new = VersionIndex.from_frame(to_dataframe(refreshed(records), GROUPS))
+
+    changes = diff(old, new)
+    assert changes.added.tolist() == [900, 901, 902]
+    assert changes.removed.tolist() == [0, 1, 2, 3, 4]
+    assert changes.changed.tolist() == [10, 11]
+    assert old.version != new.version
+
+
+def test_diff_with_the_same_ids_only_compares_hashes() -> None:
+    records = synthetic_articles(200)
+    edited = [dict(r) for r in records]
+    edited[42]["title"] += " (v2)"
+    old = VersionIndex.from_frame(to_dataframe(records, GROUPS))
+    changes = diff(old, VersionIndex.from_frame(to_dataframe(edited, GROUPS)))
+    assert changes.changed.tolist() == [42]
+    assert changes.added.size == changes.removed.size == 0
+
+
+def test_dtype_change_alone_is_not_a_change() -> None:
+    records = synthetic_articles(50)
+    blanked = [dict(r) for r in records]
+    blanked[7]["group_id"] = None  # the group_id column turns float64
+    old = to_dataframe(records, GROUPS)
+    new = to_dataframe(blanked, GROUPS)
+    assert old["group_id"].dtype != new["group_id"].dtype
+
+    changes = diff(VersionIndex.from_frame(old), VersionIndex.from_frame(new))
+    assert changes.added.size == changes.removed.size == 0
+    assert changes.changed.tolist() == [7]
+
+
+def test_delta_frame_rows() -> None:
+    records = synthetic_articles(200)
+    new_df = to_dataframe(refreshed(records), GROUPS)
+    changes = diff(VersionIndex.from_frame(to_dataframe(records, GROUPS)), VersionIndex.from_frame(new_df))
+
+    delta = delta_frame(new_df, changes)
+    by_change = delta.groupby("change")["id"].apply(sorted).to_dict()
+    assert by_change == {"added": [900, 901, 902], "changed": [10, 11], "removed": [0, 1, 2, 3, 4]}
+    assert "group_id" not in delta.columns
+
+
+def test_store_records_each_version_once_and_reloads(tmp_path) -> None:
+    records = synthetic_articles(100)
+    first, second = to_dataframe(records, GROUPS), to_dataframe(refreshed(records), GROUPS)
+
+    store = VersionStore(str(tmp_path))
+    store.record("api:3", first)
+    store.record("api:3", first)
+    assert store.since_previous("api:3") is None
+    store.record("api:3", second)
+    assert len(store.history("api:3")) == 2
+
+    reloaded = VersionStore(str(tmp_path))
+    changes = reloaded.since_previous("api:3")
+    assert changes is not None
+    assert changes.changed.tolist() == [10, 11]
+    assert np.array_equal(reloaded.history("api:3")[-1].ids, VersionIndex.from_frame(second).ids)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from uc01.transform import to_dataframe
+from uc01.view_cache import FilterState, ViewCache, compute_view
+
+GROUPS = {1: "Delft", 2: "Twente"}
+
+
+def frame() -> pd.DataFrame:
+    articles = [
+        {"id": i, "title": title, "published_date": f"2025-01-{day:02d}T12:00:00", "group_id": group}
+        for i, (title, day, group) in enumerate(
+            [
+                ("Wind tunnel data", 1, 1),
+                ("Soil moisture", 2, 2),
+                ("Wind farm wakes", 3, 2),
+                ("River delta survey", 4, 1),
+                ("Offshore wind loads", 5, 1),
+            ]
+        )
+    ]
+    return to_dataframe(articles, GROUPS)
+
+
+def test_normalize_maps_equivalent_widget_values_to_one_state() -> None:
+    start, end = date(2025, 1, 1), date(2025, 1, 31)
+    state = FilterState.normalize("All", start, end, "  Wind ")
+    assert state == FilterState.normalize("All", start, end, "wind")
+    assert state.group is None and state.keyword == "wind"
+    assert FilterState.normalize("Delft", start, None, "").start is None  # half a range is no range
+
+
+def test_repeated_state_is_a_hit() -> None:
+    df = frame()
+    views = ViewCache(max_bytes=2**20)
+    state = FilterState.normalize("Delft", date(2025, 1, 2), date(2025, 1, 5), "")
+
+    first = views.get(df, state)
+    assert views.get(df, FilterState.normalize("Delft", date(2025, 1, 2), date(2025, 1, 5), " ")) is first
+    assert first.positions.tolist() == [3, 4]
+    assert first.group_counts.to_dict() == {"Delft": 2}
+    assert views.stats()["misses"] == 1 and views.stats()["hits"] == 1
+
+
+def test_least_recently_used_view_is_evicted_beyond_budget() -> None:
+    df = frame()
+    a, b, c = (FilterState.normalize(g, None, None, "") for g in ("All", "Delft", "Twente"))
+    views = ViewCache(max_bytes=sum(compute_view(df, s).nbytes for s in (a, b, c)) - 1)
+
+    views.get(df, a)
+    views.get(df, b)
+    views.get(df, a)  # b is now the least recently used
+    views.get(df, c)
+    assert views.stats()["entries"] == 2
+
+    misses = views.stats()["misses"]
+    views.get(df, a)
+    assert views.stats()["misses"] == misses
+    views.get(df, b)
+    assert views.stats()["misses"] == misses + 1
+
+
+def test_keyword_matches_titles_case_insensitively() -> None:
+    view = compute_view(frame(), FilterState.normalize("All", None, None, "WIND"))
+    assert np.array_equal(view.positions, [0, 2, 4])
+
+
+def test_fuzzy_threshold_only_applies_with_a_keyword() -> None:
+    assert FilterState.normalize("All", None, None, "", fuzzy=0.6).fuzzy == 0.0
+    assert FilterState.normalize("All", None, None, "wnid", fuzzy=0.555).fuzzy == 0.56
+    view = compute_view(frame(), FilterState.normalize("All", None, None, "wnid tunel", fuzzy=0.3))
+    assert view.positions[0] == 0
+
+
+def test_keyword_view_is_built_on_the_cached_view_without_keyword() -> None:
+    df = frame()
+    views = ViewCache(max_bytes=2**20)
+    base_state = FilterState.normalize("Delft", None, None, "")
+    base = views.get(df, base_state)
+
+    view = views.get(df, FilterState.normalize("Delft", None, None, "wind"))
+    assert view.positions.tolist() == [0, 4]
+    assert views.stats() == {"entries": 2, "bytes": base.nbytes + view.nbytes, "hits": 1, "misses": 2}
+
+    # A keyword on a state not cached yet computes and keeps both stages.
+    views.get(df, FilterState.normalize("Twente", None, None, "wind"))
+    assert views.stats()["entries"] == 4 and views.stats()["misses"] == 4
+    assert views.get(df, FilterState.normalize("Twente", None, None, "")).positions.tolist() == [1, 2]
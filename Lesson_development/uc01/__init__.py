@@ -0,0 +1,21 @@
+"""Helpers behind the UC01 4TU.ResearchData monitoring dashboard.
+
+``lesson_complex_code.py`` keeps the Streamlit layout; the API client,
+transformations and serving infrastructure live here so that separate
+processes (snapshot loader, tools) can reuse them without importing Streamlit.
+"""
+
+from .client import get_article, get_articles_page, get_groups, get_recent_articles, headers
+from .pipeline import load_articles_frame
+from .transform import build_group_map, to_dataframe
+
+__all__ = [
+    "build_group_map",
+    "get_article",
+    "get_articles_page",
+    "get_groups",
+    "get_recent_articles",
+    "headers",
+    "load_articles_frame",
+    "to_dataframe",
+]
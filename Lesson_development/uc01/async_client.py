@@ -0,0 +1,163 @@
+"""asyncio variant of the client functions in uc01/client.py.
+
+One AsyncClient owns an httpx connection pool and a semaphore that caps the
+number of requests in flight across every task using it; all requests also
+share the process-wide budget in uc01/ratelimit.py. Independent fetches
+(groups, article pages, several item types) run concurrently; if one of them
+fails the others are cancelled instead of running to completion.
+
+With FOURTU_HTTP2=1 (and the h2 package installed) those concurrent requests
+are multiplexed as streams over a single HTTP/2 connection instead of one
+HTTP/1.1 connection each; responses are decompressed by httpx either way.
+benchmarks/bench_http2.py compares the two against a local server.
+
+    async with AsyncClient() as client:
+        groups, articles = await gather_or_cancel(
+            client.get_groups(),
+            client.get_recent_articles(item_type=3, published_since="2025-01-01", page_size=1000, max_pages=3),
+        )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Awaitable, Dict, List, Optional
+
+import httpx
+
+from .client import headers
+from .config import BASE_URL, HTTP2, MAX_CONCURRENCY, TIMEOUT
+from .ratelimit import LIMITER
+from .raw_store import record, replay
+
+try:
+    import h2  # noqa: F401  (what httpx needs for HTTP/2)
+except ImportError:  # optional dependency
+    h2 = None
+
+
+async def gather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """Like asyncio.gather, but cancel the remaining awaitables on the first error."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return list(await asyncio.gather(*tasks))
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class AsyncClient:
+    def __init__(self, *, max_concurrency: int = MAX_CONCURRENCY, http2: bool = HTTP2) -> None:
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.http2 = http2 and h2 is not None
+        self._http = httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers=headers(),
+            timeout=TIMEOUT,
+            http2=self.http2,
+            http1=not (self.http2 and BASE_URL.startswith("http://")),
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def _get_bytes(self, path: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        url = f"{BASE_URL}{path}"
+        # The raw store reads and writes files: keep that off the event loop.
+        body = await asyncio.to_thread(replay, url, params)
+        if body is None:
+            async with self._semaphore, LIMITER.aslot():
+                r = await self._http.get(path, params=params)
+            r.raise_for_status()
+            body = r.content
+            await asyncio.to_thread(record, url, params, body)
+        return body
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        return json.loads(await self._get_bytes(path, params))
+
+    async def get_groups(self) -> List[Dict[str, Any]]:
+        """GET /v3/groups"""
+        data = await self._get_json("/v3/groups")
+        return data if isinstance(data, list) else []
+
+    async def get_articles_page(
+        self,
+        *,
+        item_type: int,
+        published_since: str,
+        limit: int,
+        offset: int,
+    ) -> List[Dict[str, Any]]:
+        """GET /v2/articles (paged)"""
+        body = await self.get_articles_page_bytes(
+            item_type=item_type, published_since=published_since, limit=limit, offset=offset
+        )
+        data = json.loads(body)
+        return data if isinstance(data, list) else []
+
+    async def get_articles_page_bytes(
+        self,
+        *,
+        item_type: int,
+        published_since: str,
+        limit: int,
+        offset: int,
+    ) -> bytes:
+        """GET /v2/articles (paged), the response body undecoded (see uc01/parallel.py)."""
+        params = {
+            "item_type": item_type,
+            "published_since": published_since,
+            "limit": limit,
+            "offset": offset,
+        }
+        return await self._get_bytes("/v2/articles", params)
+
+    async def get_article(self, article_id: int) -> Dict[str, Any]:
+        """GET /v2/articles/{id}"""
+        data = await self._get_json(f"/v2/articles/{article_id}")
+        return data if isinstance(data, dict) else {}
+
+    async def get_recent_articles(
+        self,
+        *,
+        item_type: int,
+        published_since: str,
+        page_size: int,
+        max_pages: int,
+    ) -> List[Dict[str, Any]]:
+        """Fetch up to max_pages of articles using limit/offset.
+
+        The first page is fetched alone; only if it is full are the remaining
+        pages requested concurrently. Pages after the first short one are
+        dropped, matching the sequential client.
+        """
+
+        def page(n: int) -> Awaitable[List[Dict[str, Any]]]:
+            return self.get_articles_page(
+                item_type=item_type,
+                published_since=published_since,
+                limit=page_size,
+                offset=n * page_size,
+            )
+
+        first = await page(0)
+        if len(first) < page_size or max_pages <= 1:
+            return first
+
+        all_items = list(first)
+        for batch in await gather_or_cancel(*(page(n) for n in range(1, max_pages))):
+            all_items.extend(batch)
+            if len(batch) < page_size:
+                break
+        return all_items
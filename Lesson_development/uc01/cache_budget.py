@@ -0,0 +1,169 @@
+"""One byte budget for the large process-wide caches.
+
+Loaded frames, combined frames, fuzzy title indexes and raw article listings
+are kept in a single CacheManager, each kind under its own namespace. Every
+entry is stored with its deep size in bytes (deep_size); once the total
+exceeds UC01_CACHE_MB, entries are evicted across all namespaces:
+
+    lru   least recently used first (default)
+    lfu   fewest hits first, least recently used among equals
+
+so one kind of entry can no longer grow without bound while another is
+starved. The newest entry is always kept, even if it alone exceeds the
+budget, so a large dataset is still served from memory. Per-namespace entry
+counts, bytes, hit rates and evictions are shown in the dashboard's
+Diagnostics.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+from .config import CACHE_MB, CACHE_POLICY
+
+POLICIES = ("lru", "lfu")
+SAMPLE_RECORDS = 256
+
+
+def sizeof_records(records: List[Dict[str, Any]]) -> int:
+    """Approximate deep size of a list of flat JSON records, from a sample."""
+    if not records:
+        return sys.getsizeof(records)
+    step = max(1, len(records) // SAMPLE_RECORDS)
+    sample = records[::step]
+    per_record = sum(
+        sys.getsizeof(r) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in r.items()) for r in sample
+    ) / len(sample)
+    return sys.getsizeof(records) + int(per_record * len(records))
+
+
+def deep_size(value: Any) -> int:
+    """Bytes held by a cached value (frames deep, including object/string columns)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if hasattr(value, "nbytes"):  # numpy arrays, TrigramIndex, View, Listing
+        return int(value.nbytes)
+    if isinstance(value, list):
+        return sizeof_records(value)
+    return sys.getsizeof(value)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    nbytes: int
+    hits: int = 0
+
+
+class CacheManager:
+    def __init__(self, max_bytes: int, policy: str = "lru") -> None:
+        if policy not in POLICIES:
+            raise ValueError(f"unknown cache policy {policy!r}; expected one of {POLICIES}")
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._loading: Dict[Tuple[str, Hashable], threading.Lock] = {}
+        self._bytes = 0
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, namespace: str, name: str) -> None:
+        counters = self._counters.setdefault(namespace, {"hits": 0, "misses": 0, "evictions": 0})
+        counters[name] += 1
+
+    def _victim(self) -> Tuple[str, Hashable]:
+        if self.policy == "lfu":
+            # OrderedDict order is recency, so min() keeps the least recent among equal hit counts.
+            return min(self._entries, key=lambda k: self._entries[k].hits)
+        return next(iter(self._entries))
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            key = self._victim()
+            entry = self._entries.pop(key)
+            self._bytes -= entry.nbytes
+            self._count(key[0], "evictions")
+
+    def get(self, namespace: str, key: Hashable) -> Optional[Any]:
+        """The cached value or None; counts a hit or a miss."""
+        with self._lock:
+            entry = self._entries.get((namespace, key))
+            if entry is None:
+                self._count(namespace, "misses")
+                return None
+            self._entries.move_to_end((namespace, key))
+            entry.hits += 1
+            self._count(namespace, "hits")
+            return entry.value
+
+    def put(self, namespace: str, key: Hashable, value: Any, nbytes: Optional[int] = None) -> None:
+        """Store value (replacing any entry under key), then evict down to the budget."""
+        entry = _Entry(value=value, nbytes=deep_size(value) if nbytes is None else nbytes)
+        with self._lock:
+            old = self._entries.pop((namespace, key), None)
+            if old is not None:
+                self._bytes -= old.nbytes
+                entry.hits = old.hits
+            self._entries[(namespace, key)] = entry
+            self._bytes += entry.nbytes
+            self._evict()
+
+    def get_or_load(self, namespace: str, key: Hashable, load: Callable[[], Any]) -> Any:
+        """Cached value, or load() stored; concurrent callers of one key load it once."""
+        value = self.get(namespace, key)
+        if value is not None:
+            return value
+        with self._lock:
+            loading = self._loading.setdefault((namespace, key), threading.Lock())
+        with loading:
+            with self._lock:
+                entry = self._entries.get((namespace, key))
+            if entry is not None:  # loaded by the caller we waited for
+                return entry.value
+            value = load()
+            self.put(namespace, key, value)
+        with self._lock:
+            self._loading.pop((namespace, key), None)
+        return value
+
+    def items(self, namespace: str) -> List[Tuple[Hashable, Any]]:
+        """(key, value) of every entry in namespace, without touching recency or hit counts."""
+        with self._lock:
+            return [(k, e.value) for (ns, k), e in self._entries.items() if ns == namespace]
+
+    def discard(self, namespace: str, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop((namespace, key), None)
+            if entry is not None:
+                self._bytes -= entry.nbytes
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out: Dict[str, Any] = {
+                "policy": self.policy,
+                "budget_mb": round(self.max_bytes / 2**20, 1),
+                "used_mb": round(self._bytes / 2**20, 1),
+            }
+            namespaces = sorted({ns for ns, _ in self._entries} | set(self._counters))
+            for ns in namespaces:
+                entries = [e for (n, _), e in self._entries.items() if n == ns]
+                counters = self._counters.get(ns, {"hits": 0, "misses": 0, "evictions": 0})
+                lookups = counters["hits"] + counters["misses"]
+                out[ns] = {
+                    "entries": len(entries),
+                    "mb": round(sum(e.nbytes for e in entries) / 2**20, 2),
+                    **counters,
+                    "hit_rate": round(counters["hits"] / lookups, 3) if lookups else None,
+                }
+            return out
+
+
+CACHE = CacheManager(max_bytes=CACHE_MB * 1024 * 1024, policy=CACHE_POLICY)
@@ -0,0 +1,88 @@
+"""Tiny, readable client functions for the 4TU.ResearchData API."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+import requests
+
+from .config import BASE_URL, TIMEOUT, TOKEN
+from .ratelimit import LIMITER
+from .raw_store import record, replay
+
+# One pooled session per process so repeated page requests reuse connections.
+_session = requests.Session()
+
+
+def headers() -> Dict[str, str]:
+    h = {"Accept": "application/json"}
+    if TOKEN:
+        h["Authorization"] = f"token {TOKEN}"
+    return h
+
+
+def get_json(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """GET BASE_URL + path within the process-wide request budget."""
+    url = f"{BASE_URL}{path}"
+    body = replay(url, params)
+    if body is None:
+        with LIMITER.slot():
+            r = _session.get(url, headers=headers(), params=params, timeout=TIMEOUT)
+        r.raise_for_status()
+        body = r.content
+        record(url, params, body)
+    return json.loads(body)
+
+
+def get_groups() -> List[Dict[str, Any]]:
+    """GET /v3/groups"""
+    data = get_json("/v3/groups")
+    return data if isinstance(data, list) else []
+
+
+def get_articles_page(
+    *,
+    item_type: int,
+    published_since: str,
+    limit: int,
+    offset: int,
+) -> List[Dict[str, Any]]:
+    """GET /v2/articles (paged)"""
+    params = {
+        "item_type": item_type,
+        "published_since": published_since,
+        "limit": limit,
+        "offset": offset,
+    }
+    data = get_json("/v2/articles", params)
+    return data if isinstance(data, list) else []
+
+
+def get_article(article_id: int) -> Dict[str, Any]:
+    """GET /v2/articles/{id}"""
+    data = get_json(f"/v2/articles/{article_id}")
+    return data if isinstance(data, dict) else {}
+
+
+def get_recent_articles(
+    *,
+    item_type: int,
+    published_since: str,
+    page_size: int,
+    max_pages: int,
+) -> List[Dict[str, Any]]:
+    """Fetch up to max_pages of articles using limit/offset."""
+    all_items: List[Dict[str, Any]] = []
+    for page in range(max_pages):
+        offset = page * page_size
+        batch = get_articles_page(
+            item_type=item_type,
+            published_since=published_since,
+            limit=page_size,
+            offset=offset,
+        )
+        all_items.extend(batch)
+        if len(batch) < page_size:
+            break
+    return all_items
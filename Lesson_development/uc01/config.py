@@ -0,0 +1,77 @@
+"""Environment-driven settings shared by the dashboard and its helper tools."""
+
+from __future__ import annotations
+
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()  # reads .env if present
+
+BASE_URL = os.getenv("FOURTU_BASE_URL", "https://data.4tu.nl").rstrip("/")
+TIMEOUT = int(os.getenv("FOURTU_TIMEOUT", "30"))
+TOKEN = os.getenv("FOURTU_TOKEN", "").strip()  # optional for public monitoring
+
+# Upstream budget enforced by uc01/ratelimit.py: a token bucket of FOURTU_BURST
+# requests refilled at FOURTU_RATE per second, and at most
+# FOURTU_MAX_CONCURRENCY requests in flight per process.
+RATE = float(os.getenv("FOURTU_RATE", "5"))
+BURST = int(os.getenv("FOURTU_BURST", "10"))
+MAX_CONCURRENCY = int(os.getenv("FOURTU_MAX_CONCURRENCY", "4"))
+
+# FOURTU_HTTP2=1: the async client (concurrent loads, article details) speaks
+# HTTP/2 and multiplexes its requests over one connection (needs the h2
+# package). On plain http:// URLs HTTP/2 is used with prior knowledge (h2c).
+HTTP2 = os.getenv("FOURTU_HTTP2", "").strip().lower() in ("1", "true", "yes")
+
+# Optional raw response store (uc01/raw_store.py): keep every response body
+# under FOURTU_RAW_STORE, and with FOURTU_REPLAY=1 serve them instead of the API.
+RAW_STORE_DIR = os.getenv("FOURTU_RAW_STORE", "").strip()
+REPLAY = os.getenv("FOURTU_REPLAY", "").strip().lower() in ("1", "true", "yes")
+
+# Directory for cached per-article details (uc01/enrich.py); empty keeps them in memory.
+DETAIL_CACHE_DIR = os.getenv("UC01_DETAIL_CACHE", "").strip()
+
+# Rows of a result that "Add article details" looks up (one request each);
+# the rest are shown without details until the filters narrow the result.
+ENRICH_MAX_ROWS = int(os.getenv("UC01_ENRICH_MAX_ROWS", "25"))
+
+# Shared byte budget and eviction policy ("lru" or "lfu") of the cached frames,
+# title indexes and article listings (uc01/cache_budget.py).
+CACHE_MB = int(os.getenv("UC01_CACHE_MB", "1024"))
+CACHE_POLICY = os.getenv("UC01_CACHE_POLICY", "lru").strip().lower()
+
+# Byte budget of the process-wide filtered-view cache (uc01/view_cache.py).
+VIEW_CACHE_MB = int(os.getenv("UC01_VIEW_CACHE_MB", "64"))
+
+# Append-only trend history of per-group daily counts (uc01/history.py).
+HISTORY_DIR = os.getenv("UC01_HISTORY_DIR", "").strip()
+
+# Worker processes that turn downloaded article pages into columnar batches
+# (uc01/parallel.py); 0 transforms them in the loading process.
+TRANSFORM_WORKERS = int(os.getenv("UC01_TRANSFORM_WORKERS", "0"))
+
+# Per-row content hashes of every loaded version, for "new since last refresh"
+# and delta exports (uc01/versions.py); empty keeps them in memory only.
+VERSIONS_DIR = os.getenv("UC01_VERSIONS_DIR", "").strip()
+
+# Seconds between background reloads of the frames the dashboard has cached
+# (uc01/refresh.py), at background priority; 0 reloads only on "Refresh now".
+REFRESH_INTERVAL = int(os.getenv("UC01_REFRESH_INTERVAL", "0"))
+
+# Seconds the dashboard keeps the shared /v3/groups map before refetching it.
+GROUPS_TTL = int(os.getenv("UC01_GROUPS_TTL", "3600"))
+
+# On-disk Parquet dataset written page by page by uc01/ingest.py.
+DATASET_DIR = os.getenv("UC01_DATASET_DIR", "").strip()
+
+# Most bars the publication-date chart draws; coarser buckets are used beyond it.
+CHART_POINTS = int(os.getenv("UC01_CHART_POINTS", "180"))
+
+DEFAULT_PUBLISHED_SINCE = os.getenv("UC01_PUBLISHED_SINCE", "2025-01-01")
+DEFAULT_PAGE_SIZE = int(os.getenv("UC01_PAGE_SIZE", "11754"))
+DEFAULT_MAX_PAGES = int(os.getenv("UC01_MAX_PAGES", "3"))
+
+# Directory where a loader process publishes shared Arrow snapshots
+# (see uc01/snapshot.py). Empty means every worker loads from the API itself.
+SNAPSHOT_DIR = os.getenv("UC01_SNAPSHOT_DIR", "").strip()
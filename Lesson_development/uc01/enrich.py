@@ -0,0 +1,168 @@
+"""Per-article detail enrichment (authors, license, size, categories, files).
+
+The listing endpoint only carries a few fields; the rest needs one
+GET /v2/articles/{id} per article. Those calls run concurrently through the
+async client with bounded parallelism, and each extracted detail is cached by
+(id, modified_date): a later enrichment only re-fetches articles that are new
+or changed. Set UC01_DETAIL_CACHE=<dir> to keep the cache across restarts.
+
+Only the first UC01_ENRICH_MAX_ROWS rows of a result are looked up, so a
+large result cannot hold a session for minutes. An article the API will not
+return (deleted, embargoed, a failed request, or with FOURTU_REPLAY one that
+was never recorded) gets empty details and is not cached; it is tried again
+on the next enrichment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+import pandas as pd
+
+from .async_client import AsyncClient
+from .cache_budget import CACHE as BUDGET
+from .cache_budget import CacheManager, sizeof_records
+from .config import DETAIL_CACHE_DIR, ENRICH_MAX_ROWS
+
+DETAIL_COLUMNS = ["authors", "license", "size", "categories", "files"]
+
+
+def extract_details(article: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten the detail fields the dashboard shows."""
+    authors = article.get("authors") or []
+    categories = article.get("categories") or []
+    license_ = article.get("license") or {}
+    return {
+        "authors": "; ".join(a.get("full_name", "") for a in authors if isinstance(a, dict)),
+        "license": license_.get("name") if isinstance(license_, dict) else license_,
+        "size": article.get("size"),
+        "categories": "; ".join(c.get("title", "") for c in categories if isinstance(c, dict)),
+        "files": len(article.get("files") or []),
+    }
+
+
+class DetailCache:
+    """Extracted details keyed by article id, valid for one modified_date.
+
+    Entries are held in the "details" namespace of the shared cache budget
+    (uc01/cache_budget.py). With a directory, each entry is also written there
+    as <id>.json and read back after an eviction or a restart.
+    """
+
+    NAMESPACE = "details"
+
+    def __init__(self, directory: str = "", cache: CacheManager = BUDGET) -> None:
+        self.directory = Path(directory) if directory else None
+        self.cache = cache
+
+    def get(self, article_id: int, modified: str) -> Optional[Dict[str, Any]]:
+        entry = self.cache.get(self.NAMESPACE, article_id)
+        if entry is None and self.directory is not None:
+            try:
+                stored = json.loads((self.directory / f"{article_id}.json").read_text())
+                entry = (stored["modified"], stored["details"])
+            except (FileNotFoundError, ValueError, KeyError):
+                return None
+            self.cache.put(self.NAMESPACE, article_id, entry, nbytes=_entry_size(entry))
+        if entry is None or entry[0] != modified:
+            return None
+        return entry[1]
+
+    def put(self, article_id: int, modified: str, details: Dict[str, Any]) -> None:
+        """Store the entry; with a directory, also write it (blocking: call off the event loop)."""
+        entry = (modified, details)
+        self.cache.put(self.NAMESPACE, article_id, entry, nbytes=_entry_size(entry))
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{article_id}.json"
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w") as fh:
+                json.dump({"modified": modified, "details": details}, fh)
+            os.replace(tmp, path)  # a reader sees the old entry or the new one, never half of it
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+
+def _entry_size(entry: Tuple[str, Dict[str, Any]]) -> int:
+    modified, details = entry
+    return sys.getsizeof(modified) + sizeof_records([details])
+
+
+CACHE = DetailCache(DETAIL_CACHE_DIR)
+
+async def fetch_details_async(
+    keys: Iterable[Tuple[int, str]],
+    *,
+    max_parallel: int,
+    cache: DetailCache = CACHE,
+) -> Dict[int, Dict[str, Any]]:
+    """Details for (id, modified) pairs; only cache misses hit the API.
+
+    Articles whose request fails are left out of the result.
+    """
+    keys = list(keys)
+    # Misses may read the cache directory; keep that file I/O off the event loop.
+    hits = await asyncio.to_thread(lambda: [cache.get(article_id, modified) for article_id, modified in keys])
+    out: Dict[int, Dict[str, Any]] = {}
+    missing: List[Tuple[int, str]] = []
+    for (article_id, modified), hit in zip(keys, hits):
+        if hit is None:
+            missing.append((article_id, modified))
+        else:
+            out[article_id] = hit
+
+    if missing:
+        async with AsyncClient(max_concurrency=max_parallel) as client:
+
+            async def one(article_id: int, modified: str) -> None:
+                try:
+                    article = await client.get_article(article_id)
+                # One missing article must not sink the others; LookupError: not recorded (FOURTU_REPLAY).
+                except (httpx.HTTPError, ValueError, LookupError):
+                    return
+                details = extract_details(article)
+                await asyncio.to_thread(cache.put, article_id, modified, details)
+                out[article_id] = details
+
+            await asyncio.gather(*(one(article_id, modified) for article_id, modified in missing))
+    return out
+
+
+def enrich_frame(
+    df: pd.DataFrame,
+    *,
+    max_rows: int = ENRICH_MAX_ROWS,
+    max_parallel: int = 8,
+    cache: DetailCache = CACHE,
+) -> pd.DataFrame:
+    """Return df with DETAIL_COLUMNS added from the per-article endpoint.
+
+    Only the first max_rows rows with an id are looked up; the others get
+    empty details. attrs["details_missing"] counts the looked-up rows whose
+    request failed (they are retried by the next call).
+    """
+    if df.empty:
+        out = df.assign(**{c: pd.Series(dtype=object) for c in DETAIL_COLUMNS})
+        out.attrs["details_missing"] = 0
+        return out
+
+    # Rows without an id (counted by uc01/validate.py) cannot be looked up.
+    ids = pd.to_numeric(df["id"], errors="coerce").astype("Int64").tolist()
+    modified = df["modified_date"].astype(str).tolist() if "modified_date" in df.columns else [""] * len(ids)
+    keys = [(i, m) for i, m in zip(ids, modified) if i is not pd.NA][:max_rows]
+    details = asyncio.run(fetch_details_async(keys, max_parallel=max_parallel, cache=cache))
+
+    extra = pd.DataFrame([details.get(i, {}) for i in ids], columns=DETAIL_COLUMNS, index=df.index)
+    out = pd.concat([df.drop(columns=DETAIL_COLUMNS, errors="ignore"), extra], axis=1)
+    out.attrs["details_missing"] = len({i for i, _ in keys} - details.keys())
+    return out
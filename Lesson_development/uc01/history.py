@@ -0,0 +1,237 @@
+"""Append-only history of per-group daily counts, for trend monitoring.
+
+After each sync the dashboard (and the snapshot loader) appends one small
+Parquet part with the number of items per (item_type, group, publication day)
+in the loaded data. Trend charts read only these aggregates, never the raw
+articles, so months of history cost a few kilobytes and no re-download.
+
+Each part also records which days it covers: for each item type, from the
+load's published_since to the day of the sync. A complete load has every
+item of those days, so its counts replace all earlier counts of them,
+including groups it did not report (renamed or removed); days outside the
+window keep their earlier counts. Only complete loads are recorded: a load
+cut off at its row limit holds part of some days' items, and its counts
+would overwrite the correct ones.
+
+    UC01_HISTORY_DIR=history streamlit run lesson_complex_code.py
+    python -m uc01.history --compact     # merge parts into one file
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .config import HISTORY_DIR
+
+SCHEMA = pa.schema(
+    [
+        ("synced_at", pa.timestamp("us", tz="UTC")),
+        ("item_type", pa.int16()),
+        ("group_name", pa.dictionary(pa.int32(), pa.string())),
+        ("day", pa.date32()),
+        ("count", pa.int32()),
+    ]
+)
+
+COVERAGE_KEY = b"uc01.covers"  # Parquet metadata: JSON list of {item_type, first, last, synced_at}
+
+_lock = threading.Lock()
+_loaded: dict = {}
+
+
+def daily_group_counts(df: pd.DataFrame, item_type: Optional[int] = None) -> pd.DataFrame:
+    """Counts per (item_type, group_name, day) of the rows in df."""
+    dated = df[df["published_date"].notna()]
+    item_types = dated["item_type"] if "item_type" in dated.columns else pd.Series(item_type, index=dated.index)
+    counts = (
+        pd.DataFrame(
+            {
+                "item_type": item_types.to_numpy(),
+                "group_name": dated["group_name"].fillna("Unknown").to_numpy(),
+                "day": dated["published_date"].to_numpy().astype("datetime64[D]"),
+            }
+        )
+        .groupby(["item_type", "group_name", "day"], observed=True)
+        .size()
+        .rename("count")
+        .reset_index()
+    )
+    return counts
+
+
+def record_sync(
+    df: pd.DataFrame,
+    *,
+    item_type: Optional[int] = None,
+    published_since: Optional[str] = None,
+    limit: Optional[int] = None,
+    directory: str = HISTORY_DIR,
+    synced_at: Optional[datetime] = None,
+) -> Optional[Path]:
+    """Append the daily counts of a freshly loaded frame; no-op without a directory.
+
+    limit is the load's row limit (page_size * max_pages). A frame that
+    reached it may be truncated (the last page was full) and is not recorded.
+    published_since is where the load started; without it the sync covers
+    the days from the frame's first publication day.
+    """
+    if not directory or df.empty or (limit is not None and len(df) >= limit):
+        return None
+    synced_at = synced_at or datetime.now(timezone.utc)
+    counts = daily_group_counts(df, item_type).assign(synced_at=synced_at)
+    table = pa.Table.from_pandas(counts, preserve_index=False).select(SCHEMA.names).cast(SCHEMA)
+    if published_since is not None:
+        first = pd.Timestamp(published_since).date()
+    elif not counts.empty:
+        first = pd.Timestamp(counts["day"].min()).date()
+    else:
+        first = None
+    if first is not None:
+        item_types = [item_type] if item_type is not None else sorted(counts["item_type"].unique().tolist())
+        covers = [
+            {
+                "item_type": int(t),
+                "first": first.isoformat(),
+                "last": synced_at.date().isoformat(),
+                "synced_at": synced_at.isoformat(),
+            }
+            for t in item_types
+        ]
+        table = table.replace_schema_metadata({COVERAGE_KEY: json.dumps(covers)})
+
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+    types = "_".join(str(t) for t in sorted(counts["item_type"].unique()))
+    path = root / f"part-{synced_at:%Y%m%dT%H%M%S%f}-{types}.parquet"
+    tmp = path.with_name(f".{path.name}.tmp")
+    pq.write_table(table, tmp, compression="zstd")
+    tmp.replace(path)
+    return path
+
+
+def _parts(directory: str) -> Tuple[Path, ...]:
+    return tuple(sorted(Path(directory).glob("part-*.parquet")))
+
+
+def _coverage(parts: Sequence[Path]) -> List[Dict[str, Any]]:
+    """Covered day ranges of all parts (parts written before coverage was recorded have none)."""
+    covers: List[Dict[str, Any]] = []
+    for p in parts:
+        metadata = pq.read_schema(p).metadata or {}
+        if COVERAGE_KEY in metadata:
+            covers.extend(json.loads(metadata[COVERAGE_KEY]))
+    return covers
+
+
+def _latest(parts: Sequence[Path]) -> Tuple[pd.DataFrame, List[Dict[str, Any]]]:
+    """Each key's latest count with its synced_at, minus keys a later covering sync did not report."""
+    table = pa.concat_tables([pq.read_table(p, schema=SCHEMA) for p in parts])
+    latest = (
+        table.to_pandas()
+        .sort_values("synced_at", kind="stable")
+        .drop_duplicates(["item_type", "group_name", "day"], keep="last")
+    )
+    covers = _coverage(parts)
+    if covers and not latest.empty:
+        days = latest["day"].to_numpy(dtype="datetime64[D]")
+        item_types = latest["item_type"].to_numpy()
+        reported = latest["synced_at"]
+        stale = np.zeros(len(latest), dtype=bool)
+        for c in covers:
+            covered = (
+                (item_types == c["item_type"])
+                & (days >= np.datetime64(c["first"], "D"))
+                & (days <= np.datetime64(c["last"], "D"))
+            )
+            stale |= covered & (reported < pd.Timestamp(c["synced_at"])).to_numpy()
+        latest = latest[~stale]
+    return latest, covers
+
+
+def load_history(directory: str = HISTORY_DIR) -> pd.DataFrame:
+    """Latest known count per (item_type, group_name, day) across all syncs."""
+    parts = _parts(directory) if directory else ()
+    if not parts:
+        return pd.DataFrame(columns=["item_type", "group_name", "day", "count"])
+
+    with _lock:
+        cached = _loaded.get(directory)
+        if cached and cached[0] == parts:
+            return cached[1]
+
+    latest, _ = _latest(parts)
+    history = latest.drop(columns="synced_at").sort_values(["item_type", "group_name", "day"], ignore_index=True)
+    history["day"] = pd.to_datetime(history["day"])
+    with _lock:
+        _loaded[directory] = (parts, history)
+    return history
+
+
+def trend_frame(
+    history: pd.DataFrame,
+    *,
+    item_types: Optional[Sequence[int]] = None,
+    group: Optional[str] = None,
+    freq: str = "MS",
+    cumulative: bool = False,
+) -> pd.DataFrame:
+    """Items per period (rows) and group (columns), optionally cumulative."""
+    h = history
+    if item_types is not None:
+        h = h[h["item_type"].isin(item_types)]
+    if group is not None:
+        h = h[h["group_name"] == group]
+    if h.empty:
+        return pd.DataFrame()
+    out = (
+        h.groupby([pd.Grouper(key="day", freq=freq), "group_name"], observed=True)["count"]
+        .sum()
+        .unstack("group_name", fill_value=0)
+        .asfreq(freq, fill_value=0)
+    )
+    out.index.name = "period"
+    return out.cumsum() if cumulative else out
+
+
+def compact(directory: str = HISTORY_DIR) -> Optional[Path]:
+    """Merge all parts into one, keeping only each key's latest count."""
+    parts = _parts(directory)
+    if len(parts) < 2:
+        return None
+    latest, covers = _latest(parts)
+    merged = pa.Table.from_pandas(latest, preserve_index=False).select(SCHEMA.names).cast(SCHEMA)
+    if covers:
+        merged = merged.replace_schema_metadata({COVERAGE_KEY: json.dumps(covers)})
+    path = parts[-1].with_name(parts[-1].name.replace(".parquet", "-compacted.parquet"))
+    tmp = path.with_name(f".{path.name}.tmp")
+    pq.write_table(merged, tmp, compression="zstd")
+    tmp.replace(path)
+    for p in parts:
+        p.unlink()
+    return path
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspect or compact the UC01 trend history.")
+    parser.add_argument("--dir", default=HISTORY_DIR, help="history directory (default: $UC01_HISTORY_DIR)")
+    parser.add_argument("--compact", action="store_true", help="merge all parts into one file")
+    args = parser.parse_args(argv)
+    if not args.dir:
+        parser.error("set --dir or UC01_HISTORY_DIR")
+    if args.compact:
+        print(compact(args.dir) or "nothing to compact")
+    print(trend_frame(load_history(args.dir)).tail(12))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""Bounded-memory ingestion into an on-disk Parquet dataset, and lazy queries.
+
+get_recent_articles keeps every record in a list and to_dataframe copies it
+once more, so peak memory is about twice the corpus. Here each page is turned
+into an Arrow record batch as soon as it arrives, appended to a Parquet file
+as its own row group and dropped, so ingest memory is bounded by one page.
+
+    UC01_DATASET_DIR=data python -m uc01.ingest --item-type 3 --item-type 9
+
+The dashboard then reads the dataset lazily: filters are pushed down to the
+Parquet scan and only the matching rows (and needed columns) are materialized,
+once per filter state until the files change (see query_dataset).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .cache_budget import CACHE, CacheManager
+from .client import get_articles_page, get_groups
+from .config import DATASET_DIR, DEFAULT_PUBLISHED_SINCE
+from .ratelimit import BACKGROUND, priority
+from .transform import build_group_map, modified_date, parse_dates, sort_by_published
+
+ARTICLE_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("title", pa.string()),
+        ("published_date", pa.timestamp("us")),
+        ("group_id", pa.int64()),
+        ("group_name", pa.string()),
+        ("doi", pa.string()),
+        ("uuid", pa.string()),
+        ("url", pa.string()),
+        ("modified_date", pa.string()),
+        ("item_type", pa.int16()),
+    ]
+)
+
+
+def _ints(values: List[Any]) -> pa.Array:
+    return pa.array([v if isinstance(v, int) else None for v in values], type=pa.int64())
+
+
+def _strings(values: List[Any]) -> pa.Array:
+    return pa.array([v if isinstance(v, str) else None for v in values], type=pa.string())
+
+
+def page_to_batch(articles: List[Dict[str, Any]], group_map: Dict[int, str], item_type: int) -> pa.RecordBatch:
+    """Columnar version of to_dataframe for one page."""
+    group_ids = [a.get("group_id") for a in articles]
+    published = parse_dates(pd.Series([a.get("published_date") for a in articles], dtype=object))
+    return pa.RecordBatch.from_arrays(
+        [
+            _ints([a.get("id") for a in articles]),
+            _strings([a.get("title") for a in articles]),
+            pa.array(published.to_numpy(dtype="datetime64[us]"), type=pa.timestamp("us"), mask=published.isna().to_numpy()),
+            _ints(group_ids),
+            _strings([group_map.get(gid, "Unknown") for gid in group_ids]),
+            _strings([a.get("doi") for a in articles]),
+            _strings([a.get("uuid") for a in articles]),
+            _strings([a.get("url") for a in articles]),
+            _strings([modified_date(a) for a in articles]),
+            pa.array([item_type] * len(articles), type=pa.int16()),
+        ],
+        schema=ARTICLE_SCHEMA,
+    )
+
+
+def dataset_path(item_type: int, directory: str = DATASET_DIR) -> Path:
+    return Path(directory) / f"articles_item_type_{item_type}.parquet"
+
+
+def ingest_item_type(
+    *,
+    item_type: int,
+    published_since: str,
+    page_size: int,
+    max_pages: int,
+    directory: str = DATASET_DIR,
+    group_map: Optional[Dict[int, str]] = None,
+) -> int:
+    """Stream pages into dataset_path(item_type); return the number of rows written."""
+    if group_map is None:
+        group_map = build_group_map(get_groups())
+    path = dataset_path(item_type, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+
+    rows = 0
+    with pq.ParquetWriter(tmp, ARTICLE_SCHEMA, compression="zstd") as writer:
+        for page in range(max_pages):
+            batch = get_articles_page(
+                item_type=item_type,
+                published_since=published_since,
+                limit=page_size,
+                offset=page * page_size,
+            )
+            if batch:
+                writer.write_batch(page_to_batch(batch, group_map, item_type))
+            rows += len(batch)
+            full = len(batch) == page_size
+            del batch  # raw JSON of this page is no longer needed
+            if not full:
+                break
+    os.replace(tmp, path)
+    return rows
+
+
+@dataclass(frozen=True)
+class DatasetSummary:
+    rows: int
+    group_names: List[str]
+    min_date: Optional[date]
+    max_date: Optional[date]
+
+
+def _dataset(item_types: Sequence[int], directory: str) -> Optional[ds.Dataset]:
+    paths = [dataset_path(t, directory) for t in item_types]
+    if not directory or not all(p.exists() for p in paths):
+        return None
+    return ds.dataset([str(p) for p in paths], schema=ARTICLE_SCHEMA, format="parquet")
+
+
+def has_dataset(item_types: Sequence[int], directory: str = DATASET_DIR) -> bool:
+    return _dataset(item_types, directory) is not None
+
+
+def _files_key(item_types: Sequence[int], directory: str) -> tuple:
+    """Changes whenever one of the item types is re-ingested."""
+    return (directory,) + tuple((t, dataset_path(t, directory).stat().st_mtime_ns) for t in item_types)
+
+
+_summaries_lock = threading.Lock()
+_summaries: "OrderedDict[tuple, DatasetSummary]" = OrderedDict()
+
+
+def dataset_summary(item_types: Sequence[int], directory: str = DATASET_DIR) -> DatasetSummary:
+    """What the sidebar needs, reading only the group_name and published_date columns.
+
+    Memoized until one of the files is re-ingested.
+    """
+    key = _files_key(item_types, directory)
+    with _summaries_lock:
+        if key in _summaries:
+            _summaries.move_to_end(key)
+            return _summaries[key]
+    dataset = _dataset(item_types, directory)
+    table = dataset.to_table(columns=["group_name", "published_date"])
+    bounds = pc.min_max(table["published_date"]).as_py()
+    names = pc.unique(table["group_name"].drop_null()).to_pylist()
+    summary = DatasetSummary(
+        rows=table.num_rows,
+        group_names=sorted(names),
+        min_date=bounds["min"].date() if bounds["min"] else None,
+        max_date=bounds["max"].date() if bounds["max"] else None,
+    )
+    with _summaries_lock:
+        _summaries[key] = summary
+        while len(_summaries) > 8:
+            _summaries.popitem(last=False)
+    return summary
+
+
+def query_dataset(
+    item_types: Sequence[int],
+    *,
+    group: Optional[str] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    keyword: str = "",
+    columns: Optional[List[str]] = None,
+    directory: str = DATASET_DIR,
+    cache: CacheManager = CACHE,
+) -> pd.DataFrame:
+    """Rows matching the dashboard filters; the filters run inside the Parquet scan.
+
+    Results are kept in the "queries" namespace of the shared cache budget,
+    keyed by the files' modification times and the filters, so a rerun with
+    unchanged filters does not scan again. The returned frame is shared:
+    callers must not modify it.
+    """
+    key = (
+        _files_key(item_types, directory),
+        group,
+        start if start and end else None,
+        end if start and end else None,
+        keyword,
+        tuple(columns) if columns is not None else None,
+    )
+    return cache.get_or_load(
+        "queries", key, lambda: _scan(item_types, group, start, end, keyword, columns, directory)
+    )
+
+
+def _scan(
+    item_types: Sequence[int],
+    group: Optional[str],
+    start: Optional[date],
+    end: Optional[date],
+    keyword: str,
+    columns: Optional[List[str]],
+    directory: str,
+) -> pd.DataFrame:
+    dataset = _dataset(item_types, directory)
+    expr = None
+
+    def both(e: ds.Expression) -> ds.Expression:
+        return e if expr is None else expr & e
+
+    if group is not None:
+        expr = both(ds.field("group_name") == group)
+    if start and end:
+        lo = pa.scalar(datetime.combine(start, datetime.min.time()), type=pa.timestamp("us"))
+        hi = pa.scalar(datetime.combine(end + timedelta(days=1), datetime.min.time()), type=pa.timestamp("us"))
+        expr = both((ds.field("published_date") >= lo) & (ds.field("published_date") < hi))
+    if keyword:
+        expr = both(pc.match_substring_regex(ds.field("title"), keyword, ignore_case=True))
+
+    table = dataset.to_table(columns=columns, filter=expr)
+    df = table.to_pandas()
+    if "published_date" in df.columns:
+        df = sort_by_published(df)
+    return df
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Stream 4TU articles into a Parquet dataset.")
+    parser.add_argument("--dir", default=DATASET_DIR, help="dataset directory (default: $UC01_DATASET_DIR)")
+    parser.add_argument("--item-type", type=int, action="append", help="3 = dataset, 9 = software (repeatable)")
+    parser.add_argument("--published-since", default=DEFAULT_PUBLISHED_SINCE)
+    parser.add_argument("--page-size", type=int, default=1000, help="records per page; bounds ingest memory")
+    parser.add_argument("--max-pages", type=int, default=10_000)
+    args = parser.parse_args(argv)
+    if not args.dir:
+        parser.error("set --dir or UC01_DATASET_DIR")
+
+    with priority(BACKGROUND):
+        group_map = build_group_map(get_groups())
+        for item_type in args.item_type or [3]:
+            started = time.perf_counter()
+            rows = ingest_item_type(
+                item_type=item_type,
+                published_since=args.published_since,
+                page_size=args.page_size,
+                max_pages=args.max_pages,
+                directory=args.dir,
+                group_map=group_map,
+            )
+            print(f"{dataset_path(item_type, args.dir)}: {rows} rows in {time.perf_counter() - started:.1f}s", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Process-pool transform of downloaded article pages.
+
+Full-catalogue loads fetch their pages concurrently (uc01/async_client.py),
+but turning a million JSON records into a frame then ran on one core:
+json.loads, the per-article loop of to_dataframe and date parsing. With
+UC01_TRANSFORM_WORKERS=N those steps run in N worker processes, one page at
+a time as the pages arrive:
+
+    worker   response bytes -> json.loads -> columns, group names, dates
+             parsed -> Arrow table -> IPC stream bytes
+    loader   IPC bytes -> Arrow tables (read in place) -> concat_tables
+             (no copy) -> to_pandas -> validation and sort
+             (transform.finish_frame)
+
+Only response bytes go to the workers and only IPC buffers come back, never
+pickled records. A page Arrow cannot type (a title that is a number, say)
+comes back without a table; the load is then assembled in pandas from the
+same columns, as to_dataframe would build it. benchmarks/bench_transform.py
+measures 1..N workers on a synthetic corpus.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+
+from .async_client import AsyncClient, gather_or_cancel
+from .config import TRANSFORM_WORKERS
+from .transform import finish_frame, modified_date, parse_dates, to_dataframe
+
+RAW_DATES = "published_date_raw"  # shipped next to the parsed dates for validation
+
+
+def page_columns(articles: List[Dict[str, Any]], group_map: Dict[int, str]) -> Dict[str, list]:
+    """to_dataframe's columns of one page, as lists."""
+    group_ids = [a.get("group_id") for a in articles]
+    return {
+        "id": [a.get("id") for a in articles],
+        "title": [a.get("title") for a in articles],
+        "published_date": [a.get("published_date") for a in articles],
+        "group_id": group_ids,
+        "group_name": [group_map.get(gid, "Unknown") for gid in group_ids],
+        "doi": [a.get("doi") for a in articles],
+        "uuid": [a.get("uuid") for a in articles],
+        "url": [a.get("url") for a in articles],
+        "modified_date": [modified_date(a) for a in articles],
+    }
+
+
+def _decode(body: bytes) -> List[Dict[str, Any]]:
+    articles = json.loads(body)
+    return articles if isinstance(articles, list) else []
+
+
+def page_batch(body: bytes, group_map: Dict[int, str]) -> Tuple[int, Optional[bytes]]:
+    """(records, Arrow IPC stream of their columns) of one /v2/articles response body.
+
+    Runs in a worker process. The IPC part is None if Arrow cannot type a
+    column of this page.
+    """
+    columns = page_columns(_decode(body), group_map)
+    raw_dates = columns["published_date"]
+    try:
+        table = pa.table(
+            {
+                **columns,
+                "published_date": pa.array(parse_dates(pd.Series(raw_dates, dtype=object))),
+                RAW_DATES: pa.array(raw_dates),
+            }
+        )
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return len(raw_dates), None
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return len(raw_dates), sink.getvalue().to_pybytes()
+
+
+@dataclass(frozen=True)
+class PageBatch:
+    rows: int
+    ipc: Optional[bytes]
+    body: bytes = b""  # kept only when ipc is None
+
+
+def frame_from_batches(batches: List[PageBatch], group_map: Dict[int, str]) -> pd.DataFrame:
+    """The frame to_dataframe builds from the same pages' records."""
+    if not any(batch.rows for batch in batches):
+        return to_dataframe([], group_map)
+    reparse = False
+    if all(batch.ipc is not None for batch in batches):
+        tables = [pa.ipc.open_stream(batch.ipc).read_all() for batch in batches]
+        try:
+            df = pa.concat_tables(tables, promote_options="permissive").to_pandas()
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Pages disagree on a column's type: parse all raw dates at once as to_dataframe does.
+            tables = [table.drop_columns(["published_date"]) for table in tables]
+            df = pa.concat_tables(tables, promote_options="permissive").to_pandas()
+            reparse = True
+    else:
+        pieces = [
+            pa.ipc.open_stream(batch.ipc).read_all().to_pandas().drop(columns=["published_date"])
+            if batch.ipc is not None
+            else pd.DataFrame(page_columns(_decode(batch.body), group_map)).rename(columns={"published_date": RAW_DATES})
+            for batch in batches
+        ]
+        df = pd.concat(pieces, ignore_index=True)
+        reparse = True
+    raw_dates = df.pop(RAW_DATES)
+    if reparse:
+        df.insert(2, "published_date", parse_dates(raw_dates))
+    return finish_frame(df, raw_dates, group_map)
+
+
+async def fetch_page_batches(
+    client: AsyncClient,
+    pool: Executor,
+    *,
+    item_type: int,
+    published_since: str,
+    page_size: int,
+    max_pages: int,
+    group_map: Dict[int, str],
+) -> List[PageBatch]:
+    """AsyncClient.get_recent_articles, with each page transformed in pool as soon as it arrives."""
+    loop = asyncio.get_running_loop()
+
+    async def page(n: int) -> PageBatch:
+        body = await client.get_articles_page_bytes(
+            item_type=item_type, published_since=published_since, limit=page_size, offset=n * page_size
+        )
+        rows, ipc = await loop.run_in_executor(pool, page_batch, body, group_map)
+        return PageBatch(rows=rows, ipc=ipc, body=body if ipc is None else b"")
+
+    first = await page(0)
+    if first.rows < page_size or max_pages <= 1:
+        return [first]
+    batches = [first]
+    for batch in await gather_or_cancel(*(page(n) for n in range(1, max_pages))):
+        batches.append(batch)
+        if batch.rows < page_size:
+            break
+    return batches
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def transform_pool() -> Optional[ProcessPoolExecutor]:
+    """The process-wide pool of UC01_TRANSFORM_WORKERS workers, started on first use; None if 0."""
+    global _pool
+    if TRANSFORM_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs Streamlit's threads is not safe.
+            _pool = ProcessPoolExecutor(TRANSFORM_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
@@ -0,0 +1,81 @@
+"""Serialized display and export payloads of a result set, built once.
+
+On every rerun st.dataframe converts its pandas frame to Arrow and the
+download button gets a freshly built CSV (or st.cache_data unpickles a copy
+of it), even when data and filters are unchanged and only an unrelated
+widget moved. PayloadCache keeps, per result set:
+
+    table   the displayed columns as a pyarrow.Table; st.dataframe(...,
+            lazy=True) slices its first page from it instead of converting
+            the whole pandas frame to Arrow
+    csv     the export bytes, handed to a deferred download button so they
+            are built (once) on the first click, not on every rerun
+
+keyed by the caller's result-set key (dataset version + filter state), in
+the "payloads" namespace of the shared cache budget (uc01/cache_budget.py),
+so large payloads are evicted by bytes with the other cached frames. A
+result set that cannot be keyed by its inputs alone (details enrichment in
+which some lookups failed) has key None and is serialized on every call.
+
+The enriched result set itself is kept under the same key (frame /
+put_frame), so a rerun neither repeats the per-article lookups nor pairs a
+cached table with a differently enriched frame.
+benchmarks/bench_payloads.py times a rerun of an unchanged view with and
+without it.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Hashable, Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from .cache_budget import CACHE, CacheManager
+
+HIDDEN_COLUMNS = ["group_id"]
+
+
+def display_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """df as shown and exported: without internal columns."""
+    return df.drop(columns=HIDDEN_COLUMNS, errors="ignore")
+
+
+def display_table(df: pd.DataFrame) -> pa.Table:
+    return pa.Table.from_pandas(display_frame(df), preserve_index=False)
+
+
+def csv_bytes(df: pd.DataFrame) -> bytes:
+    return display_frame(df).to_csv(index=False).encode()
+
+
+class PayloadCache:
+    NAMESPACE = "payloads"
+
+    def __init__(self, cache: CacheManager = CACHE) -> None:
+        self.cache = cache
+
+    def table(self, key: Optional[Hashable], df: pd.DataFrame) -> pa.Table:
+        """df's display table; df must be the result set that key identifies."""
+        if key is None:
+            return display_table(df)
+        return self.cache.get_or_load(self.NAMESPACE, ("table", key), lambda: display_table(df))
+
+    def csv(self, key: Optional[Hashable], df: pd.DataFrame) -> bytes:
+        """df's CSV export; df must be the result set that key identifies."""
+        if key is None:
+            return csv_bytes(df)
+        return self.cache.get_or_load(self.NAMESPACE, ("csv", key), lambda: csv_bytes(df))
+
+    def frame(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """The result set stored under key by put_frame, or None."""
+        return self.cache.get(self.NAMESPACE, ("frame", key))
+
+    def put_frame(self, key: Hashable, df: pd.DataFrame) -> None:
+        self.cache.put(self.NAMESPACE, ("frame", key), df)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.stats().get(self.NAMESPACE, {"entries": 0})
+
+
+PAYLOADS = PayloadCache()
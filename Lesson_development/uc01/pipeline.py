@@ -0,0 +1,167 @@
+"""Load pipeline: API client -> transformations -> DataFrame.
+
+Every frame carries a categorical item_type column, so frames of different
+item types can be loaded and cached independently and combined later with
+combine_frames without another download.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .async_client import AsyncClient, gather_or_cancel
+from .cache_budget import CACHE
+from .client import get_groups, get_recent_articles
+from .parallel import fetch_page_batches, frame_from_batches, transform_pool
+from .query_cache import ListingCache
+from .transform import build_group_map, dataset_version, sort_by_published, to_dataframe
+from .validate import frame_report, merge_reports
+
+ITEM_TYPES = (3, 9)  # dataset, software
+
+
+def with_item_type(df: pd.DataFrame, item_type: int) -> pd.DataFrame:
+    codes = np.full(len(df), ITEM_TYPES.index(item_type), dtype=np.int8)
+    df["item_type"] = pd.Categorical.from_codes(codes, categories=ITEM_TYPES)
+    return df
+
+
+def load_articles_frame(
+    *,
+    item_type: int,
+    published_since: str,
+    page_size: int,
+    max_pages: int,
+    group_map: Optional[Dict[int, str]] = None,
+    concurrent: bool = False,
+    cache: Optional[ListingCache] = None,
+) -> pd.DataFrame:
+    """Fetch paged articles (and groups unless group_map is given) into one frame.
+
+    With a cache the listing is served from (or added to) it; see uc01/query_cache.py.
+    """
+    if concurrent:
+        return load_item_types_frame(
+            item_types=[item_type],
+            published_since=published_since,
+            page_size=page_size,
+            max_pages=max_pages,
+            group_map=group_map,
+        )
+    if group_map is None:
+        group_map = build_group_map(get_groups())
+    if cache is not None:
+        articles = cache.get(
+            item_type=item_type,
+            published_since=published_since,
+            limit=page_size * max_pages,
+            page_size=page_size,
+        )
+    else:
+        articles = get_recent_articles(
+            item_type=item_type,
+            published_since=published_since,
+            page_size=page_size,
+            max_pages=max_pages,
+        )
+    df = with_item_type(to_dataframe(articles, group_map), item_type)
+    dataset_version(df)
+    return df
+
+
+async def load_item_types_frame_async(
+    *,
+    item_types: Sequence[int],
+    published_since: str,
+    page_size: int,
+    max_pages: int,
+    group_map: Optional[Dict[int, str]] = None,
+) -> pd.DataFrame:
+    """Fetch the articles of every item type (and groups) concurrently.
+
+    With UC01_TRANSFORM_WORKERS the pages are transformed in worker
+    processes while the rest download (uc01/parallel.py); the workers need
+    the group names, so groups are then fetched first.
+    """
+    pool = transform_pool()
+    async with AsyncClient() as client:
+        if pool is not None and group_map is None:
+            group_map = build_group_map(await client.get_groups())
+        fetches = [
+            client.get_recent_articles(
+                item_type=item_type,
+                published_since=published_since,
+                page_size=page_size,
+                max_pages=max_pages,
+            )
+            if pool is None
+            else fetch_page_batches(
+                client,
+                pool,
+                item_type=item_type,
+                published_since=published_since,
+                page_size=page_size,
+                max_pages=max_pages,
+                group_map=group_map,
+            )
+            for item_type in item_types
+        ]
+        if group_map is None:
+            groups, *per_type = await gather_or_cancel(client.get_groups(), *fetches)
+            group_map = build_group_map(groups)
+        else:
+            per_type = await gather_or_cancel(*fetches)
+
+    build = to_dataframe if pool is None else frame_from_batches
+    frames = [with_item_type(build(pages, group_map), item_type) for item_type, pages in zip(item_types, per_type)]
+    for frame in frames:
+        dataset_version(frame)
+    return combine_frames(frames)
+
+
+def load_item_types_frame(
+    *,
+    item_types: Sequence[int],
+    published_since: str,
+    page_size: int,
+    max_pages: int,
+    group_map: Optional[Dict[int, str]] = None,
+) -> pd.DataFrame:
+    """Blocking wrapper around load_item_types_frame_async."""
+    return asyncio.run(
+        load_item_types_frame_async(
+            item_types=item_types,
+            published_since=published_since,
+            page_size=page_size,
+            max_pages=max_pages,
+            group_map=group_map,
+        )
+    )
+
+
+def combine_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """One date-sorted frame from per-item-type frames.
+
+    Memoized on the input versions (in the shared cache budget), so reruns
+    that get the same cached per-type frames also get the same combined frame
+    (and dataset version).
+    """
+    if len(frames) == 1:
+        return frames[0]
+    key = tuple(dataset_version(f) for f in frames)
+    return CACHE.get_or_load("combined", key, lambda: concat_sorted(frames))
+
+
+def concat_sorted(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """frames concatenated and re-sorted by date, not memoized (combine_frames is)."""
+    df = pd.concat([f for f in frames if not f.empty] or frames[:1], ignore_index=True)
+    if "published_date" in df.columns:
+        df = sort_by_published(df)
+    df.attrs.pop("version", None)
+    df.attrs["validation"] = merge_reports([frame_report(f) for f in frames]).as_attrs()
+    dataset_version(df)
+    return df
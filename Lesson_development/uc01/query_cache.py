@@ -0,0 +1,152 @@
+"""Process-wide cache of article listings, keyed by canonical query.
+
+/v2/articles returns one ordered list per (item_type, published_since); page
+size and page count only decide how much of its head a load takes. Listings
+are therefore cached per (item_type, published_since as a date), and a load
+asks for its first `limit` = page_size * max_pages records:
+
+- "2025-1-1" and "2025-01-01" are the same query, and a different page size
+  with the same limit is the same load.
+- A cached head at least `limit` long (or the whole list) is sliced.
+- A later published_since is served by filtering the head of an earlier
+  one's list by date: the filtered records are the head of the later list.
+- A head shorter than `limit` is extended by requesting only the missing
+  offsets, in pages of the caller's page size.
+
+Listings are replaced, never mutated, so a slice handed out stays valid.
+They are held in the shared cache budget (uc01/cache_budget.py) and evicted
+with the other large entries; beyond that nothing expires on its own, the
+dashboard's refresh button invalidates the item types it reloads.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .cache_budget import CACHE, CacheManager, sizeof_records
+from .client import get_articles_page
+from .transform import parse_dates
+
+
+def canonical_since(published_since: str) -> str:
+    """published_since as YYYY-MM-DD; ValueError if it is not a date."""
+    try:
+        return pd.Timestamp(published_since.strip()).date().isoformat()
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"published_since {published_since!r} is not a date") from exc
+
+
+def _parse_dates(records: List[Dict[str, Any]]) -> np.ndarray:
+    dates = parse_dates(pd.Series([r.get("published_date") for r in records], dtype=object))
+    return dates.to_numpy(dtype="datetime64[ns]")
+
+
+@dataclass(frozen=True)
+class Listing:
+    records: List[Dict[str, Any]]  # head of the API's list, in API order
+    dates: np.ndarray  # published_date per record, NaT if missing or unparseable
+    complete: bool  # the API returned a short page: records is the whole list
+
+    @property
+    def nbytes(self) -> int:
+        return sizeof_records(self.records) + self.dates.nbytes
+
+    def covers(self, limit: int) -> bool:
+        return self.complete or len(self.records) >= limit
+
+    def since(self, day: date) -> "Listing":
+        """This listing filtered to published_date >= day (a head of that query's list)."""
+        keep = self.dates >= np.datetime64(day, "ns")
+        return Listing(
+            records=[r for r, k in zip(self.records, keep.tolist()) if k],
+            dates=self.dates[keep],
+            complete=self.complete,
+        )
+
+
+class ListingCache:
+    NAMESPACE = "listings"
+
+    def __init__(self, cache: CacheManager = CACHE) -> None:
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._fetching: Dict[Tuple[int, date], threading.Lock] = {}
+        self.counters = {"hits": 0, "derived": 0, "extended": 0, "misses": 0, "pages_fetched": 0}
+
+    def _superset(self, item_type: int, day: date) -> Optional[Listing]:
+        """Longest cached listing of an earlier published_since that can be filtered by date."""
+        candidates = [
+            listing
+            for (t, d), listing in self.cache.items(self.NAMESPACE)
+            if t == item_type and d < day and not np.isnat(listing.dates).any()
+        ]
+        return max(candidates, key=lambda listing: (listing.complete, len(listing.records)), default=None)
+
+    def get(self, *, item_type: int, published_since: str, limit: int, page_size: int) -> List[Dict[str, Any]]:
+        """The first `limit` records of the listing, fetching only what no cached listing covers."""
+        key = (item_type, date.fromisoformat(canonical_since(published_since)))
+        with self._lock:
+            fetch_lock = self._fetching.setdefault(key, threading.Lock())
+        # One fetch per query at a time; a second caller waits and then hits.
+        with fetch_lock:
+            listing = self.cache.get(self.NAMESPACE, key)
+            if listing is not None and listing.covers(limit):
+                self._count("hits")
+                return listing.records[:limit]
+            if listing is None:
+                superset = self._superset(*key)
+                if superset is not None:
+                    listing = superset.since(key[1])
+                    self.cache.put(self.NAMESPACE, key, listing)
+                    if listing.covers(limit):
+                        self._count("derived")
+                        return listing.records[:limit]
+            self._count("extended" if listing is not None else "misses")
+
+            records = list(listing.records) if listing is not None else []
+            complete = False
+            pages = 0
+            while len(records) < limit:
+                batch = get_articles_page(
+                    item_type=item_type,
+                    published_since=key[1].isoformat(),
+                    limit=page_size,
+                    offset=len(records),
+                )
+                pages += 1
+                records.extend(batch)
+                if len(batch) < page_size:
+                    complete = True
+                    break
+            fetched = records[len(listing.records) :] if listing is not None else records
+            dates = _parse_dates(fetched)
+            if listing is not None:
+                dates = np.concatenate([listing.dates, dates])
+            self._count("pages_fetched", pages)
+            self.cache.put(self.NAMESPACE, key, Listing(records=records, dates=dates, complete=complete))
+            return records[:limit]
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += n
+
+    def invalidate(self, item_type: int) -> None:
+        """Forget every listing of item_type (the next load downloads it again)."""
+        for key, _ in self.cache.items(self.NAMESPACE):
+            if key[0] == item_type:
+                self.cache.discard(self.NAMESPACE, key)
+
+    def stats(self) -> Dict[str, Any]:
+        listings = [listing for _, listing in self.cache.items(self.NAMESPACE)]
+        records = sum(len(listing.records) for listing in listings)
+        with self._lock:
+            return {"entries": len(listings), "records": records, **self.counters}
+
+
+LISTINGS = ListingCache()
@@ -0,0 +1,147 @@
+"""Process-wide request budget for data.4tu.nl.
+
+A token bucket limits the request rate, a slot count limits requests in
+flight, and waiting callers are served in priority order, so an interactive
+dashboard load is not stuck behind a background refresh (uc01/refresh.py).
+Every client call (sync and async) goes through the single LIMITER below.
+
+Settings (uc01/config.py):
+
+    FOURTU_RATE               requests per second (default 5; 0 disables the bucket)
+    FOURTU_BURST              bucket size (default 10)
+    FOURTU_MAX_CONCURRENCY    requests in flight across the process (default 4)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+from .config import BURST, MAX_CONCURRENCY, RATE
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar("fourtu_priority", default=INTERACTIVE)
+
+
+@contextmanager
+def priority(level: int) -> Iterator[None]:
+    """Run the requests made inside this block at the given priority."""
+    token = _priority.set(level)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class RateLimiter:
+    def __init__(self, *, rate: float, burst: int, max_inflight: int) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_inflight = max(1, max_inflight)
+        self._cond = threading.Condition()
+        self._tokens = float(self.burst)
+        self._refilled = time.monotonic()
+        self._inflight = 0
+        self._waiting: List[tuple] = []  # heap of (priority, seq)
+        self._seq = itertools.count()
+        self._waits: Dict[int, List[float]] = {INTERACTIVE: [], BACKGROUND: []}
+        self._served: Dict[int, int] = {INTERACTIVE: 0, BACKGROUND: 0}
+        self._requests = 0
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+        else:
+            self._tokens = float(self.burst)
+        self._refilled = now
+
+    def acquire(self, level: int | None = None) -> float:
+        """Block until a token and a slot are free; return seconds waited."""
+        level = _priority.get() if level is None else level
+        started = time.monotonic()
+        with self._cond:
+            ticket = (level, next(self._seq))
+            heapq.heappush(self._waiting, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    first_in_line = self._waiting[0] == ticket
+                    if first_in_line and self._inflight < self.max_inflight and self._tokens >= 1:
+                        break
+                    timeout = None
+                    if first_in_line and self._tokens < 1:
+                        timeout = (1 - self._tokens) / self.rate
+                    self._cond.wait(timeout)
+            except BaseException:
+                # Interrupted or cancelled while queued: leave the line, or it blocks everyone behind.
+                self._waiting.remove(ticket)
+                heapq.heapify(self._waiting)
+                self._cond.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._tokens -= 1
+            self._inflight += 1
+            self._requests += 1
+            self._served[level] = self._served.get(level, 0) + 1
+            waited = time.monotonic() - started
+            waits = self._waits.setdefault(level, [])
+            waits.append(waited)
+            del waits[:-1000]  # keep recent samples only
+            self._cond.notify_all()
+        return waited
+
+    def release(self) -> None:
+        with self._cond:
+            self._inflight -= 1
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, level: int | None = None) -> Iterator[None]:
+        self.acquire(level)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def aslot(self, level: int | None = None) -> AsyncIterator[None]:
+        # acquire blocks a worker thread, not the event loop. to_thread copies
+        # the context, so the caller's priority() still applies.
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self.acquire, level))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The thread cannot be interrupted; hand the slot back once it gets one.
+            acquiring.add_done_callback(lambda f: f.cancelled() or f.exception() or self.release())
+            raise
+        try:
+            yield
+        finally:
+            self.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            out: Dict[str, Any] = {
+                "requests": self._requests,
+                "inflight": self._inflight,
+                "queued": len(self._waiting),
+            }
+            for level, name in ((INTERACTIVE, "interactive"), (BACKGROUND, "background")):
+                waits = sorted(self._waits.get(level, []))
+                out[f"{name}_requests"] = self._served.get(level, 0)
+                out[f"{name}_wait_ms_mean"] = round(1000 * sum(waits) / len(waits), 1) if waits else 0.0
+                out[f"{name}_wait_ms_p95"] = round(1000 * waits[int(0.95 * (len(waits) - 1))], 1) if waits else 0.0
+                out[f"{name}_wait_ms_max"] = round(1000 * waits[-1], 1) if waits else 0.0
+            return out
+
+
+LIMITER = RateLimiter(rate=RATE, burst=BURST, max_inflight=MAX_CONCURRENCY)
@@ -0,0 +1,127 @@
+"""Content-addressed store of raw API response bodies, for replay and debugging.
+
+With FOURTU_RAW_STORE=<dir> every response body fetched by the client is kept
+compressed (zstd when the ``zstandard`` package is installed, gzip otherwise):
+
+    <dir>/objects/ab/<sha256 of body>.json.zst   one file per distinct body
+    <dir>/requests/<sha256 of url+params>.json   which body a request returned
+
+Identical pages (e.g. repeated refreshes of an unchanged catalogue) share one
+object. With FOURTU_REPLAY=1 the client serves bodies from the store and never
+touches the network, which makes benchmarks and regression runs deterministic.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from .config import RAW_STORE_DIR, REPLAY
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+def request_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Stable hash of a GET request: url plus params in sorted order."""
+    query = urlencode(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+    return hashlib.sha256(f"GET {url}?{query}".encode()).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class RawStore:
+    def __init__(self, root: str) -> None:
+        self.root = Path(root)
+        self.codec = "zst" if zstandard is not None else "gz"
+        self.counters = {"recorded": 0, "new_objects": 0, "deduplicated": 0, "replayed": 0, "stored_bytes": 0}
+
+    def _object_path(self, digest: str, codec: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.json.{codec}"
+
+    def _compress(self, body: bytes) -> bytes:
+        if self.codec == "zst":
+            return zstandard.ZstdCompressor(level=10).compress(body)
+        return gzip.compress(body, compresslevel=6)
+
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        if codec == "zst":
+            if zstandard is None:
+                raise RuntimeError("this raw store entry needs the zstandard package")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def record(self, url: str, params: Optional[Dict[str, Any]], body: bytes) -> str:
+        """Store body for this request; return the body's content hash."""
+        digest = hashlib.sha256(body).hexdigest()
+        obj = self._object_path(digest, self.codec)
+        self.counters["recorded"] += 1
+        if obj.exists():
+            self.counters["deduplicated"] += 1
+        else:
+            data = self._compress(body)
+            _write_atomic(obj, data)
+            self.counters["new_objects"] += 1
+            self.counters["stored_bytes"] += len(data)
+        entry = {
+            "url": url,
+            "params": params or {},
+            "object": digest,
+            "codec": self.codec,
+            "bytes": len(body),
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+        }
+        _write_atomic(self.root / "requests" / f"{request_key(url, params)}.json", json.dumps(entry).encode())
+        return digest
+
+    def load(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+        """Recorded body for this request, or None."""
+        try:
+            entry = json.loads((self.root / "requests" / f"{request_key(url, params)}.json").read_bytes())
+        except FileNotFoundError:
+            return None
+        data = self._object_path(entry["object"], entry["codec"]).read_bytes()
+        self.counters["replayed"] += 1
+        return self._decompress(data, entry["codec"])
+
+    def stats(self) -> Dict[str, Any]:
+        """Activity of this process (counts, compressed bytes written)."""
+        return {"root": str(self.root), "codec": self.codec, "replay": REPLAY, **self.counters}
+
+
+STORE: Optional[RawStore] = RawStore(RAW_STORE_DIR) if RAW_STORE_DIR else None
+
+
+def replay(url: str, params: Optional[Dict[str, Any]] = None) -> Optional[bytes]:
+    """In replay mode, the recorded body for this request (LookupError if none)."""
+    if not REPLAY:
+        return None
+    body = STORE.load(url, params) if STORE is not None else None
+    if body is None:
+        raise LookupError(f"FOURTU_REPLAY is set but nothing is recorded for {url} {params or ''}")
+    return body
+
+
+def record(url: str, params: Optional[Dict[str, Any]], body: bytes) -> None:
+    if STORE is not None and not REPLAY:
+        STORE.record(url, params, body)
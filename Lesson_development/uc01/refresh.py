@@ -0,0 +1,98 @@
+"""Background refresh of the dashboard's cached frames, in the serving process.
+
+A cached frame is reloaded only when someone presses "Refresh now", and that
+visitor waits for the download. With UC01_REFRESH_INTERVAL=N a daemon thread
+started by the dashboard reloads, every N seconds, each per-item-type frame in
+the "frames" namespace of the cache budget (uc01/cache_budget.py) and swaps
+the new frame in; the next rerun shows it, with what it brought in
+(uc01/versions.py).
+
+Its requests run at BACKGROUND priority in the process-wide limiter
+(uc01/ratelimit.py), so a visitor's load or article details waiting at the
+same time are served first. The Diagnostics expander shows both priorities'
+waits and the last refresh.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from .cache_budget import CACHE, CacheManager
+from .client import get_groups
+from .config import DEFAULT_PAGE_SIZE, REFRESH_INTERVAL
+from .history import record_sync
+from .pipeline import load_articles_frame
+from .query_cache import LISTINGS, ListingCache
+from .ratelimit import BACKGROUND, priority
+from .transform import build_group_map
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_status: Dict[str, Any] = {"runs": 0, "frames": 0, "last": None, "seconds": 0.0, "error": None}
+
+
+def refresh_frames(cache: CacheManager = CACHE, listings: ListingCache = LISTINGS) -> int:
+    """Reload every cached per-item-type frame at BACKGROUND priority; return how many."""
+    keys = sorted(key for key, _ in cache.items("frames"))
+    if not keys:
+        return 0
+    with priority(BACKGROUND):
+        group_map = build_group_map(get_groups())
+        for item_type in {key[0] for key in keys}:
+            listings.invalidate(item_type)
+        # Earliest published_since first: later ones of the same type are
+        # then filtered from its listing instead of downloaded again.
+        for item_type, published_since, limit in keys:
+            page_size = min(limit, DEFAULT_PAGE_SIZE)
+            df = load_articles_frame(
+                item_type=item_type,
+                published_since=published_since,
+                page_size=page_size,
+                max_pages=-(-limit // page_size),
+                group_map=group_map,
+                cache=listings,
+            )
+            record_sync(df, item_type=item_type, published_since=published_since, limit=limit)
+            cache.put("frames", (item_type, published_since, limit), df)
+    return len(keys)
+
+
+def _run(interval: int) -> None:
+    while True:
+        time.sleep(interval)
+        started = time.perf_counter()
+        try:
+            frames, error = refresh_frames(), None
+        except Exception as exc:  # keep refreshing; the next run may succeed
+            frames, error = 0, repr(exc)
+            print(f"background refresh failed: {error}", file=sys.stderr, flush=True)
+        with _lock:
+            _status.update(
+                runs=_status["runs"] + 1,
+                frames=frames,
+                last=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                seconds=round(time.perf_counter() - started, 2),
+                error=error,
+            )
+
+
+def start(interval: int = REFRESH_INTERVAL) -> bool:
+    """Start the refresh thread once per process; False if interval is 0."""
+    global _thread
+    if interval <= 0:
+        return False
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, args=(interval,), name="uc01-refresh", daemon=True)
+            _thread.start()
+    return True
+
+
+def status() -> Optional[Dict[str, Any]]:
+    """The last background refresh, or None if the thread is not running."""
+    with _lock:
+        return dict(_status, interval_s=REFRESH_INTERVAL) if _thread is not None else None
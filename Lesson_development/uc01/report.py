@@ -0,0 +1,269 @@
+"""Pre-rendered static reports for the read-only views most visitors open.
+
+Runs the dashboard's load -> filter -> aggregate pipeline without Streamlit
+for the default view (all groups, full date range, no keyword) and for every
+institution, and writes plain files that any web server can serve:
+
+    <out>/index.html                  links to every view, with row counts
+    <out>/manifest.json               dataset version, item types, views
+    <out>/<view>/index.html           publication chart, per-group counts, table
+    <out>/<view>/data.json            rows, per-group and per-day counts
+    <out>/<view>/items.csv            the same CSV as the dashboard's download
+
+<view> is "all" or a slug of the group name. Every file is written to a
+temporary name and os.replace-d into place, so a web server never serves a
+half-written file. Refresh on a schedule next to (or instead of) the
+dashboard:
+
+    python -m uc01.report --out /var/www/uc01 --item-type 3 --interval 900
+
+The data comes from the same sources as the dashboard, in the same order:
+the Parquet dataset (UC01_DATASET_DIR), shared snapshots (UC01_SNAPSHOT_DIR),
+otherwise the API at background priority.
+"""
+
+from __future__ import annotations
+
+import argparse
+import html
+import json
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from .config import (
+    CHART_POINTS,
+    DATASET_DIR,
+    DEFAULT_MAX_PAGES,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PUBLISHED_SINCE,
+    SNAPSHOT_DIR,
+)
+from .transform import bucket_counts, dataset_version, pick_resolution
+from .view_cache import FilterState, View, compute_view, frame_summary
+
+STYLE = """
+body { font-family: system-ui, sans-serif; margin: 2rem; color: #222; }
+table { border-collapse: collapse; font-size: 0.9rem; }
+th, td { border-bottom: 1px solid #ddd; padding: 0.25rem 0.6rem; text-align: left; }
+.metric { font-size: 2rem; font-weight: 600; }
+svg rect { fill: #4c78a8; }
+"""
+
+
+@dataclass(frozen=True)
+class ReportView:
+    slug: str
+    title: str
+    state: FilterState
+    view: View
+
+
+def load_frame(item_types: Sequence[int], published_since: str, page_size: int, max_pages: int) -> pd.DataFrame:
+    """The articles of item_types from the first available source (as the dashboard picks it)."""
+    from .ingest import dataset_summary, has_dataset, query_dataset
+    from .pipeline import combine_frames, load_articles_frame
+    from .query_cache import canonical_since
+    from .ratelimit import BACKGROUND, priority
+    from .snapshot import open_snapshot, snapshot_path
+
+    if DATASET_DIR and has_dataset(item_types):
+        summary = dataset_summary(item_types)
+        return query_dataset(item_types, start=summary.min_date, end=summary.max_date)
+    snapshot = open_snapshot(snapshot_path(item_types)) if SNAPSHOT_DIR else None
+    if snapshot is not None:
+        return snapshot.frame
+    with priority(BACKGROUND):
+        return combine_frames(
+            [
+                load_articles_frame(
+                    item_type=t,
+                    published_since=canonical_since(published_since),
+                    page_size=page_size,
+                    max_pages=max_pages,
+                )
+                for t in item_types
+            ]
+        )
+
+
+def publish(path: Path, data: bytes) -> None:
+    """Write data to path atomically, readable by a web server running as another user."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def slugify(name: str, taken: set) -> str:
+    base = re.sub(r"[^a-z0-9]+", "-", name.casefold()).strip("-") or "group"
+    slug, n = base, 2
+    while slug in taken:
+        slug, n = f"{base}-{n}", n + 1
+    taken.add(slug)
+    return slug
+
+
+def report_views(df: pd.DataFrame) -> List[ReportView]:
+    """The default view and one view per institution, over the full date range."""
+    summary = frame_summary(df)
+    taken = {"all"}
+    views = []
+    for group in ["All"] + summary.group_names:
+        state = FilterState.normalize(group, summary.min_date, summary.max_date, "")
+        views.append(
+            ReportView(
+                slug="all" if group == "All" else slugify(group, taken),
+                title="All groups" if group == "All" else group,
+                state=state,
+                view=compute_view(df, state),
+            )
+        )
+    return views
+
+
+def bar_chart_svg(counts: pd.Series, width: int = 900, height: int = 180) -> str:
+    """Bars for counts (at most CHART_POINTS of them) as inline SVG."""
+    if counts.empty:
+        return "<p>No publication dates available for plotting.</p>"
+    peak = max(int(counts.max()), 1)
+    bar = width / len(counts)
+    rects = "".join(
+        f'<rect x="{i * bar:.1f}" y="{height - h:.1f}" width="{max(bar - 1, 1):.1f}" height="{h:.1f}">'
+        f"<title>{day:%Y-%m-%d}: {n}</title></rect>"
+        for i, (day, n) in enumerate(counts.items())
+        for h in [height * int(n) / peak]
+    )
+    return f'<svg width="{width}" height="{height}" role="img">{rects}</svg>'
+
+
+def _page(title: str, body: str) -> str:
+    return (
+        f"<!doctype html><html><head><meta charset='utf-8'><title>{html.escape(title)}</title>"
+        f"<style>{STYLE}</style></head><body>{body}</body></html>"
+    )
+
+
+def view_data(item: ReportView, version: str, generated_at: str) -> Dict[str, Any]:
+    day_counts = item.view.day_counts
+    return {
+        "generated_at": generated_at,
+        "dataset_version": version,
+        "group": item.state.group,
+        "start": item.state.start.isoformat() if item.state.start else None,
+        "end": item.state.end.isoformat() if item.state.end else None,
+        "rows": int(len(item.view.positions)),
+        "group_counts": {str(k): int(v) for k, v in item.view.group_counts.items()},
+        "day_counts": {f"{k:%Y-%m-%d}": int(v) for k, v in day_counts.items()},
+    }
+
+
+def render_view(df: pd.DataFrame, item: ReportView, item_types: Sequence[int], generated_at: str) -> str:
+    rows = df.iloc[item.view.positions].drop(columns=["group_id"], errors="ignore")
+    day_counts = item.view.day_counts
+    resolution = "day"
+    if not day_counts.empty:
+        days = day_counts.index
+        resolution = pick_resolution(days.min().date(), days.max().date(), CHART_POINTS)
+    group_table = item.view.group_counts.reset_index().to_html(index=False)
+    body = (
+        f"<p><a href='../index.html'>All views</a></p>"
+        f"<h1>{html.escape(item.title)}</h1>"
+        f"<p>Item type {', '.join(map(str, item_types))} &middot; "
+        f"{item.state.start} to {item.state.end} &middot; generated {html.escape(generated_at)}</p>"
+        f"<p class='metric'>{len(rows)} results</p>"
+        f"<p><a href='items.csv'>Download CSV</a> &middot; <a href='data.json'>JSON</a></p>"
+        f"<h2>Number of items per publication {resolution}</h2>{bar_chart_svg(bucket_counts(day_counts, resolution))}"
+        f"<h2>Number of items per affiliation/group</h2>{group_table}"
+        f"<h2>Items</h2>{rows.to_html(index=False, render_links=True, na_rep='')}"
+    )
+    return _page(f"4TU monitoring: {item.title}", body)
+
+
+def write_reports(
+    df: pd.DataFrame,
+    out: Path,
+    item_types: Sequence[int],
+    generated_at: Optional[str] = None,
+) -> List[ReportView]:
+    """Render every report view of df into out."""
+    generated_at = generated_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+    version = dataset_version(df)
+    views = report_views(df)
+    for item in views:
+        directory = out / item.slug
+        publish(directory / "index.html", render_view(df, item, item_types, generated_at).encode())
+        publish(directory / "data.json", json.dumps(view_data(item, version, generated_at)).encode())
+        csv = df.iloc[item.view.positions].drop(columns=["group_id"], errors="ignore").to_csv(index=False)
+        publish(directory / "items.csv", csv.encode())
+
+    links = "".join(
+        f"<tr><td><a href='{item.slug}/index.html'>{html.escape(item.title)}</a></td>"
+        f"<td>{len(item.view.positions)}</td></tr>"
+        for item in views
+    )
+    publish(
+        out / "index.html",
+        _page(
+            "4TU monitoring reports",
+            f"<h1>4TU Dataset/Software Monitoring</h1><p>Generated {html.escape(generated_at)}</p>"
+            f"<table><tr><th>View</th><th>Results</th></tr>{links}</table>",
+        ).encode(),
+    )
+    manifest = {
+        "generated_at": generated_at,
+        "dataset_version": version,
+        "item_types": list(item_types),
+        "rows": len(df),
+        "views": {item.slug: {"title": item.title, "rows": int(len(item.view.positions))} for item in views},
+    }
+    publish(out / "manifest.json", json.dumps(manifest, indent=1).encode())
+    return views
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Write static HTML/JSON reports of the default dashboard views.")
+    parser.add_argument("--out", required=True, help="output directory (served as static files)")
+    parser.add_argument("--item-type", type=int, action="append", help="3 = dataset, 9 = software (repeatable)")
+    parser.add_argument("--published-since", default=DEFAULT_PUBLISHED_SINCE)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES)
+    parser.add_argument("--interval", type=int, default=0, help="seconds between refreshes; 0 writes once")
+    args = parser.parse_args(argv)
+
+    item_types = tuple(args.item_type or [3])
+    last_version = None
+    while True:
+        started = time.perf_counter()
+        df = load_frame(item_types, args.published_since, args.page_size, args.max_pages)
+        loaded = time.perf_counter()
+        if dataset_version(df) == last_version:
+            print(f"data unchanged ({len(df)} rows, loaded in {loaded - started:.1f}s); reports kept", flush=True)
+        else:
+            views = write_reports(df, Path(args.out), item_types)
+            last_version = dataset_version(df)
+            print(
+                f"wrote {len(views)} views of {len(df)} rows to {args.out} "
+                f"(load {loaded - started:.1f}s, render {time.perf_counter() - loaded:.1f}s)",
+                flush=True,
+            )
+        if args.interval <= 0:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
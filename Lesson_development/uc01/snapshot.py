@@ -0,0 +1,195 @@
+"""Shared-memory Arrow snapshots for multi-process serving.
+
+One loader process publishes the normalized articles table as an uncompressed
+Arrow IPC file; every dashboard worker memory-maps that file instead of keeping
+its own copy of the frame. The pages live in the OS page cache, so N workers
+cost roughly one copy of the data.
+
+Publishing writes to a temporary file in the same directory and then
+``os.replace``-s it over the live file, which is atomic on POSIX and Windows.
+Workers notice the new inode/mtime on their next rerun and re-map; readers that
+still hold the old table keep a valid mapping of the replaced file.
+
+Run the loader next to the dashboard workers:
+
+    UC01_SNAPSHOT_DIR=/dev/shm/uc01 python -m uc01.snapshot --item-type 3 --interval 900
+
+With several --item-type values it also publishes their combination, sorted
+once, so a worker serving "Dataset + Software" maps that file too instead of
+concatenating and re-sorting a private copy of the per-type tables.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from .config import DEFAULT_MAX_PAGES, DEFAULT_PAGE_SIZE, DEFAULT_PUBLISHED_SINCE, SNAPSHOT_DIR
+from .history import record_sync
+from .pipeline import concat_sorted, load_articles_frame
+from .ratelimit import BACKGROUND, priority
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    path: Path
+    version: str
+    metadata: Dict[str, str]
+    table: pa.Table
+    frame: pd.DataFrame
+
+
+_lock = threading.Lock()
+_mapped: Dict[Path, Tuple[Tuple[int, int, int], Snapshot]] = {}
+
+
+def snapshot_path(item_types: Union[int, Sequence[int]], directory: str = SNAPSHOT_DIR) -> Path:
+    """The snapshot of one item type, or of several combined."""
+    types = sorted({item_types} if isinstance(item_types, int) else set(item_types))
+    if len(types) == 1:
+        return Path(directory) / f"articles_item_type_{types[0]}.arrow"
+    return Path(directory) / f"articles_item_types_{'_'.join(map(str, types))}.arrow"
+
+
+def publish_snapshot(df: pd.DataFrame, path: Path, metadata: Optional[Dict[str, str]] = None) -> Path:
+    """Write df as an Arrow IPC file and atomically swap it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta = {"created_at": datetime.now(timezone.utc).isoformat(), "rows": str(len(df))}
+    meta.update(metadata or {})
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **{k: str(v) for k, v in meta.items()}})
+
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(fd)
+    try:
+        # No compression: compressed buffers cannot be mapped zero-copy.
+        with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        with open(tmp, "rb") as fh:
+            os.fsync(fh.fileno())
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; workers may run as another user
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _string_as_arrow(dtype: pa.DataType):
+    # Keep strings inside the mapped Arrow buffers instead of materializing
+    # one Python object per cell in every worker.
+    if pa.types.is_string(dtype) or pa.types.is_large_string(dtype):
+        return pd.ArrowDtype(dtype)
+    return None
+
+
+def open_snapshot(path: Path) -> Optional[Snapshot]:
+    """Map the snapshot at path, re-mapping only when it has been swapped."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    key = (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    with _lock:
+        cached = _mapped.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        with pa.memory_map(str(path), "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+        frame = table.to_pandas(types_mapper=_string_as_arrow, split_blocks=True)
+        metadata = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items() if k != b"pandas"}
+        snap = Snapshot(
+            path=path,
+            version=metadata.get("created_at", str(st.st_mtime_ns)),
+            metadata=metadata,
+            table=table,
+            frame=frame,
+        )
+        _mapped[path] = (key, snap)
+        return snap
+
+
+def load_and_publish(
+    *,
+    item_type: int,
+    published_since: str,
+    page_size: int,
+    max_pages: int,
+    directory: str = SNAPSHOT_DIR,
+) -> Path:
+    df = load_articles_frame(
+        item_type=item_type,
+        published_since=published_since,
+        page_size=page_size,
+        max_pages=max_pages,
+    )
+    record_sync(df, item_type=item_type, published_since=published_since, limit=page_size * max_pages)
+    return publish_snapshot(
+        df,
+        snapshot_path(item_type, directory),
+        {"item_type": str(item_type), "published_since": published_since},
+    )
+
+
+def publish_combined(item_types: Sequence[int], directory: str = SNAPSHOT_DIR) -> Optional[Path]:
+    """Publish the snapshots of item_types as one; None if one of them is missing."""
+    snaps = [open_snapshot(snapshot_path(t, directory)) for t in item_types]
+    if any(snap is None for snap in snaps):
+        return None
+    return publish_snapshot(
+        concat_sorted([snap.frame for snap in snaps]),
+        snapshot_path(item_types, directory),
+        {"item_types": ",".join(str(t) for t in sorted(item_types))},
+    )
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Publish shared Arrow snapshots for dashboard workers.")
+    parser.add_argument("--dir", default=SNAPSHOT_DIR, help="snapshot directory (default: $UC01_SNAPSHOT_DIR)")
+    parser.add_argument("--item-type", type=int, action="append", help="3 = dataset, 9 = software (repeatable)")
+    parser.add_argument("--published-since", default=DEFAULT_PUBLISHED_SINCE)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES)
+    parser.add_argument("--interval", type=int, default=0, help="seconds between refreshes; 0 publishes once")
+    args = parser.parse_args(argv)
+
+    if not args.dir:
+        parser.error("set --dir or UC01_SNAPSHOT_DIR")
+
+    item_types = args.item_type or [3]
+    while True:
+        for item_type in item_types:
+            started = time.perf_counter()
+            with priority(BACKGROUND):
+                path = load_and_publish(
+                    item_type=item_type,
+                    published_since=args.published_since,
+                    page_size=args.page_size,
+                    max_pages=args.max_pages,
+                    directory=args.dir,
+                )
+            print(f"published {path} in {time.perf_counter() - started:.1f}s", flush=True)
+        if len(set(item_types)) > 1:
+            started = time.perf_counter()
+            path = publish_combined(item_types, args.dir)
+            print(f"published {path} in {time.perf_counter() - started:.1f}s", flush=True)
+        if args.interval <= 0:
+            break
+        time.sleep(args.interval)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Transformations from raw API JSON to the dashboard's DataFrame."""
+
+from __future__ import annotations
+
+import hashlib
+import zlib
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .validate import validate_frame
+
+
+def build_group_map(groups: List[Dict[str, Any]]) -> Dict[int, str]:
+    """Map group id -> name."""
+    out: Dict[int, str] = {}
+    for g in groups:
+        gid = g.get("id")
+        name = g.get("name")
+        if isinstance(gid, int) and isinstance(name, str):
+            out[gid] = name
+    return out
+
+
+def modified_date(article: Dict[str, Any]) -> Any:
+    """Best available 'last changed' stamp of a listing record."""
+    timeline = article.get("timeline") or {}
+    return (
+        article.get("modified_date")
+        or timeline.get("revision")
+        or timeline.get("posted")
+        or article.get("published_date")
+    )
+
+
+def to_dataframe(
+    articles: List[Dict[str, Any]],
+    group_map: Dict[int, str],
+) -> pd.DataFrame:
+    """Extract minimal columns needed for dashboard, sorted by published_date.
+
+    The data-quality report of uc01/validate.py is kept in df.attrs["validation"].
+    """
+    rows = []
+    for a in articles:
+        gid = a.get("group_id")
+        rows.append(
+            {
+                "id": a.get("id"),
+                "title": a.get("title"),
+                "published_date": a.get("published_date"),
+                "group_id": gid,
+                "group_name": group_map.get(gid, "Unknown"),
+                "doi": a.get("doi"),
+                "uuid": a.get("uuid"),
+                "url": a.get("url"),
+                "modified_date": modified_date(a),
+            }
+        )
+    df = pd.DataFrame(rows)
+    if "published_date" in df.columns:
+        raw_dates = df["published_date"]
+        df["published_date"] = parse_dates(raw_dates)
+        df = finish_frame(df, raw_dates, group_map)
+    return df
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """published_date values as naive UTC datetimes, NaT if missing or unparseable.
+
+    Dates with an offset ("...Z") are converted to UTC and naive ones taken as
+    UTC, so the column is datetime64 whatever a load contained and can be
+    compared with naive bounds (published_between, day_ordinals). Every value
+    is parsed as ISO 8601 on its own; an inferred format would come from the
+    first value and turn dates written differently into NaT.
+    """
+    return pd.to_datetime(values, errors="coerce", utc=True, format="ISO8601").dt.tz_convert(None)
+
+
+def finish_frame(df: pd.DataFrame, raw_dates: pd.Series, group_map: Dict[int, str]) -> pd.DataFrame:
+    """Validate df (dates already parsed from raw_dates) and sort it, as to_dataframe does last."""
+    report = validate_frame(df, raw_dates=raw_dates, known_group_ids=group_map.keys())
+    df = sort_by_published(df)
+    df.attrs["validation"] = report.as_attrs()
+    return df
+
+
+def sort_by_published(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort by published_date with NaT last.
+
+    Sorted dates let date filters use searchsorted instead of a full scan;
+    frames combined with pd.concat must be re-sorted with this.
+    """
+    return df.sort_values("published_date", kind="stable", na_position="last", ignore_index=True)
+
+
+def published_between(df: pd.DataFrame, start: date, end: date) -> pd.DataFrame:
+    """Rows published on start..end (inclusive days).
+
+    df must be sorted by published_date with NaT last, as to_dataframe returns
+    it; row subsets of such a frame stay sorted.
+    """
+    values = df["published_date"].to_numpy()
+    lo = np.datetime64(start, "D").astype(values.dtype)
+    hi = (np.datetime64(end, "D") + 1).astype(values.dtype)
+    left, right = values.searchsorted([lo, hi], side="left")
+    return df.iloc[left:right]
+
+
+def day_ordinals(dates: pd.Series) -> np.ndarray:
+    """Days since 1970-01-01 as int64, NaT dropped."""
+    values = dates.to_numpy()
+    values = values[~np.isnat(values)]
+    return values.astype("datetime64[D]").astype(np.int64)
+
+
+def counts_per_day(dates: pd.Series) -> pd.Series:
+    """Number of items per publication day, indexed by normalized timestamps."""
+    days = day_ordinals(dates)
+    if days.size == 0:
+        return pd.Series([], index=pd.DatetimeIndex([], name="published_day"), dtype=np.int64, name="count")
+    first = days.min()
+    counts = np.bincount(days - first)
+    present = np.flatnonzero(counts)
+    index = pd.DatetimeIndex((present + first).astype("datetime64[D]"), name="published_day")
+    return pd.Series(counts[present], index=index, name="count")
+
+
+# Bucket width in days, finest first.
+RESOLUTIONS = {"day": 1, "week": 7, "month": 30.44, "quarter": 91.31}
+
+
+def pick_resolution(start: date, end: date, max_points: int) -> str:
+    """Finest resolution that shows start..end in at most max_points buckets."""
+    days = (end - start).days + 1
+    for name, width in RESOLUTIONS.items():
+        if days / width <= max_points:
+            return name
+    return "quarter"
+
+
+def bucket_counts(day_counts: pd.Series, resolution: str) -> pd.Series:
+    """Re-bucket counts_per_day output into dense day/week/month/quarter bins.
+
+    Works on the per-day array (at most one entry per day), not on the rows,
+    so the cost does not grow with the number of items. Weeks start on Monday;
+    empty buckets are included as zeros.
+    """
+    name = {"day": "published_day"}.get(resolution, f"published_{resolution}")
+    if day_counts.empty:
+        return pd.Series([], index=pd.DatetimeIndex([], name=name), dtype=np.int64, name="count")
+    days = day_counts.index.to_numpy().astype("datetime64[D]")
+    if resolution == "day":
+        starts = days.astype(np.int64)
+        step = 1
+    elif resolution == "week":
+        ordinals = days.astype(np.int64)
+        starts = ordinals - (ordinals + 3) % 7  # 1970-01-01 was a Thursday
+        step = 7
+    else:
+        starts = days.astype("datetime64[M]").astype(np.int64)
+        step = 1
+        if resolution == "quarter":
+            starts = starts - starts % 3
+            step = 3
+    first = starts.min()
+    sums = np.bincount((starts - first) // step, weights=day_counts.to_numpy()).astype(np.int64)
+    bins = first + step * np.arange(len(sums))
+    unit = "M" if resolution in ("month", "quarter") else "D"
+    index = pd.DatetimeIndex(bins.astype(f"datetime64[{unit}]").astype("datetime64[ns]"), name=name)
+    return pd.Series(sums, index=index, name="count")
+
+
+_BYTE_BASE = 0x9E3779B97F4A7C15  # odd, so invertible modulo 2**64
+_BYTE_BASE_INV = pow(_BYTE_BASE, -1, 2**64)
+
+
+def _mix(h: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: spreads every input bit over the whole word."""
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return h ^ (h >> np.uint64(31))
+
+
+_HASH_CHUNK = 1 << 16  # bytes of string data hashed per step; the power tables stay in cache
+_byte_powers = (np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.uint64))
+
+
+def _power_tables(size: int) -> tuple:
+    """(B**(i+1), B**-i) for i < size, modulo 2**64; grown on demand and shared."""
+    global _byte_powers
+    if _byte_powers[0].size < size:
+        size = max(size, _HASH_CHUNK)
+        up = np.full(size, _BYTE_BASE, dtype=np.uint64)
+        down = np.full(size, _BYTE_BASE_INV, dtype=np.uint64)
+        down[0] = 1
+        _byte_powers = (np.cumprod(up, out=up), np.cumprod(down, out=down))
+    return _byte_powers
+
+
+def _arrow_string_hashes(values: pd.Series) -> Optional[np.ndarray]:
+    """Per-row hashes of an Arrow-backed string column computed on its buffers, else None.
+
+    A row's hash is its bytes as a polynomial in an odd base, sum(b[j] * B**(j+1))
+    modulo 2**64, plus its length (nulls hash apart from ""). Rows are summed
+    a chunk of the data buffer at a time against one table of powers and
+    shifted back by B**-start, which is far faster than hashing one Python
+    str per cell.
+    """
+    if not hasattr(values.array, "__arrow_array__"):
+        return None
+    arr = pa.array(values.array)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return None
+    offset_type = np.int64 if pa.types.is_large_string(arr.type) else np.int32
+    offsets = np.frombuffer(arr.buffers()[1], dtype=offset_type)[arr.offset : arr.offset + len(arr) + 1].astype(np.int64)
+    lengths = np.diff(offsets)
+    sums = np.zeros(len(arr), dtype=np.uint64)
+    if lengths.any():
+        data = np.frombuffer(arr.buffers()[2], dtype=np.uint8)
+        row = 0
+        while row < len(arr):
+            # Rows whose bytes fit in one chunk (at least one row, however long).
+            end = max(int(np.searchsorted(offsets, offsets[row] + _HASH_CHUNK, side="right")) - 1, row + 1)
+            end = min(end, len(arr))
+            first, span = offsets[row], offsets[end] - offsets[row]
+            if span:
+                up, down = _power_tables(span)
+                starts = offsets[row:end] - first
+                nonempty = lengths[row:end] > 0
+                weighted = up[:span] * data[first : first + span]
+                sums[row:end][nonempty] = np.add.reduceat(weighted, starts[nonempty]) * down[starts[nonempty]]
+            row = end
+    sums += lengths.astype(np.uint64) * np.uint64(0xC2B2AE3D27D4EB4F)
+    if arr.null_count:
+        sums[np.asarray(arr.is_null())] = np.uint64(0x5A17)
+    return _mix(sums)
+
+
+def _column_hashes(values: pd.Series) -> np.ndarray:
+    """Per-row hashes of one column, by value rather than dtype.
+
+    A column's dtype depends on what a load happened to contain (an integer
+    column with one missing value is float64, a page of missing DOIs is
+    object), so numbers are hashed as float64, datetimes as nanoseconds and
+    object columns of strings as Arrow strings.
+    """
+    if pd.api.types.is_object_dtype(values.dtype) and pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty"):
+        values = values.astype("str")
+    hashes = _arrow_string_hashes(values)
+    if hashes is not None:
+        return hashes
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return pd.util.hash_array(values.to_numpy(dtype=np.float64, na_value=np.nan))
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        if getattr(values.dt, "tz", None) is not None:
+            values = values.dt.tz_convert(None)
+        return pd.util.hash_array(values.to_numpy(dtype="datetime64[ns]").view(np.int64))
+    return pd.util.hash_pandas_object(values, index=False).to_numpy()
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """A 64-bit content hash per row (uint64), equal for rows with equal values."""
+    h = np.zeros(len(df), dtype=np.uint64)
+    for column in df.columns:
+        h = _mix(h * np.uint64(0x100000001B3) ^ _column_hashes(df[column]))
+    return h
+
+
+def _version_key(df: pd.DataFrame) -> str:
+    """Cheap fingerprint (row count, column names, ids in order) of the frame a version memo belongs to."""
+    h = 0
+    if "id" in df.columns:
+        ids = df["id"]
+        if not pd.api.types.is_integer_dtype(ids):
+            ids = pd.to_numeric(ids, errors="coerce").astype(np.float64)
+        words = ids.to_numpy(na_value=0).astype(np.int64, copy=False).view(np.uint64)
+        # Sum of id * (2 * position + 1), wrapping: order-sensitive and a single vectorized pass.
+        with np.errstate(over="ignore"):
+            h = int((words * np.arange(1, 2 * words.size, 2, dtype=np.uint64)).sum(dtype=np.uint64))
+    return f"{len(df)}:{zlib.crc32(repr(list(df.columns)).encode()):08x}:{h:016x}"
+
+
+def dataset_version(df: pd.DataFrame, hashes: Optional[np.ndarray] = None) -> str:
+    """Content hash identifying df, memoized in df.attrs; pass row_hashes(df) if already computed.
+
+    attrs survive st.cache_data pickling but also propagate to derived frames
+    (row subsets, reordered rows, added columns), so the memo is only used
+    while the frame still has the ids and columns it was computed for.
+    """
+    key = _version_key(df)
+    if df.attrs.get("version_key") == key and "version" in df.attrs:
+        return df.attrs["version"]
+    version = f"{len(df)}:{hashlib.blake2b((row_hashes(df) if hashes is None else hashes).tobytes(), digest_size=12).hexdigest()}"
+    df.attrs["version"] = version
+    df.attrs["version_key"] = key
+    return version
@@ -0,0 +1,181 @@
+"""Data-quality checks on the articles frame, run as whole-column operations.
+
+to_dataframe is deliberately forgiving: unknown groups become "Unknown", bad
+dates become NaT and duplicate records from overlapping offset pages are kept.
+validate_frame counts what that hid, so it shows up in Diagnostics instead of
+silently skewing the counts. Every check is one vectorized pass over a column
+(duplicated / isna / isin), which keeps the stage to a few percent of ingest
+time (benchmarks/bench_validate.py).
+
+to_dataframe stores the report as a plain dict in df.attrs["validation"],
+next to the dataset version, so it survives st.cache_data pickling (and
+Streamlit can still serialize the frame's attrs).
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+CHECKS = {
+    "duplicate_ids": "id seen before in the same load (overlapping pages)",
+    "duplicate_uuids": "uuid seen before in the same load",
+    "missing_dates": "no published_date",
+    "unparseable_dates": "published_date present but not a date",
+    "unknown_groups": "group_id not in the groups list (shown as Unknown)",
+    "non_int_group_ids": "group_id present but not an integer",
+    "missing_dois": "no DOI",
+}
+MAX_EXAMPLES = 5
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    rows: int
+    counts: Dict[str, Optional[int]]  # None: check could not run (e.g. raw dates gone)
+    examples: Dict[str, List[Any]] = field(default_factory=dict)  # a few offending ids per check
+
+    @property
+    def issues(self) -> int:
+        return sum(c for c in self.counts.values() if c)
+
+    def as_attrs(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def as_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "check": list(CHECKS),
+                "rows": [self.counts.get(name) for name in CHECKS],
+                "meaning": list(CHECKS.values()),
+                "example ids": [", ".join(map(str, self.examples.get(name, []))) for name in CHECKS],
+            }
+        )
+
+
+def _fixed_width_keys(values: pd.Series) -> Optional[np.ndarray]:
+    """64-bit keys for Arrow-backed strings that all have one length (uuids), else None.
+
+    Keys of equal strings are equal; different strings collide only rarely,
+    so key duplicates are candidates to confirm, not a verdict.
+    """
+    if not hasattr(values.array, "__arrow_array__") or values.hasnans or values.empty:
+        return None
+    arr = pa.array(values.array)
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+    offset_type = np.int64 if pa.types.is_large_string(arr.type) else np.int32
+    offsets = np.frombuffer(arr.buffers()[1], dtype=offset_type)[arr.offset : arr.offset + len(arr) + 1]
+    widths = np.diff(offsets)
+    width = int(widths[0])
+    if width == 0 or (widths != width).any():
+        return None
+    data = np.frombuffer(arr.buffers()[2], dtype=np.uint8)[offsets[0] : offsets[-1]].reshape(-1, width)
+    words = -(-width // 8)
+    padded = np.zeros((len(data), words * 8), dtype=np.uint8)
+    padded[:, :width] = data
+    columns = padded.view(np.uint64)
+    keys = columns[:, 0].copy()
+    for j in range(1, words):
+        keys = keys * np.uint64(0x100000001B3) ^ columns[:, j]
+    return keys
+
+
+def _duplicated(values: pd.Series) -> np.ndarray:
+    """True for every repeat of an earlier non-null value."""
+    keys = _fixed_width_keys(values)
+    if keys is None:
+        return (values.notna() & values.duplicated()).to_numpy()
+    # Hash the fixed-width bytes in numpy; only rows whose key repeats are compared exactly.
+    candidates = pd.Series(keys).duplicated(keep=False).to_numpy()
+    out = np.zeros(len(values), dtype=bool)
+    if candidates.any():
+        out[candidates] = values[candidates].duplicated().to_numpy()
+    return out
+
+
+def _flag(name: str, mask: np.ndarray, ids: np.ndarray, counts: Dict, examples: Dict) -> None:
+    counts[name] = int(mask.sum())
+    if counts[name]:
+        examples[name] = ids[mask][:MAX_EXAMPLES].tolist()
+
+
+def validate_frame(
+    df: pd.DataFrame,
+    *,
+    raw_dates: Optional[pd.Series] = None,
+    known_group_ids: Optional[Iterable[int]] = None,
+) -> ValidationReport:
+    """Run all checks on df.
+
+    raw_dates are the published_date values before parsing; without them
+    unparseable dates cannot be told from missing ones. Without
+    known_group_ids, rows labelled "Unknown" count as unknown groups.
+    """
+    counts: Dict[str, Optional[int]] = {}
+    examples: Dict[str, List[Any]] = {}
+    if df.empty:
+        return ValidationReport(rows=0, counts={name: 0 for name in CHECKS})
+    ids = df["id"].to_numpy()
+
+    _flag("duplicate_ids", _duplicated(df["id"]), ids, counts, examples)
+    _flag("duplicate_uuids", _duplicated(df["uuid"]), ids, counts, examples)
+
+    parsed_missing = df["published_date"].isna().to_numpy()
+    if raw_dates is not None:
+        raw_missing = (raw_dates.isna() | raw_dates.eq("")).to_numpy()
+        _flag("missing_dates", raw_missing, ids, counts, examples)
+        _flag("unparseable_dates", parsed_missing & ~raw_missing, ids, counts, examples)
+    else:
+        _flag("missing_dates", parsed_missing, ids, counts, examples)
+        counts["unparseable_dates"] = None
+
+    group_ids = df["group_id"]
+    present = group_ids.notna().to_numpy()
+    if pd.api.types.is_integer_dtype(group_ids):
+        non_int = np.zeros(len(df), dtype=bool)
+    elif pd.api.types.is_float_dtype(group_ids):  # ints with gaps are stored as float
+        non_int = present & (group_ids % 1 != 0).to_numpy()
+    else:  # mixed: strings like "28585" are not ids to build_group_map either
+        values = group_ids.to_numpy()
+        non_int = present & ~np.fromiter((type(v) is int for v in values), dtype=bool, count=len(values))
+    _flag("non_int_group_ids", non_int, ids, counts, examples)
+    if known_group_ids is not None:
+        unknown = present & ~non_int & ~group_ids.isin(list(known_group_ids)).to_numpy()
+    else:
+        unknown = present & ~non_int & (df["group_name"] == "Unknown").to_numpy()
+    _flag("unknown_groups", unknown, ids, counts, examples)
+
+    dois = df["doi"]
+    _flag("missing_dois", (dois.isna() | dois.eq("")).to_numpy(), ids, counts, examples)
+
+    return ValidationReport(rows=len(df), counts=counts, examples=examples)
+
+
+def merge_reports(reports: List[ValidationReport]) -> ValidationReport:
+    """One report for frames loaded separately (duplicates across them are not counted)."""
+    counts: Dict[str, Optional[int]] = {}
+    examples: Dict[str, List[Any]] = {}
+    for name in CHECKS:
+        values = [r.counts.get(name) for r in reports]
+        counts[name] = None if any(v is None for v in values) else sum(values)
+        examples[name] = [x for r in reports for x in r.examples.get(name, [])][:MAX_EXAMPLES]
+    return ValidationReport(
+        rows=sum(r.rows for r in reports),
+        counts=counts,
+        examples={k: v for k, v in examples.items() if v},
+    )
+
+
+def frame_report(df: pd.DataFrame) -> ValidationReport:
+    """The report attached by to_dataframe, or a fresh one (e.g. for snapshots)."""
+    stored = df.attrs.get("validation")
+    if isinstance(stored, dict) and stored.get("rows") == len(df):
+        return ValidationReport(**stored)
+    report = validate_frame(df)
+    df.attrs["validation"] = report.as_attrs()
+    return report
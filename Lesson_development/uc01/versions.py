@@ -0,0 +1,183 @@
+"""Versioned snapshots of loaded datasets and cheap diffs between them.
+
+Each load the dashboard sees is recorded as a VersionIndex: its dataset
+version, when it was first seen, its article ids (sorted, unique) and a
+64-bit content hash per id (transform.row_hashes). Two versions are diffed
+in numpy: one searchsorted of the old ids into the new ones, then a compare
+of the matched hashes, so a diff costs tens of milliseconds per million rows
+however wide the rows are, and nothing when the versions are equal. When the
+id sets are equal (the usual refresh) only the hashes are compared. A diff
+is still linear in the number of ids, not in the number of changes: the
+listing API has no change feed to make it cheaper.
+
+Versions are kept per lineage, the source and query that produced them
+(e.g. "api:3:2025-01-01"), the last MAX_VERSIONS in memory. With
+UC01_VERSIONS_DIR they are also written as small Parquet files (ids and
+hashes only), so "new since last refresh" survives a restart:
+
+    <dir>/<lineage>/<first seen, UTC>_<version>.parquet
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .config import VERSIONS_DIR
+from .transform import dataset_version, row_hashes
+
+MAX_VERSIONS = 16
+
+
+@dataclass(frozen=True)
+class VersionIndex:
+    version: str
+    created_at: str
+    ids: np.ndarray  # int64, sorted, unique
+    hashes: np.ndarray  # uint64 content hash of each id's row
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, created_at: Optional[str] = None) -> "VersionIndex":
+        """Index of df's rows by id; rows without an integer id are left out, repeats keep the first."""
+        ids = pd.to_numeric(df["id"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(ids)
+        all_hashes = row_hashes(df)
+        ids, hashes = ids[valid].astype(np.int64), all_hashes[valid]
+        ids, first = np.unique(ids, return_index=True)
+        return cls(
+            version=dataset_version(df, all_hashes),
+            created_at=created_at or datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            ids=ids,
+            hashes=hashes[first],
+        )
+
+    @property
+    def nbytes(self) -> int:
+        return self.ids.nbytes + self.hashes.nbytes
+
+
+@dataclass(frozen=True)
+class VersionDiff:
+    old: VersionIndex
+    new: VersionIndex
+    added: np.ndarray  # ids only in new
+    removed: np.ndarray  # ids only in old
+    changed: np.ndarray  # ids in both whose row content differs
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "from": self.old.created_at,
+            "to": self.new.created_at,
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed": len(self.changed),
+        }
+
+
+def diff(old: VersionIndex, new: VersionIndex) -> VersionDiff:
+    """Ids added, removed and changed from old to new."""
+    empty = np.empty(0, dtype=np.int64)
+    if old.version == new.version:
+        return VersionDiff(old, new, empty, empty, empty)
+    if old.ids.size == new.ids.size and np.array_equal(old.ids, new.ids):
+        # Same ids (most refreshes): no searchsorted, one compare of the hashes.
+        return VersionDiff(old, new, empty, empty, changed=new.ids[old.hashes != new.hashes])
+    pos = np.searchsorted(new.ids, old.ids)
+    found = pos < new.ids.size
+    found[found] = new.ids[pos[found]] == old.ids[found]
+    in_old = np.zeros(new.ids.size, dtype=bool)
+    in_old[pos[found]] = True
+    return VersionDiff(
+        old,
+        new,
+        added=new.ids[~in_old],
+        removed=old.ids[~found],
+        changed=old.ids[found][old.hashes[found] != new.hashes[pos[found]]],
+    )
+
+
+def delta_frame(df: pd.DataFrame, changes: VersionDiff) -> pd.DataFrame:
+    """Rows of df added or changed, then one id-only row per removed id, with a "change" column."""
+    ids = pd.to_numeric(df["id"], errors="coerce")
+    added, changed = ids.isin(changes.added).to_numpy(), ids.isin(changes.changed).to_numpy()
+    rows = df[added | changed].drop(columns=["group_id"], errors="ignore")
+    rows.insert(0, "change", np.where(added[added | changed], "added", "changed"))
+    removed = pd.DataFrame({"change": "removed", "id": changes.removed})
+    return pd.concat([rows, removed], ignore_index=True)
+
+
+def _slug(lineage: str) -> str:
+    return re.sub(r"[^A-Za-z0-9.-]+", "_", lineage)
+
+
+class VersionStore:
+    def __init__(self, directory: str = VERSIONS_DIR, max_versions: int = MAX_VERSIONS) -> None:
+        self.directory = Path(directory) if directory else None
+        self.max_versions = max_versions
+        self._lock = threading.Lock()
+        self._history: Dict[str, List[VersionIndex]] = {}
+
+    def _load(self, lineage: str) -> List[VersionIndex]:
+        if self.directory is None:
+            return []
+        out = []
+        for path in sorted((self.directory / _slug(lineage)).glob("*.parquet"))[-self.max_versions :]:
+            table = pq.read_table(path)
+            meta = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+            out.append(
+                VersionIndex(
+                    version=meta["version"],
+                    created_at=meta["created_at"],
+                    ids=table.column("id").to_numpy(),
+                    hashes=table.column("hash").to_numpy(),
+                )
+            )
+        return out
+
+    def _save(self, lineage: str, index: VersionIndex) -> None:
+        stamp = index.created_at.replace(":", "").replace("-", "").replace("+0000", "Z")
+        path = self.directory / _slug(lineage) / f"{stamp}_{index.version.split(':')[-1]}.parquet"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.table({"id": index.ids, "hash": index.hashes}).replace_schema_metadata(
+            {"version": index.version, "created_at": index.created_at}
+        )
+        pq.write_table(table, path)
+
+    def history(self, lineage: str) -> List[VersionIndex]:
+        with self._lock:
+            if lineage not in self._history:
+                self._history[lineage] = self._load(lineage)
+            return list(self._history[lineage])
+
+    def record(self, lineage: str, df: pd.DataFrame) -> VersionIndex:
+        """The version of df in lineage, recorded as a new version if it differs from the latest."""
+        history = self.history(lineage)
+        if history and history[-1].version == dataset_version(df):
+            return history[-1]
+        index = VersionIndex.from_frame(df)
+        with self._lock:
+            versions = self._history.setdefault(lineage, [])
+            if versions and versions[-1].version == index.version:  # recorded meanwhile
+                return versions[-1]
+            versions.append(index)
+            del versions[: -self.max_versions]
+        if self.directory is not None:
+            self._save(lineage, index)
+        return index
+
+    def since_previous(self, lineage: str) -> Optional[VersionDiff]:
+        """Changes from the version before the latest one to the latest, if there are two."""
+        history = self.history(lineage)
+        return diff(history[-2], history[-1]) if len(history) >= 2 else None
+
+
+VERSIONS = VersionStore()
@@ -0,0 +1,171 @@
+"""Process-wide cache of filtered views shared by all dashboard sessions.
+
+A view is the set of row positions that survive the sidebar filters plus the
+aggregates plotted from them. It is keyed by dataset version and normalized
+filter state, so two sessions looking at the same dataset with the same
+group / date range / keyword (most often the default "All" view) compute it
+once.
+
+Views are computed in two memoized stages: group + date range first, then the
+keyword on top of that subset. The first stage is simply the cached view of
+the same state without a keyword, so editing the keyword reuses it instead of
+re-running the group and date filters.
+
+With a fuzzy threshold set, the keyword is matched with the trigram index of
+uc01/fuzzy.py and the view is ranked by similarity. Entries are evicted
+least-recently-used once their total size exceeds UC01_VIEW_CACHE_MB.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import VIEW_CACHE_MB
+from .fuzzy import column_index
+from .ingest import DatasetSummary
+from .transform import counts_per_day, dataset_version, published_between
+
+
+class FilterState(NamedTuple):
+    group: Optional[str]
+    start: Optional[date]
+    end: Optional[date]
+    keyword: str
+    fuzzy: float = 0.0  # similarity threshold; 0 = substring match
+
+    @classmethod
+    def normalize(
+        cls,
+        group: str,
+        start: Optional[date],
+        end: Optional[date],
+        keyword: str,
+        fuzzy: float = 0.0,
+    ) -> "FilterState":
+        """Equivalent widget values map to the same state ("All" -> None, keyword casefolded)."""
+        has_range = bool(start and end)
+        return cls(
+            group=None if group == "All" else group,
+            start=start if has_range else None,
+            end=end if has_range else None,
+            keyword=keyword.strip().casefold(),
+            fuzzy=round(float(fuzzy), 2) if keyword.strip() else 0.0,
+        )
+
+
+@dataclass(frozen=True)
+class View:
+    positions: np.ndarray
+    group_counts: pd.Series
+    day_counts: pd.Series
+    scores: Optional[np.ndarray] = None  # fuzzy similarity per position
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.positions.nbytes
+            + (self.scores.nbytes if self.scores is not None else 0)
+            + int(self.group_counts.memory_usage(deep=True))
+            + int(self.day_counts.memory_usage(deep=True))
+        )
+
+
+def compute_view(df: pd.DataFrame, state: FilterState, base: Optional[View] = None) -> View:
+    """Apply the dashboard filter chain to df (RangeIndex, sorted by date).
+
+    base, if given, is the view of the same group and date range without a
+    keyword; only the keyword is then applied.
+    """
+    if base is not None:
+        view = df.iloc[base.positions]
+    else:
+        view = df
+        if state.group is not None:
+            view = view[view["group_name"] == state.group]
+        if state.start and state.end and view["published_date"].notna().any():
+            view = published_between(view, state.start, state.end)
+    scores = None
+    if state.keyword and state.fuzzy:
+        rows, similarity = column_index(df, "title").search(state.keyword, state.fuzzy)
+        keep = np.isin(rows, view.index.to_numpy())
+        view, scores = df.iloc[rows[keep]], similarity[keep]
+    elif state.keyword:
+        view = view[view["title"].fillna("").str.contains(state.keyword, case=False, na=False)]
+
+    group_counts = view["group_name"].fillna("Unknown").value_counts().rename_axis("group_name").rename("count")
+    return View(
+        positions=view.index.to_numpy(dtype=np.int64),
+        group_counts=group_counts,
+        day_counts=counts_per_day(view["published_date"]),
+        scores=scores,
+    )
+
+
+_summaries_lock = threading.Lock()
+_summaries: "OrderedDict[str, DatasetSummary]" = OrderedDict()
+
+
+def frame_summary(df: pd.DataFrame) -> DatasetSummary:
+    """Group names and date bounds for the sidebar, computed once per dataset version."""
+    key = dataset_version(df)
+    with _summaries_lock:
+        if key in _summaries:
+            _summaries.move_to_end(key)
+            return _summaries[key]
+    dates = df["published_date"].dropna()
+    summary = DatasetSummary(
+        rows=len(df),
+        group_names=sorted(g for g in df["group_name"].dropna().unique().tolist() if isinstance(g, str)),
+        min_date=dates.min().date() if not dates.empty else None,
+        max_date=dates.max().date() if not dates.empty else None,
+    )
+    with _summaries_lock:
+        _summaries[key] = summary
+        while len(_summaries) > 8:
+            _summaries.popitem(last=False)
+    return summary
+
+
+class ViewCache:
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, FilterState], View]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, df: pd.DataFrame, state: FilterState) -> View:
+        key = (dataset_version(df), state)
+        with self._lock:
+            view = self._entries.get(key)
+            if view is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return view
+            self.misses += 1
+
+        base = self.get(df, state._replace(keyword="", fuzzy=0.0)) if state.keyword else None
+        view = compute_view(df, state, base)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = view
+                self._bytes += view.nbytes
+                while self._bytes > self.max_bytes and len(self._entries) > 1:
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes -= evicted.nbytes
+        return view
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+VIEWS = ViewCache(max_bytes=VIEW_CACHE_MB * 1024 * 1024)
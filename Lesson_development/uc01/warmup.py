@@ -0,0 +1,214 @@
+"""Warm start for the dashboard: load everything before the first visitor.
+
+`streamlit run lesson_complex_code.py` imports the heavy libraries and loads
+the data only when the first session runs the script, so that visitor waits
+for imports, the groups fetch and the articles fetch. This entry point does
+that work in the server process first and then starts Streamlit in the same
+process, so the app finds the modules imported and the process-wide caches
+(snapshot mapping, combined frame, sidebar summary, default filtered view,
+fuzzy title index) already filled:
+
+    python -m uc01.warmup                       # then serves lesson_complex_code.py
+    python -m uc01.warmup -- --server.port 8502 # arguments after -- go to streamlit
+
+A frame fetched from the API here is handed to the app's cached loader once
+(take_preloaded), so the first visitor does not download it again. "ready in
+... s" is printed just before the server starts; the same report is shown in
+the dashboard's Diagnostics. benchmarks/bench_startup.py measures
+time-to-first-render with and without the warm-up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+
+from .config import DATASET_DIR, DEFAULT_MAX_PAGES, DEFAULT_PAGE_SIZE, DEFAULT_PUBLISHED_SINCE, SNAPSHOT_DIR
+
+APP = Path(__file__).resolve().parents[1] / "lesson_complex_code.py"
+
+# What the app imports on its first run, roughly slowest first.
+HEAVY_MODULES = (
+    "streamlit",
+    "altair",
+    "pandas",
+    "pyarrow",
+    "pyarrow.compute",
+    "pyarrow.dataset",
+    "pyarrow.parquet",
+    "httpx",
+    "requests",
+    "dotenv",
+    "uc01.enrich",
+    "uc01.fuzzy",
+    "uc01.history",
+    "uc01.ingest",
+    "uc01.pipeline",
+    "uc01.query_cache",
+    "uc01.snapshot",
+    "uc01.view_cache",
+)
+
+
+@dataclass
+class Readiness:
+    source: str = ""
+    rows: int = 0
+    imports_s: float = 0.0
+    data_s: float = 0.0
+    indexes_s: float = 0.0
+    total_s: float = 0.0
+    slowest_imports: Dict[str, float] = field(default_factory=dict)
+
+
+_lock = threading.Lock()
+_status: Optional[Readiness] = None
+_preloaded: Dict[Tuple[int, str, int], pd.DataFrame] = {}
+
+
+def status() -> Optional[Dict[str, Any]]:
+    """The last warm-up report, or None if this process was not warmed up."""
+    with _lock:
+        return asdict(_status) if _status is not None else None
+
+
+def take_preloaded(*, item_type: int, published_since: str, limit: int) -> Optional[pd.DataFrame]:
+    """Hand a frame fetched during warm-up to the caller, once (canonical query, see uc01/query_cache.py)."""
+    with _lock:
+        return _preloaded.pop((item_type, published_since, limit), None)
+
+
+def _import_all() -> Dict[str, float]:
+    seconds = {}
+    for name in HEAVY_MODULES:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        seconds[name] = time.perf_counter() - started
+    return seconds
+
+
+def _load(
+    item_types: Sequence[int], published_since: str, page_size: int, max_pages: int
+) -> Tuple[str, Optional[pd.DataFrame]]:
+    """Same source order as the dashboard: Parquet dataset, snapshots, API."""
+    from .client import get_groups
+    from .ingest import dataset_summary, has_dataset, query_dataset
+    from .pipeline import combine_frames, load_articles_frame
+    from .query_cache import LISTINGS, canonical_since
+    from .snapshot import open_snapshot, snapshot_path
+    from .transform import build_group_map
+
+    if DATASET_DIR and has_dataset(item_types):
+        summary = dataset_summary(item_types)
+        query_dataset(item_types, start=summary.min_date, end=summary.max_date)  # the default view
+        return "dataset", None
+    snapshot = open_snapshot(snapshot_path(item_types)) if SNAPSHOT_DIR else None
+    if snapshot is not None:
+        return "snapshot", snapshot.frame
+
+    group_map = build_group_map(get_groups())
+    published_since = canonical_since(published_since)
+    frames = []
+    for item_type in item_types:
+        frame = load_articles_frame(
+            item_type=item_type,
+            published_since=published_since,
+            page_size=page_size,
+            max_pages=max_pages,
+            group_map=group_map,
+            cache=LISTINGS,
+        )
+        with _lock:
+            _preloaded[(item_type, published_since, page_size * max_pages)] = frame
+        frames.append(frame)
+    return "api", combine_frames(frames)
+
+
+def _build_indexes(df: pd.DataFrame) -> None:
+    from .fuzzy import column_index
+    from .view_cache import VIEWS, FilterState, frame_summary
+
+    summary = frame_summary(df)
+    VIEWS.get(df, FilterState.normalize("All", summary.min_date, summary.max_date, ""))
+    column_index(df, "title")
+
+
+def warm_up(
+    *,
+    item_types: Sequence[int] = (3,),
+    published_since: str = DEFAULT_PUBLISHED_SINCE,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_pages: int = DEFAULT_MAX_PAGES,
+) -> Readiness:
+    """Import, load and index what the default dashboard view needs."""
+    global _status
+    report = Readiness()
+    started = time.perf_counter()
+
+    imports = _import_all()
+    report.imports_s = time.perf_counter() - started
+    report.slowest_imports = {k: round(v, 3) for k, v in sorted(imports.items(), key=lambda kv: -kv[1])[:5]}
+
+    mark = time.perf_counter()
+    report.source, df = _load(item_types, published_since, page_size, max_pages)
+    report.data_s = time.perf_counter() - mark
+
+    mark = time.perf_counter()
+    if df is not None:
+        report.rows = len(df)
+        _build_indexes(df)
+    report.indexes_s = time.perf_counter() - mark
+    report.total_s = time.perf_counter() - started
+
+    with _lock:
+        _status = report
+    return report
+
+
+def main(argv: Optional[list] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    ours, streamlit_args = (argv[: argv.index("--")], argv[argv.index("--") + 1 :]) if "--" in argv else (argv, [])
+
+    parser = argparse.ArgumentParser(description="Warm up, then serve the 4TU monitoring dashboard.")
+    parser.add_argument("--item-type", type=int, action="append", help="item types of the default view (default: 3)")
+    parser.add_argument("--published-since", default=DEFAULT_PUBLISHED_SINCE)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES)
+    parser.add_argument("--no-serve", action="store_true", help="only warm up and print the report")
+    args = parser.parse_args(ours)
+
+    report = warm_up(
+        item_types=tuple(args.item_type or [3]),
+        published_since=args.published_since,
+        page_size=args.page_size,
+        max_pages=args.max_pages,
+    )
+    print(
+        f"ready in {report.total_s:.2f}s (imports {report.imports_s:.2f}s, {report.source} data "
+        f"{report.data_s:.2f}s, indexes {report.indexes_s:.2f}s, {report.rows} rows)",
+        flush=True,
+    )
+    if args.no_serve:
+        return
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", str(APP), *streamlit_args]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    # Run the copy imported as uc01.warmup, which is the one the app imports;
+    # state kept in this __main__ module would be invisible to it.
+    importlib.import_module("uc01.warmup").main()